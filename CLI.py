@@ -55,7 +55,7 @@ if not hostname or not access_code or not serial_number:
 config = BambuConfig(hostname=hostname, access_code=access_code, serial_number=serial_number)
 printer = BambuPrinter(config=config)
 
-printer.on_update = on_update
+printer.subscribe(on_update, max_frequency=2)
 printer.start_session()
 
 def confirm(request):
@@ -0,0 +1,444 @@
+"""
+`bambu3mf` contains `Bambu3mfInspector` which extracts plate, object, time, and filament
+metadata from Bambu Studio / Orca Slicer `.3mf` files without loading the whole archive, and
+slims them down to a single plate before they are uploaded to a printer.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+import logging
+
+from dataclasses import dataclass, asdict
+from typing import Optional
+from xml.etree import ElementTree
+
+logger = logging.getLogger("bambuprinter")
+
+CACHE_VERSION = 1
+SLICE_INFO = "Metadata/slice_info.config"
+PLATE_JSON = re.compile(r"^Metadata/plate_(\d+)\.json$")
+PLATE_THUMBNAIL = re.compile(r"^Metadata/plate_(\d+)(_small)?\.png$")
+PLATE_GCODE = re.compile(r"^Metadata/plate_(\d+)\.gcode$")
+PLATE_MEMBER = re.compile(r"^Metadata/(?:plate|top|pick|plate_no_light)_(\d+)(?:_small)?\.(?:png|json|gcode|gcode\.md5)$")
+OPTIONAL_MEMBERS = re.compile(r"^(?:Auxiliaries/.*|Metadata/(?:top|plate_no_light)_\d+\.png|Metadata/plate_\d+_small\.png)$")
+
+
+@dataclass(frozen=True)
+class Bambu3mfFilament:
+    """
+    A filament used by a plate, as reported by the slicer.
+
+    * id : int - the slicer's (1 based) filament #
+    * type : str - filament type (`PLA`, `PETG`, etc)
+    * color : str - `#RRGGBB` color code
+    * used_m : float - meters of filament the plate uses
+    * used_g : float - grams of filament the plate uses
+    * tray_info_idx : str - the filament's Bambu Studio index
+    """
+    id: int
+    type: str = ""
+    color: str = ""
+    used_m: float = 0.0
+    used_g: float = 0.0
+    tray_info_idx: str = ""
+
+
+@dataclass(frozen=True)
+class Bambu3mfPlate:
+    """
+    A single plate within a `.3mf` file.
+
+    * index : int - the plate # passed to `BambuPrinter.print_3mf_file`
+    * objects : tuple - `(id, name)` of every object on the plate (ids are what `BambuPrinter.skip_objects` expects)
+    * prediction : int - estimated print time in seconds
+    * weight : float - estimated filament weight in grams
+    * filaments : tuple - the `Bambu3mfFilament`s the plate uses
+    * bed_type : str - the build plate the plate was sliced for (`textured_plate`, `cool_plate`, etc)
+    * nozzle_diameter : float - the nozzle diameter the plate was sliced for
+    * printer_model_id : str - the slicer's printer model id (`C11`, `N2S`, etc)
+    * gcode : str - archive member holding the plate's sliced gcode (empty if the plate was not sliced)
+    * thumbnail : str - archive member holding the plate's thumbnail (see `Bambu3mfInspector.thumbnail`)
+    * thumbnail_small : str - archive member holding the plate's small thumbnail
+    """
+    index: int
+    objects: tuple = ()
+    prediction: int = 0
+    weight: float = 0.0
+    filaments: tuple = ()
+    bed_type: str = ""
+    nozzle_diameter: float = 0.0
+    printer_model_id: str = ""
+    gcode: str = ""
+    thumbnail: str = ""
+    thumbnail_small: str = ""
+
+    @property
+    def object_ids(self) -> list:
+        return [id for id, _ in self.objects]
+
+    @property
+    def requirements(self) -> tuple:
+        """
+        The plate's filaments as `(type, color)` tuples, in slicer order, suitable for `BambuJob.filaments`.
+        """
+        return tuple((filament.type, filament.color) for filament in self.filaments)
+
+
+@dataclass(frozen=True)
+class Bambu3mfInfo:
+    """
+    Everything `Bambu3mfInspector` extracted from a `.3mf` file.
+
+    * sha256 : str - hex digest of the file's contents
+    * size : int - file size in bytes
+    * plates : tuple - the file's `Bambu3mfPlate`s ordered by plate #
+    * slicer : str - the slicer client and version that produced the file
+    """
+    sha256: str
+    size: int
+    plates: tuple = ()
+    slicer: str = ""
+
+    def plate(self, index: int) -> Bambu3mfPlate:
+        """
+        Returns the plate with the given (1 based) plate #.
+        """
+        for plate in self.plates:
+            if plate.index == int(index): return plate
+        raise Exception(f"3mf file has no plate [{index}]")
+
+    @property
+    def prediction(self) -> int:
+        return sum(plate.prediction for plate in self.plates)
+
+    @property
+    def weight(self) -> float:
+        return sum(plate.weight for plate in self.plates)
+
+    def toJson(self) -> dict:
+        """
+        Returns a `dict` (json document) of this file's metadata.
+        """
+        return asdict(self)
+
+    @classmethod
+    def fromJson(cls, document: dict) -> "Bambu3mfInfo":
+        """
+        Builds a `Bambu3mfInfo` from a `dict` previously produced by `toJson`.
+        """
+        plates = []
+        for plate in document.get("plates", ()):
+            plate = dict(plate)
+            plate["objects"] = tuple(tuple(obj) for obj in plate.get("objects", ()))
+            plate["filaments"] = tuple(Bambu3mfFilament(**filament) for filament in plate.get("filaments", ()))
+            plates.append(Bambu3mfPlate(**plate))
+        return cls(sha256=document["sha256"], size=document["size"], plates=tuple(plates), slicer=document.get("slicer", ""))
+
+
+@dataclass(frozen=True)
+class Bambu3mfSlim:
+    """
+    The result of `Bambu3mfInspector.slim`.
+
+    * path : str - local path of the slimmed `.3mf` file (upload this instead of the original)
+    * plate : int - the plate # that was kept
+    * sha256 : str - hex digest of the original file's contents
+    * original_size : int - size of the original file in bytes
+    * size : int - size of the slimmed file in bytes
+    * cached : bool - `True` if the slimmed file was already cached
+    """
+    path: str
+    plate: int
+    sha256: str
+    original_size: int
+    size: int
+    cached: bool = False
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(self.original_size - self.size, 0)
+
+    def time_saved(self, rate: float) -> float:
+        """
+        Returns the seconds of transfer time saved at `rate` bytes per second.
+        """
+        return self.bytes_saved / rate if rate > 0 else 0.0
+
+
+class Bambu3mfInspector:
+    """
+    `Bambu3mfInspector` reads the metadata of local `.3mf` files.
+
+    Only the zip central directory and the small metadata members (`Metadata/slice_info.config` and
+    `Metadata/plate_*.json`) are read - plate gcode, models, and thumbnails are never decompressed
+    unless a thumbnail is explicitly requested.  Results are cached by the sha256 of the file's
+    contents, in memory and (optionally) on disk under `cache_dir`, so the same project inspected
+    for any number of printers (or by any number of processes sharing `cache_dir`) is only ever
+    parsed once.  Local files are only re-hashed when their size or modification time changes.
+
+    `slim` rewrites a sliced project so it only carries the one plate a printer is going to print,
+    which usually cuts the size (and upload time) of multi plate projects dramatically.
+
+    Example
+    -------
+    ```py
+    inspector = Bambu3mfInspector("~/.cache/bpm/3mf")
+    info = inspector.inspect("widget.gcode.3mf")
+    plate = info.plate(1)
+    printer.print_3mf_file("/jobs/widget.gcode.3mf", plate.index, PlateType[plate.bed_type.upper()], False)
+    printer.skip_objects(plate.object_ids[1:])
+    ```
+    """
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Sets up all internal storage attributes for `Bambu3mfInspector`.
+
+        Parameters
+        ----------
+        * cache_dir : Optional[str] = None - directory to persist inspected metadata in (memory only when `None`)
+
+        Attributes
+        ----------
+        * _cache : `PRIVATE` dict of `Bambu3mfInfo` keyed by sha256.
+        * _hashes : `PRIVATE` dict of sha256 digests keyed by (path, size, mtime).
+        * _hits : `READ ONLY` Number of inspections served from the cache.
+        * _misses : `READ ONLY` Number of inspections that had to read the archive.
+        """
+        self._cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        if self._cache_dir: os.makedirs(self._cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._hashes = {}
+        self._hits = 0
+        self._misses = 0
+
+    def inspect(self, path: str) -> Bambu3mfInfo:
+        """
+        Returns the `Bambu3mfInfo` for the `.3mf` file at `path`.
+        """
+        digest, size = self.digest(path)
+
+        with self._lock:
+            info = self._cache.get(digest)
+        if info is None:
+            info = self._load(digest)
+        if info is not None:
+            with self._lock:
+                self._cache[digest] = info
+                self._hits += 1
+            return info
+
+        info = _read(path, digest, size)
+        with self._lock:
+            self._cache[digest] = info
+            self._misses += 1
+        self._save(info)
+        logger.debug("inspected 3mf file", extra={"file": path, "sha256": digest, "plates": len(info.plates)})
+        return info
+
+    def thumbnail(self, path: str, plate: int, small: Optional[bool] = False) -> bytes:
+        """
+        Returns the `png` thumbnail of a plate (empty if the file has none).
+        """
+        info = self.inspect(path)
+        member = info.plate(plate).thumbnail_small if small else info.plate(plate).thumbnail
+        if not member: return b""
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(member)
+
+    def slim(self, path: str, plate: int, thumbnails: Optional[bool] = False) -> Bambu3mfSlim:
+        """
+        Returns a copy of a sliced `.3mf` file that only contains what the printer needs to print `plate`.
+
+        The selected plate's gcode, md5, json, and thumbnails used by the printer (`plate_#.png`,
+        `pick_#.png`) are kept along with the project level members (`3D/`, `_rels/`,
+        `Metadata/*.config`, etc).  Every other plate's members are dropped, as are the thumbnails
+        and attachments the firmware never reads (`top_#.png`, `plate_no_light_#.png`,
+        `plate_#_small.png`, `Auxiliaries/`) unless `thumbnails` is `True`, and the other plates are
+        removed from `Metadata/slice_info.config`.  Members are streamed
+        from the original archive to the new one so memory use does not grow with the file.
+
+        Slimmed files are cached by (content hash, plate, thumbnails) under `cache_dir` (or the
+        system temporary directory when there is none).
+
+        Parameters
+        ----------
+        * path : str - the sliced `.3mf` file
+        * plate : int - the plate # to keep
+        * thumbnails : Optional[bool] = False - keep the optional thumbnails and attachments
+        """
+        info = self.inspect(path)
+        if not info.plate(plate).gcode:
+            raise Exception(f"plate [{plate}] of [{path}] has not been sliced")
+
+        directory = self._cache_dir or tempfile.gettempdir()
+        file = os.path.join(directory, f"{info.sha256}-plate_{int(plate)}{'-thumbnails' if thumbnails else ''}.gcode.3mf")
+        if os.path.exists(file):
+            return Bambu3mfSlim(file, int(plate), info.sha256, info.size, os.path.getsize(file), True)
+
+        temp = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with zipfile.ZipFile(path) as source, zipfile.ZipFile(temp, "w") as target:
+                for member in source.infolist():
+                    if not _keep_member(member.filename, int(plate), thumbnails): continue
+                    entry = zipfile.ZipInfo(member.filename, member.date_time)
+                    entry.compress_type = member.compress_type
+                    entry.external_attr = member.external_attr
+                    if member.filename == SLICE_INFO:
+                        target.writestr(entry, _slim_slice_info(source.read(member), int(plate)))
+                        continue
+                    with source.open(member) as src, target.open(entry, "w", force_zip64=member.file_size > 0x7fffffff) as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(temp, file)
+        finally:
+            if os.path.exists(temp): os.remove(temp)
+
+        slim = Bambu3mfSlim(file, int(plate), info.sha256, info.size, os.path.getsize(file), False)
+        logger.debug("slimmed 3mf file", extra={"file": path, "plate": plate, "original_size": slim.original_size, "size": slim.size})
+        return slim
+
+    def digest(self, path: str) -> tuple:
+        """
+        Returns the `(sha256, size)` of a file, re-hashing it only if it changed since it was last seen.
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._hashes.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            with self._lock:
+                self._hashes[key] = digest
+        return digest, stat.st_size
+
+    def _load(self, digest: str) -> Optional[Bambu3mfInfo]:
+        if not self._cache_dir: return None
+        try:
+            with open(os.path.join(self._cache_dir, f"{digest}.json"), "r") as f:
+                document = json.load(f)
+            if document.get("version") != CACHE_VERSION: return None
+            return Bambu3mfInfo.fromJson(document["info"])
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"ignoring unreadable 3mf cache entry [{digest}]")
+            return None
+
+    def _save(self, info: Bambu3mfInfo):
+        if not self._cache_dir: return
+        file = os.path.join(self._cache_dir, f"{info.sha256}.json")
+        temp = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "w") as f:
+            json.dump({"version": CACHE_VERSION, "info": info.toJson()}, f)
+        os.replace(temp, file)
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        return self._cache_dir
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+
+def _keep_member(name: str, plate: int, thumbnails: bool) -> bool:
+    match = PLATE_MEMBER.match(name)
+    if match and int(match.group(1)) != plate: return False
+    return thumbnails or not OPTIONAL_MEMBERS.match(name)
+
+
+def _slim_slice_info(document: bytes, plate: int) -> bytes:
+    # drops the <plate> entries of every other plate so the slimmed file describes itself correctly
+    root = ElementTree.fromstring(document)
+    for element in root.findall("plate"):
+        index = element.find("metadata[@key='index']")
+        if index is not None and int(index.get("value")) != plate:
+            root.remove(element)
+    return ElementTree.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def _read(path: str, digest: str, size: int) -> Bambu3mfInfo:
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise Exception(f"[{path}] is not a valid 3mf file")
+
+    with archive:
+        members = set(archive.namelist())
+        plates = {}
+
+        for member in members:
+            match = PLATE_JSON.match(member) or PLATE_GCODE.match(member)
+            if match: plates.setdefault(int(match.group(1)), {"index": int(match.group(1))})
+
+        slicer = ""
+        if SLICE_INFO in members:
+            with archive.open(SLICE_INFO) as stream:
+                slicer = _parse_slice_info(stream, plates)
+
+        for index, plate in plates.items():
+            if f"Metadata/plate_{index}.json" in members:
+                with archive.open(f"Metadata/plate_{index}.json") as stream:
+                    _parse_plate_json(json.load(stream), plate)
+            if f"Metadata/plate_{index}.gcode" in members: plate["gcode"] = f"Metadata/plate_{index}.gcode"
+            if f"Metadata/plate_{index}.png" in members: plate["thumbnail"] = f"Metadata/plate_{index}.png"
+            if f"Metadata/plate_{index}_small.png" in members: plate["thumbnail_small"] = f"Metadata/plate_{index}_small.png"
+
+    return Bambu3mfInfo(sha256=digest, size=size, slicer=slicer,
+                        plates=tuple(Bambu3mfPlate(**plates[index]) for index in sorted(plates)))
+
+
+def _parse_slice_info(stream, plates: dict) -> str:
+    # slice_info.config is small but is parsed incrementally, one <plate> at a time
+    slicer = {}
+    plate = None
+    for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if element.tag == "plate": plate = {"objects": [], "filaments": []}
+            continue
+        if element.tag == "header_item":
+            slicer[element.get("key")] = element.get("value")
+        elif element.tag == "metadata" and plate is not None:
+            plate[element.get("key")] = element.get("value")
+        elif element.tag == "object" and plate is not None:
+            plate["objects"].append((int(element.get("identify_id")), element.get("name", "")))
+        elif element.tag == "filament" and plate is not None:
+            plate["filaments"].append(Bambu3mfFilament(id=int(element.get("id")),
+                                                       type=element.get("type", ""),
+                                                       color=element.get("color", ""),
+                                                       used_m=float(element.get("used_m") or 0),
+                                                       used_g=float(element.get("used_g") or 0),
+                                                       tray_info_idx=element.get("tray_info_idx", "")))
+        elif element.tag == "plate" and plate is not None:
+            index = int(plate.get("index", 0))
+            target = plates.setdefault(index, {"index": index})
+            target["objects"] = tuple(plate["objects"])
+            target["filaments"] = tuple(plate["filaments"])
+            target["prediction"] = int(float(plate.get("prediction") or 0))
+            target["weight"] = float(plate.get("weight") or 0)
+            target["printer_model_id"] = plate.get("printer_model_id", "")
+            nozzle = (plate.get("nozzle_diameters") or "").split(",")[0]
+            if nozzle: target["nozzle_diameter"] = float(nozzle)
+            plate = None
+        element.clear()
+    return " ".join(value for value in (slicer.get("X-BBL-Client-Type"), slicer.get("X-BBL-Client-Version")) if value)
+
+
+def _parse_plate_json(document: dict, plate: dict):
+    plate["bed_type"] = document.get("bed_type", "")
+    if "nozzle_diameter" in document: plate["nozzle_diameter"] = float(document["nozzle_diameter"])
+    if not plate.get("objects"):
+        plate["objects"] = tuple((int(obj["id"]), obj.get("name", "")) for obj in document.get("bbox_objects", ()) if "id" in obj)
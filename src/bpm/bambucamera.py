@@ -0,0 +1,479 @@
+"""
+`bambucamera` contains `BambuCamera`, a client for the chamber camera of Bambu Lab printers, and
+`BambuCameraReplay`, a local stand-in that replays recorded frames.
+"""
+import os
+import socket
+import ssl
+import struct
+import threading
+import time
+import logging
+
+from typing import Optional
+
+from .bambuconfig import BambuConfig
+from .bambutools import PrinterModel
+
+logger = logging.getLogger("bambuprinter")
+
+CAMERA_PORT = 6000
+RTSP_PORT = 322
+RTSP_MODELS = (PrinterModel.X1C, PrinterModel.X1, PrinterModel.X1E)
+
+FRAME_HEADER_SIZE = 16
+MAX_FRAME_SIZE = 4 * 1024 * 1024
+JPEG_START = b"\xff\xd8"
+JPEG_END = b"\xff\xd9"
+
+
+class BambuCameraFrame:
+    """
+    A single JPEG frame held in one of `BambuCamera`'s pooled buffers.
+
+    `data` is a read only `memoryview` over the pooled buffer (no copy is made).  The buffer is
+    pinned (never reused for a newer frame) until the frame is released, so release frames as soon
+    as you are done with them - ideally by using the frame as a context manager.
+
+    ```py
+    with camera.latest() as frame:
+        image.write(frame.data)
+    ```
+    """
+    __slots__ = ("_camera", "_buffer", "data", "sequence", "timestamp")
+
+    def __init__(self, camera, buffer: "_PooledBuffer", size: int, sequence: int, timestamp: float):
+        self._camera = camera
+        self._buffer = buffer
+        self.data = memoryview(buffer.data)[:size].toreadonly()
+        self.sequence = sequence
+        self.timestamp = timestamp
+
+    def release(self):
+        """
+        Un-pins the frame's buffer.  `data` must not be used afterwards.
+        """
+        if self._buffer is None: return
+        self.data.release()
+        self._camera._unpin(self._buffer)
+        self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def __len__(self):
+        return self.data.nbytes
+
+
+class BambuCamera:
+    """
+    `BambuCamera` receives chamber camera images from a printer on its own thread.
+
+    P1 and A1 series printers stream JPEG images over TLS on port `6000`.  After an 80 byte
+    authentication packet every image arrives as a 16 byte header (payload size, itrack, flags) followed
+    by the JPEG payload.  Payloads are received straight into a small pool of preallocated buffers
+    with `recv_into` and the most recent complete frame is published by reference, so neither the
+    network thread nor the readers copy image data.
+
+    X1 series printers expose their camera as an RTSP stream (`rtsp_url`) instead.  Decoding RTSP is
+    outside the scope of this library, so for those printers supply an `rtsp_reader` - a callable that
+    takes the url and yields JPEG `bytes` (an `ffmpeg` or `opencv` wrapper for example) - and its
+    frames are published through the same pool.
+
+    By default the camera streams continuously.  Setting `interval` switches to snapshot mode: the
+    camera connects, keeps the first complete frame, disconnects, and waits `interval` seconds
+    before the next one, which keeps the cost of a large fleet of cameras on one host low.
+
+    Example
+    -------
+    ```py
+    camera = BambuCamera(config, interval=30)
+    camera.start()
+    frame = camera.wait_for_frame(timeout=10)
+    if frame:
+        with frame:
+            open("chamber.jpg", "wb").write(frame.data)
+    camera.stop()
+    ```
+    """
+    def __init__(self,
+                 config: BambuConfig,
+                 interval: Optional[float] = 0,
+                 buffers: Optional[int] = 3,
+                 buffer_size: Optional[int] = 256 * 1024,
+                 port: Optional[int] = CAMERA_PORT,
+                 rtsp_reader=None,
+                 on_frame=None,
+                 reconnect_delay: Optional[float] = 5):
+        """
+        Sets up all internal storage attributes for `BambuCamera`.
+
+        Parameters
+        ----------
+        * config : BambuConfig - the printer's hostname, access code, and serial # (for the model)
+        * interval : Optional[float] = 0 - seconds between snapshots (`0` streams continuously)
+        * buffers : Optional[int] = 3 - number of pooled frame buffers (at least 2)
+        * buffer_size : Optional[int] = 262144 - initial size of each buffer (buffers grow to fit larger frames)
+        * port : Optional[int] = 6000 - the camera port (override to point at a local stand-in)
+        * rtsp_reader : Optional[callable] = None - `rtsp_reader(url)` yields JPEG `bytes` for X1 series printers
+        * on_frame : Optional[callable] = None - invoked as `on_frame(camera)` from the camera thread for every frame
+        * reconnect_delay : Optional[float] = 5 - seconds to wait before reconnecting after a failure
+
+        Attributes
+        ----------
+        * _pool : `PRIVATE` list of `_PooledBuffer`.
+        * _latest : `PRIVATE` tuple of (buffer, size, sequence, timestamp) for the most recent frame.
+        * _stats : `READ ONLY` counts of frames, dropped frames, bytes received, and connections.
+        """
+        self._config = config
+        self._interval = float(interval) if interval else 0.0
+        self._port = port
+        self._rtsp_reader = rtsp_reader
+        self._on_frame = on_frame
+        self._reconnect_delay = reconnect_delay
+
+        self._pool = [_PooledBuffer(buffer_size) for _ in range(max(int(buffers), 2))]
+        self._header = bytearray(FRAME_HEADER_SIZE)
+        self._scratch = bytearray(64 * 1024)
+        self._condition = threading.Condition()
+        self._latest = None
+        self._sequence = 0
+
+        self._thread = None
+        self._running = False
+        self._socket = None
+        self._stats = {"frames": 0, "dropped": 0, "bytes": 0, "connections": 0, "errors": 0}
+
+    def start(self):
+        """
+        Starts receiving frames on a background thread.
+        """
+        if self._running: return
+        if self._config.printer_model in RTSP_MODELS and self._rtsp_reader is None:
+            raise Exception(f"[{self._config.printer_model.name}] cameras stream over rtsp, an rtsp_reader is required")
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="bambuprinter-camera", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops receiving frames and closes the connection.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        sock = self._socket
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def latest(self) -> Optional[BambuCameraFrame]:
+        """
+        Returns the most recent frame (pinned until released) or `None` if no frame was received yet.
+        """
+        with self._condition:
+            if self._latest is None: return None
+            buffer, size, sequence, timestamp = self._latest
+            buffer.pins += 1
+        return BambuCameraFrame(self, buffer, size, sequence, timestamp)
+
+    def wait_for_frame(self, after: Optional[int] = 0, timeout: Optional[float] = None) -> Optional[BambuCameraFrame]:
+        """
+        Waits for a frame with a `sequence` greater than `after` and returns it (pinned until
+        released), or `None` on timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._sequence > after or not self._running, timeout=timeout):
+                return None
+        frame = self.latest()
+        if frame and frame.sequence <= after:
+            frame.release()
+            return None
+        return frame
+
+    def snapshot(self) -> Optional[bytes]:
+        """
+        Returns a copy of the most recent JPEG image (or `None`).
+        """
+        frame = self.latest()
+        if frame is None: return None
+        with frame:
+            return bytes(frame.data)
+
+    def _run(self):
+        while self._running:
+            try:
+                if self._config.printer_model in RTSP_MODELS:
+                    self._read_rtsp()
+                else:
+                    self._read_stream()
+                if self._interval and self._running:
+                    with self._condition:
+                        self._condition.wait_for(lambda: not self._running, timeout=self._interval)
+            except Exception as e:
+                if not self._running: break
+                self._stats["errors"] += 1
+                logger.warning(f"camera connection to [{self._config.hostname}] failed: [{e}]")
+                with self._condition:
+                    self._condition.wait_for(lambda: not self._running, timeout=self._reconnect_delay)
+
+    def _read_stream(self):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+        raw = socket.create_connection((self._config.hostname, self._port), timeout=30)
+        with context.wrap_socket(raw, server_hostname=self._config.hostname) as sock:
+            self._socket = sock
+            self._stats["connections"] += 1
+            try:
+                sock.sendall(_auth_packet(self._config.mqtt_username, self._config.access_code))
+                while self._running:
+                    self._recv_exactly(sock, memoryview(self._header))
+                    size, itrack, flags, _ = struct.unpack("<IIII", self._header)
+                    if size <= 0 or size > MAX_FRAME_SIZE:
+                        raise Exception(f"invalid camera frame size [{size}]")
+
+                    buffer = self._acquire(size)
+                    if buffer is None:
+                        # every buffer is pinned by a reader, so this frame is drained and dropped
+                        self._drain(sock, size)
+                        self._stats["dropped"] += 1
+                        continue
+                    self._recv_exactly(sock, memoryview(buffer.data)[:size])
+                    if buffer.data[:2] != JPEG_START or buffer.data[size - 2:size] != JPEG_END:
+                        self._stats["dropped"] += 1
+                        continue
+                    self._publish(buffer, size)
+                    if self._interval: break
+            finally:
+                self._socket = None
+
+    def _read_rtsp(self):
+        self._stats["connections"] += 1
+        for image in self._rtsp_reader(self.rtsp_url):
+            if not self._running: break
+            size = len(image)
+            buffer = self._acquire(size)
+            if buffer is None:
+                self._stats["dropped"] += 1
+                continue
+            buffer.data[:size] = image
+            self._publish(buffer, size)
+            if self._interval: break
+
+    def _recv_exactly(self, sock, view: memoryview):
+        received = 0
+        while received < len(view):
+            count = sock.recv_into(view[received:])
+            if count == 0: raise Exception("camera connection closed")
+            received += count
+        self._stats["bytes"] += received
+
+    def _drain(self, sock, size: int):
+        scratch = memoryview(self._scratch)
+        while size > 0:
+            count = sock.recv_into(scratch[:min(size, len(scratch))])
+            if count == 0: raise Exception("camera connection closed")
+            size -= count
+            self._stats["bytes"] += count
+
+    def _acquire(self, size: int) -> Optional["_PooledBuffer"]:
+        with self._condition:
+            latest = self._latest[0] if self._latest else None
+            for buffer in self._pool:
+                if buffer is latest or buffer.pins: continue
+                if len(buffer.data) < size: buffer.data = bytearray(size)
+                return buffer
+        return None
+
+    def _publish(self, buffer: "_PooledBuffer", size: int):
+        with self._condition:
+            self._sequence += 1
+            self._latest = (buffer, size, self._sequence, time.time())
+            self._stats["frames"] += 1
+            self._condition.notify_all()
+        if self._on_frame:
+            try:
+                self._on_frame(self)
+            except Exception:
+                logger.exception("camera on_frame callback raised an exception")
+
+    def _unpin(self, buffer: "_PooledBuffer"):
+        with self._condition:
+            buffer.pins -= 1
+
+    @property
+    def rtsp_url(self) -> str:
+        return f"rtsps://{self._config.mqtt_username}:{self._config.access_code}@{self._config.hostname}:{RTSP_PORT}/streaming/live/1"
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+    @interval.setter
+    def interval(self, value: float):
+        self._interval = float(value) if value else 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+
+class BambuCameraReplay:
+    """
+    `BambuCameraReplay` is a local stand-in for a printer's camera port that replays recorded JPEG
+    frames over TLS using the same framing as the printer, so `BambuCamera` can be exercised without
+    a printer.  Point a camera at it with `port=replay.port` and a `config` whose hostname is
+    `127.0.0.1`.  A certificate is required (a self-signed one is fine, the camera doesn't verify it).
+
+    Example
+    -------
+    ```py
+    replay = BambuCameraReplay("recorded/", certfile="cert.pem", keyfile="key.pem", fps=10)
+    replay.start()
+    camera = BambuCamera(BambuConfig(hostname="127.0.0.1", access_code="12345678", serial_number="replay"), port=replay.port)
+    ```
+    """
+    def __init__(self,
+                 frames,
+                 certfile: str,
+                 keyfile: Optional[str] = None,
+                 host: Optional[str] = "127.0.0.1",
+                 port: Optional[int] = 0,
+                 fps: Optional[float] = 0,
+                 loop: Optional[bool] = True,
+                 access_code: Optional[str] = None):
+        """
+        Sets up all internal storage attributes for `BambuCameraReplay`.
+
+        Parameters
+        ----------
+        * frames : list | str - JPEG images as `bytes`, or a directory of recorded `.jpg` files (replayed in name order)
+        * certfile : str - the certificate (PEM) the stand-in presents
+        * keyfile : Optional[str] = None - the certificate's private key (if not included in `certfile`)
+        * host : Optional[str] = "127.0.0.1" - the address to listen on
+        * port : Optional[int] = 0 - the port to listen on (`0` picks a free one, see `port`)
+        * fps : Optional[float] = 0 - frames sent per second (`0` sends as fast as the client reads)
+        * loop : Optional[bool] = True - start over after the last frame (otherwise close the connection)
+        * access_code : Optional[str] = None - when set, clients authenticating with another access code are rejected
+
+        Attributes
+        ----------
+        * _frames : `PRIVATE` list of the JPEG images being replayed.
+        * _connections : `READ ONLY` number of client connections accepted.
+        """
+        if isinstance(frames, str):
+            names = sorted(name for name in os.listdir(frames) if name.lower().endswith((".jpg", ".jpeg")))
+            frames = [open(os.path.join(frames, name), "rb").read() for name in names]
+        self._frames = list(frames)
+        if not self._frames:
+            raise Exception("no frames to replay")
+
+        self._context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._context.load_cert_chain(certfile, keyfile)
+        self._host = host
+        self._port = port
+        self._fps = float(fps) if fps else 0.0
+        self._loop = loop
+        self._access_code = access_code
+
+        self._server = None
+        self._thread = None
+        self._running = threading.Event()
+        self._connections = 0
+
+    def start(self):
+        """
+        Starts listening (the bound port is available as `port` once this returns).
+        """
+        if self._running.is_set(): return
+        self._server = socket.create_server((self._host, self._port))
+        self._server.settimeout(0.5)
+        self._port = self._server.getsockname()[1]
+        self._running.set()
+        self._thread = threading.Thread(target=self._accept, name="bambuprinter-camera-replay", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops listening.  Clients still connected are disconnected after their next frame.
+        """
+        self._running.clear()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        if self._server:
+            self._server.close()
+            self._server = None
+
+    def _accept(self):
+        while self._running.is_set():
+            try:
+                raw, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            self._connections += 1
+            threading.Thread(target=self._serve, args=(raw,), name="bambuprinter-camera-replay", daemon=True).start()
+
+    def _serve(self, raw):
+        try:
+            with self._context.wrap_socket(raw, server_side=True) as sock:
+                auth = bytearray(80)
+                view = memoryview(auth)
+                received = 0
+                while received < len(auth):
+                    count = sock.recv_into(view[received:])
+                    if count == 0: return
+                    received += count
+                if self._access_code is not None and auth[48:80].rstrip(b"\x00").decode("ascii", "replace") != self._access_code:
+                    logger.warning("camera replay rejected a client with the wrong access code")
+                    return
+
+                while self._running.is_set():
+                    for image in self._frames:
+                        if not self._running.is_set(): return
+                        sock.sendall(struct.pack("<IIII", len(image), 0, 0, 0) + image)
+                        if self._fps: time.sleep(1.0 / self._fps)
+                    if not self._loop: return
+        except (OSError, ssl.SSLError) as e:
+            logger.debug(f"camera replay client disconnected: [{e}]")
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def connections(self) -> int:
+        return self._connections
+
+
+class _PooledBuffer:
+    __slots__ = ("data", "pins")
+
+    def __init__(self, size: int):
+        self.data = bytearray(size)
+        self.pins = 0
+
+
+def _auth_packet(username: str, access_code: str) -> bytes:
+    return (struct.pack("<IIII", 0x40, 0x3000, 0, 0)
+            + username.encode("ascii").ljust(32, b"\x00")
+            + access_code.encode("ascii").ljust(32, b"\x00"))
@@ -0,0 +1,321 @@
+"""
+`bambucodec` contains the compact, schema versioned binary encoding of `BambuState` snapshots (and
+of the changes between two snapshots) used to ship printer state between processes and to disk.
+"""
+import struct
+import logging
+
+from typing import Optional
+
+from .bambuspool import BambuSpool
+from .bambustate import BambuState, STATE_SCHEMA
+
+logger = logging.getLogger("bambuprinter")
+
+MAGIC = b"BS"
+# bumped only for changes older readers can't parse (new fields never bump it, see `FIELD_IDS`), so
+# data with a newer version than `SCHEMA_VERSION` is rejected instead of being misread
+SCHEMA_VERSION = 1
+
+# encoding kinds
+FULL = 0
+DELTA = 1
+
+# wire types (the low 2 bits of every field key)
+WIRE_VARINT = 0
+WIRE_DOUBLE = 1
+WIRE_STRING = 2
+WIRE_VALUE = 3
+
+# field ids are part of the encoding: new `BambuState` fields are appended with a new id and ids of
+# removed fields are never reused, so older readers skip fields they do not know
+FIELD_IDS = {
+    "bed_temp": 1, "bed_temp_target": 2, "bed_temp_target_time": 3,
+    "tool_temp": 4, "tool_temp_target": 5, "tool_temp_target_time": 6,
+    "chamber_temp": 7, "chamber_temp_target": 8, "chamber_temp_target_time": 9,
+    "fan_gear": 10, "heatbreak_fan_speed": 11, "fan_speed": 12, "fan_speed_target": 13, "fan_speed_target_time": 14,
+    "light_state": 15, "wifi_signal": 16, "speed_level": 17,
+    "gcode_state": 18, "gcode_file": 19, "current_3mf_file": 20, "plate_num": 21, "subtask_name": 22,
+    "print_type": 23, "percent_complete": 24, "time_remaining": 25, "start_time": 26, "elapsed_time": 27,
+    "layer_count": 28, "current_layer": 29, "current_stage": 30, "current_stage_text": 31,
+    "spools": 32, "target_spool": 33, "active_spool": 34, "spool_state": 35, "ams_status": 36,
+    "ams_exists": 37, "ams_rfid_status": 38, "hms_data": 39, "hms_message": 40, "skipped_objects": 41,
+}
+
+# maximum number of cached composite value encodings / decodings
+CACHE_SIZE = 512
+
+_DOUBLE = struct.Struct("<d")
+_HEADER = struct.Struct("<2sBB")
+
+_encoded = {}
+_decoded = {}
+
+# generic value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+
+
+def _varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _readVarint(data: bytes, position: int) -> tuple:
+    byte = data[position]
+    if byte < 0x80: return byte, position + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        position += 1
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80: return value, position + 1
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _encodeValue(out: bytearray, value):
+    if value is None:
+        out.append(_NONE)
+    elif value is True or value is False:
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        _varint(out, _zigzag(value))
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode()
+        out.append(_STR)
+        _varint(out, len(encoded))
+        out += encoded
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _varint(out, len(value))
+        for item in value:
+            _encodeValue(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _varint(out, len(value))
+        for key, item in value.items():
+            _encodeValue(out, str(key))
+            _encodeValue(out, item)
+    elif isinstance(value, BambuSpool):
+        _encodeValue(out, [getattr(value, slot) for slot in BambuSpool.__slots__])
+    else:
+        raise Exception(f"unable to encode a value of type [{type(value).__name__}]")
+
+
+def _decodeValue(data: bytes, position: int) -> tuple:
+    tag = data[position]
+    position += 1
+    if tag == _STR:
+        length, position = _readVarint(data, position)
+        return data[position:position + length].decode(), position + length
+    if tag == _INT:
+        value, position = _readVarint(data, position)
+        return _unzigzag(value), position
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, position)[0], position + 8
+    if tag == _NONE: return None, position
+    if tag == _FALSE: return False, position
+    if tag == _TRUE: return True, position
+    if tag == _LIST:
+        count, position = _readVarint(data, position)
+        items = []
+        for _ in range(count):
+            item, position = _decodeValue(data, position)
+            items.append(item)
+        return tuple(items), position
+    if tag == _DICT:
+        count, position = _readVarint(data, position)
+        items = {}
+        for _ in range(count):
+            key, position = _decodeValue(data, position)
+            items[key], position = _decodeValue(data, position)
+        return items, position
+    raise Exception(f"unknown value tag [{tag}] in encoded state")
+
+
+def _encodeField(out: bytearray, keys: tuple, value):
+    if value is True or value is False:
+        out += keys[WIRE_VARINT]
+        out.append(2 if value else 0)
+    elif type(value) is int:
+        out += keys[WIRE_VARINT]
+        value = _zigzag(value)
+        if value < 0x80: out.append(value)
+        else: _varint(out, value)
+    elif type(value) is float:
+        out += keys[WIRE_DOUBLE]
+        out += _DOUBLE.pack(value)
+    elif type(value) is str:
+        encoded = value.encode()
+        out += keys[WIRE_STRING]
+        _varint(out, len(encoded))
+        out += encoded
+    else:
+        # composite values (spools, hms entries, ...) are shared by consecutive snapshots, so their
+        # encoding is cached by identity (holding the value keeps its id from being reused)
+        cached = _encoded.get(id(value))
+        if cached is None or cached[0] is not value:
+            if len(_encoded) >= CACHE_SIZE: _encoded.clear()
+            encoded = bytearray()
+            _encodeValue(encoded, value)
+            cached = _encoded[id(value)] = (value, bytes(encoded))
+        out += keys[WIRE_VALUE]
+        _varint(out, len(cached[1]))
+        out += cached[1]
+
+
+def _immutable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _spools(value) -> tuple:
+    return tuple(BambuSpool(*spool) for spool in value or ())
+
+
+def _tuple(value) -> tuple:
+    return tuple(value or ())
+
+
+def _keys(field_id: int) -> tuple:
+    keys = []
+    for wire in (WIRE_VARINT, WIRE_DOUBLE, WIRE_STRING, WIRE_VALUE):
+        key = bytearray()
+        _varint(key, field_id << 2 | wire)
+        keys.append(bytes(key))
+    return tuple(keys)
+
+
+# (name, encoded key of each wire type, default) in schema order, and the conversion applied to
+# decoded values by field id
+_FIELDS = []
+_DECODERS = {}
+for f in STATE_SCHEMA:
+    if f.name not in FIELD_IDS: raise Exception(f"BambuState field [{f.name}] has no binary field id")
+    _FIELDS.append((f.name, _keys(FIELD_IDS[f.name]), f.default))
+    if f.name == "spools": _DECODERS[FIELD_IDS[f.name]] = (f.name, _spools)
+    elif f.type is bool: _DECODERS[FIELD_IDS[f.name]] = (f.name, bool)
+    elif getattr(f.type, "__origin__", None) is tuple: _DECODERS[FIELD_IDS[f.name]] = (f.name, _tuple)
+    else: _DECODERS[FIELD_IDS[f.name]] = (f.name, None)
+_FIELDS = tuple(_FIELDS)
+_NAMES = tuple(name for name, _, _ in _FIELDS)
+_FULL_HEADER = _HEADER.pack(MAGIC, SCHEMA_VERSION, FULL)
+_DELTA_HEADER = _HEADER.pack(MAGIC, SCHEMA_VERSION, DELTA)
+
+
+def encodeState(state: BambuState) -> bytes:
+    """
+    Encodes every field of `state` that differs from its schema default.
+    """
+    out = bytearray(_FULL_HEADER)
+    for name, keys, default in _FIELDS:
+        value = getattr(state, name)
+        if value is default or value == default: continue
+        _encodeField(out, keys, value)
+    return bytes(out)
+
+
+def encodeDelta(old: Optional[BambuState], new: BambuState) -> bytes:
+    """
+    Encodes the fields of `new` that differ from `old` (a full encoding if `old` is `None`).
+    Decoding requires `old` as the base (see `decodeState`).
+    """
+    if old is None: return encodeState(new)
+    out = bytearray(_DELTA_HEADER)
+    if old is new: return bytes(out)
+    for name, keys, _ in _FIELDS:
+        value = getattr(new, name)
+        previous = getattr(old, name)
+        if value is previous or value == previous: continue
+        _encodeField(out, keys, value)
+    return bytes(out)
+
+
+def decodeChanges(data: bytes) -> tuple:
+    """
+    Returns the encoding kind (`FULL` or `DELTA`) and a `dict` of the encoded field values.
+    Fields with unknown ids (added to the schema after this reader) are skipped, while data written
+    with a newer `SCHEMA_VERSION` raises an exception.  Lists are decoded as tuples.
+    """
+    magic, version, kind = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC: raise Exception("data is not an encoded printer state")
+    if version > SCHEMA_VERSION:
+        raise Exception(f"encoded printer state has schema version [{version}], only [{SCHEMA_VERSION}] is supported")
+    changes = {}
+    position = _HEADER.size
+    end = len(data)
+    while position < end:
+        key = data[position]
+        if key < 0x80:
+            position += 1
+        else:
+            key, position = _readVarint(data, position)
+        wire = key & 3
+        if wire == WIRE_VARINT:
+            value = data[position]
+            if value < 0x80: position += 1
+            else: value, position = _readVarint(data, position)
+            value = _unzigzag(value)
+        elif wire == WIRE_DOUBLE:
+            value = _DOUBLE.unpack_from(data, position)[0]
+            position += 8
+        else:
+            length = data[position]
+            if length < 0x80: position += 1
+            else: length, position = _readVarint(data, position)
+            if wire == WIRE_STRING:
+                value = data[position:position + length].decode()
+                position += length
+            else:
+                # the decoding of immutable values is cached, values holding dicts are decoded for
+                # every state, and spools are rebuilt from the cached values, so decoded states never
+                # share a mutable object
+                encoded = (key, bytes(data[position:position + length]))
+                value = _decoded.get(encoded, _decoded)
+                if value is _decoded:
+                    value = _decodeValue(data, position)[0]
+                    if _immutable(value):
+                        if len(_decoded) >= CACHE_SIZE: _decoded.clear()
+                        _decoded[encoded] = value
+                position += length
+                decoder = _DECODERS.get(key >> 2)
+                if decoder: changes[decoder[0]] = decoder[1](value) if decoder[1] else value
+                continue
+
+        decoder = _DECODERS.get(key >> 2)
+        if decoder is None: continue
+        name, convert = decoder
+        changes[name] = convert(value) if convert else value
+    return kind, changes
+
+
+def decodeState(data: bytes, base: Optional[BambuState] = None) -> BambuState:
+    """
+    Decodes a full encoding (`encodeState`) or, given the `base` it was encoded against, a delta
+    encoding (`encodeDelta`) back into a `BambuState`.
+    """
+    kind, changes = decodeChanges(data)
+    if kind == FULL: return BambuState(**changes)
+    if base is None: raise Exception("a delta encoded state requires the state it was encoded against")
+    if not changes: return base
+    # cheaper than `dataclasses.replace`, which `BambuState.evolve` uses
+    values = {name: getattr(base, name) for name in _NAMES}
+    values.update(changes)
+    return BambuState(**values)
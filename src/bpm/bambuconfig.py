@@ -6,7 +6,8 @@ import json
 
 from typing import Optional
 
-from bpm.bambutools import getModelBySerial, PrinterModel
+from bpm.bambutools import getModelBySerial, enumToJson, PrinterModel
+from bpm.bambureconnect import BambuReconnectPolicy, DEFAULT_RECONNECT_POLICY
 
 logger = logging.getLogger("bambuprinter")
 
@@ -24,7 +25,15 @@ class BambuConfig:
                  mqtt_username: Optional[str] = "bblp",
                  watchdog_timeout: Optional[int] = 30,
                  external_chamber: Optional[bool] = False,
-                 verbose: Optional[bool] = False):
+                 verbose: Optional[bool] = False,
+                 state_file: Optional[str] = None,
+                 checkpoint_interval: Optional[int] = 60,
+                 refresh_stagger: Optional[float] = 0,
+                 publish_qos: Optional[int] = 0,
+                 max_inflight: Optional[int] = 100,
+                 publish_timeout: Optional[float] = 5,
+                 reconnect_policy: Optional[BambuReconnectPolicy] = None,
+                 connect_timeout: Optional[float] = 5):
         """
         Sets up all internal storage attributes for `BambuConfig`.
 
@@ -39,6 +48,14 @@ class BambuConfig:
         * watchdog_timeout : Optional[int] = 30
         * external_chamber : Optional[bool] = False
         * verbose : Optional[bool] = False
+        * state_file : Optional[str] = None
+        * checkpoint_interval : Optional[int] = 60
+        * refresh_stagger : Optional[float] = 0
+        * publish_qos : Optional[int] = 0
+        * max_inflight : Optional[int] = 100
+        * publish_timeout : Optional[float] = 5
+        * reconnect_policy : Optional[BambuReconnectPolicy] = None
+        * connect_timeout : Optional[float] = 5
 
         `external_chamber` can be used to tell `BambuPrinter` not to use any of the chamber 
         temperature data received from the printer.  This can be useful if you are using an
@@ -48,6 +65,29 @@ class BambuConfig:
         `verbose` triggers a global log level change (within the scope of `bambu-printer-manager`)
         based on its value.  `True` will set a log level of `DEBUG` and `False` (the default) will 
         set the log level to `WARNING`.
+
+        `state_file` enables warm starts.  `BambuPrinter` checkpoints its last known state (along
+        with the firmware versions reported by the printer) to this file every `checkpoint_interval`
+        seconds and reloads it when a session is started, flagging it as `stale` until the printer
+        reports in.
+
+        `refresh_stagger` spreads the initial full refresh (`ANNOUNCE_PUSH` / `ANNOUNCE_VERSION`) of
+        a session over up to this many seconds, using a delay derived from the serial # so a fleet
+        that restarts at once does not request a full refresh from every printer at the same time.
+
+        `publish_qos` is the `mqtt` QoS requests are published with.  `max_inflight` limits the number
+        of requests that have been handed to the `mqtt` client but not yet sent (QoS 0) or acknowledged
+        by the printer (QoS 1 / 2).  Once the limit is reached further requests wait up to
+        `publish_timeout` seconds for room before raising an exception (`0` fails immediately).
+        Critical requests such as `stop_printing` never wait for room, but they do not jump ahead of
+        requests the `mqtt` client has already queued.  A request the `mqtt` client fails to send
+        (e.g. while disconnected) raises an exception whatever the QoS.
+
+        `reconnect_policy` (a `bambureconnect.BambuReconnectPolicy`) controls the jittered backoff
+        between `mqtt` reconnect attempts and FTPS connection retries, and limits the number of
+        simultaneous handshakes.  Configs without one share `DEFAULT_RECONNECT_POLICY`.
+        `connect_timeout` bounds each `mqtt` connection attempt (in seconds), so an offline printer
+        fails fast instead of waiting out the operating system's TCP timeout.
         
         Attributes
         ---------
@@ -74,6 +114,14 @@ class BambuConfig:
         self._watchdog_timeout = watchdog_timeout
         self._external_chamber =external_chamber
         self._verbose = verbose
+        self._state_file = state_file
+        self._checkpoint_interval = checkpoint_interval
+        self._refresh_stagger = refresh_stagger
+        self._publish_qos = publish_qos
+        self._max_inflight = max_inflight
+        self._publish_timeout = publish_timeout
+        self._reconnect_policy = reconnect_policy or DEFAULT_RECONNECT_POLICY
+        self._connect_timeout = connect_timeout
 
         self._firmware_version = ""
         self._ams_firmware_version = ""
@@ -86,6 +134,40 @@ class BambuConfig:
         self._tray_read_option = True 
         self._calibrate_remain_flag = True
 
+    def toJson(self) -> dict:
+        """
+        Returns a `dict` (json document) representing this object's private class level attributes.
+        """
+        return {
+            "_hostname": self._hostname,
+            "_access_code": self._access_code,
+            "_serial_number": self._serial_number,
+            "_mqtt_port": self._mqtt_port,
+            "_mqtt_client_id": self._mqtt_client_id,
+            "_mqtt_username": self._mqtt_username,
+            "_watchdog_timeout": self._watchdog_timeout,
+            "_external_chamber": self._external_chamber,
+            "_verbose": self._verbose,
+            "_state_file": self._state_file,
+            "_checkpoint_interval": self._checkpoint_interval,
+            "_refresh_stagger": self._refresh_stagger,
+            "_publish_qos": self._publish_qos,
+            "_max_inflight": self._max_inflight,
+            "_publish_timeout": self._publish_timeout,
+            "_reconnect_policy": self._reconnect_policy.toJson(),
+            "_connect_timeout": self._connect_timeout,
+            "_firmware_version": self._firmware_version,
+            "_ams_firmware_version": self._ams_firmware_version,
+            "_printer_model": enumToJson(self._printer_model),
+            "_auto_recovery": self._auto_recovery,
+            "_filament_tangle_detect": self._filament_tangle_detect,
+            "_sound_enable": self._sound_enable,
+            "_auto_switch_filament": self._auto_switch_filament,
+            "_startup_read_option": self._startup_read_option,
+            "_tray_read_option": self._tray_read_option,
+            "_calibrate_remain_flag": self._calibrate_remain_flag,
+        }
+
     @property 
     def hostname(self) -> str:
         return self._hostname
@@ -140,6 +222,64 @@ class BambuConfig:
     def watchdog_timeout(self, value: int):
         self._watchdog_timeout = int(value)
 
+    @property 
+    def state_file(self) -> Optional[str]:
+        return self._state_file
+    @state_file.setter 
+    def state_file(self, value: Optional[str]):
+        self._state_file = str(value) if value else None
+
+    @property 
+    def checkpoint_interval(self) -> int:
+        return self._checkpoint_interval
+    @checkpoint_interval.setter 
+    def checkpoint_interval(self, value: int):
+        self._checkpoint_interval = int(value)
+
+    @property 
+    def refresh_stagger(self) -> float:
+        return self._refresh_stagger
+    @refresh_stagger.setter 
+    def refresh_stagger(self, value: float):
+        self._refresh_stagger = float(value)
+
+    @property 
+    def publish_qos(self) -> int:
+        return self._publish_qos
+    @publish_qos.setter 
+    def publish_qos(self, value: int):
+        value = int(value)
+        if value not in (0, 1, 2): raise Exception("publish_qos must be 0, 1, or 2")
+        self._publish_qos = value
+
+    @property 
+    def max_inflight(self) -> int:
+        return self._max_inflight
+    @max_inflight.setter 
+    def max_inflight(self, value: int):
+        self._max_inflight = max(int(value), 1)
+
+    @property 
+    def publish_timeout(self) -> float:
+        return self._publish_timeout
+    @publish_timeout.setter 
+    def publish_timeout(self, value: float):
+        self._publish_timeout = max(float(value), 0.0)
+
+    @property 
+    def reconnect_policy(self) -> BambuReconnectPolicy:
+        return self._reconnect_policy
+    @reconnect_policy.setter 
+    def reconnect_policy(self, value: BambuReconnectPolicy):
+        self._reconnect_policy = value or DEFAULT_RECONNECT_POLICY
+
+    @property 
+    def connect_timeout(self) -> float:
+        return self._connect_timeout
+    @connect_timeout.setter 
+    def connect_timeout(self, value: float):
+        self._connect_timeout = max(float(value), 0.1)
+
     @property 
     def firmware_version(self) -> str:
         return self._firmware_version
@@ -0,0 +1,284 @@
+"""
+`bambuexporter` provides an optional `OpenMetrics` (Prometheus) exporter for one or more
+`BambuPrinter` instances.  It is not imported by `BambuPrinter` and only needs to be used
+if you intend to scrape your printers with Prometheus (or any other OpenMetrics compatible
+collector).
+"""
+import threading
+import logging
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .bambuprinter import BambuPrinter
+from .bambutools import PrinterState
+
+logger = logging.getLogger("bambuprinter")
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+GCODE_STATES = ("IDLE", "PREPARE", "RUNNING", "PAUSE", "FINISH", "FAILED")
+
+# (metric family, type, unit, help) in the order they are rendered
+METRIC_FAMILIES = (
+    ("bambu_printer", "info", "", "Static printer information."),
+    ("bambu_printer_session_state", "stateset", "", "State of the mqtt session to the printer."),
+    ("bambu_printer_connected", "gauge", "", "1 if the mqtt session to the printer is connected."),
+    ("bambu_printer_stale", "gauge", "", "1 while the printer state is restored from a checkpoint and not yet confirmed by the printer."),
+    ("bambu_printer_publish_inflight", "gauge", "", "Requests published to the printer that have not been sent / acknowledged yet."),
+    ("bambu_bed_temperature_celsius", "gauge", "celsius", "Current bed temperature."),
+    ("bambu_bed_target_temperature_celsius", "gauge", "celsius", "Target bed temperature."),
+    ("bambu_tool_temperature_celsius", "gauge", "celsius", "Current tool (nozzle) temperature."),
+    ("bambu_tool_target_temperature_celsius", "gauge", "celsius", "Target tool (nozzle) temperature."),
+    ("bambu_chamber_temperature_celsius", "gauge", "celsius", "Current chamber temperature."),
+    ("bambu_chamber_target_temperature_celsius", "gauge", "celsius", "Target chamber temperature."),
+    ("bambu_fan_speed_percent", "gauge", "percent", "Parts cooling fan speed."),
+    ("bambu_fan_target_speed_percent", "gauge", "percent", "Parts cooling fan target speed."),
+    ("bambu_heatbreak_fan_speed", "gauge", "", "Heatbreak fan speed as reported by the printer."),
+    ("bambu_fan_gear", "gauge", "", "Combined fan(s) reporting value."),
+    ("bambu_gcode_state", "stateset", "", "Job state reported by the printer."),
+    ("bambu_print_progress_percent", "gauge", "percent", "Percentage complete for the active job."),
+    ("bambu_print_layer", "gauge", "", "Layer currently being printed."),
+    ("bambu_print_layer_count", "gauge", "", "Total number of layers for the active job."),
+    ("bambu_print_time_remaining_seconds", "gauge", "seconds", "Estimated time remaining for the active job."),
+    ("bambu_print_stage", "gauge", "", "Current stage (see bambutools.parseStage)."),
+    ("bambu_hms_active", "gauge", "", "Number of active HMS codes."),
+)
+
+
+class BambuExporter:
+    """
+    `BambuExporter` renders the state of every registered `BambuPrinter` in the `OpenMetrics`
+    text format and can optionally serve it over http.
+
+    Rendering is cached.  Each scrape samples the printers' current values and only
+    regenerates the text for a printer when one of those values changed since the
+    last scrape.  The full response body is reused as-is when nothing changed at all,
+    which keeps frequent scrapes of large fleets cheap.
+
+    Example
+    -------
+    ```py
+    exporter = BambuExporter()
+    exporter.add_printer(printer, name="bay3-01")
+    exporter.start(port=9105)
+    ```
+    """
+    def __init__(self):
+        """
+        Sets up all internal storage attributes for `BambuExporter`.
+
+        Attributes
+        ----------
+        * _printers : `PRIVATE` dict of registered printers keyed by serial #.
+        * _names : `PRIVATE` dict of friendly printer names keyed by serial #.
+        * _cache : `PRIVATE` dict of (fingerprint, rendered samples) keyed by serial #.
+        * _body : `PRIVATE` The last fully rendered response body.
+        * _server : `PRIVATE` The http server (if `start` was called).
+        * _server_thread : `PRIVATE` Thread handle for the http server.
+        * _renders : `READ ONLY` Number of times a printer's samples were regenerated.
+        * _scrapes : `READ ONLY` Number of times `render` was called.
+        """
+        self._lock = threading.Lock()
+        self._printers = {}
+        self._names = {}
+        self._cache = {}
+        self._body = None
+        self._server = None
+        self._server_thread = None
+        self._renders = 0
+        self._scrapes = 0
+
+    def add_printer(self, printer: BambuPrinter, name: Optional[str] = None):
+        """
+        Registers a `BambuPrinter` with the exporter.
+
+        Parameters
+        ----------
+        * printer : BambuPrinter - the printer to export
+        * name : Optional[str] = None - friendly name exported as the `name` label (defaults to the serial #)
+        """
+        serial = printer.config.serial_number
+        with self._lock:
+            self._printers[serial] = printer
+            self._names[serial] = name if name else serial
+            self._cache.pop(serial, None)
+            self._body = None
+
+    def remove_printer(self, printer: BambuPrinter):
+        """
+        Removes a previously registered `BambuPrinter` from the exporter.
+        """
+        serial = printer.config.serial_number
+        with self._lock:
+            self._printers.pop(serial, None)
+            self._names.pop(serial, None)
+            self._cache.pop(serial, None)
+            self._body = None
+
+    def render(self) -> bytes:
+        """
+        Returns the `OpenMetrics` exposition for all registered printers as utf-8 encoded bytes.
+        """
+        with self._lock:
+            self._scrapes += 1
+            changed = self._body is None
+
+            for serial, printer in self._printers.items():
+                fingerprint = _sample(printer)
+                cached = self._cache.get(serial)
+                if cached is None or cached[0] != fingerprint:
+                    self._cache[serial] = (fingerprint, _render_samples(self._names[serial], printer, fingerprint))
+                    self._renders += 1
+                    changed = True
+
+            if changed:
+                self._body = self._assemble()
+
+            return self._body
+
+    def start(self, port: Optional[int] = 9105, addr: Optional[str] = ""):
+        """
+        Starts serving `render()` output on `http://{addr}:{port}/metrics` from a background thread.
+
+        Parameters
+        ----------
+        * port : Optional[int] = 9105
+        * addr : Optional[str] = "" - all interfaces by default
+        """
+        if self._server:
+            raise Exception("exporter is already running")
+
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render()
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"exporter {format % args}")
+
+        self._server = ThreadingHTTPServer((addr, port), MetricsHandler)
+        self._server.daemon_threads = True
+        self._server_thread = threading.Thread(target=self._server.serve_forever, name="bambuprinter-exporter", daemon=True)
+        self._server_thread.start()
+        logger.debug(f"exporter listening on [{addr}:{port}]")
+
+    def stop(self):
+        """
+        Stops the http server if it is running.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server_thread.join()
+            self._server = None
+            self._server_thread = None
+            logger.debug("exporter stopped")
+
+    def _assemble(self) -> bytes:
+        # OpenMetrics requires all samples of a metric family to be contiguous
+        lines = []
+        for index, (family, type, unit, help) in enumerate(METRIC_FAMILIES):
+            lines.append(f"# TYPE {family} {type}")
+            if unit: lines.append(f"# UNIT {family} {unit}")
+            lines.append(f"# HELP {family} {help}")
+            for _, samples in self._cache.values():
+                lines.extend(samples[index])
+        lines.append("# EOF\n")
+        return "\n".join(lines).encode("utf-8")
+
+    @property
+    def renders(self) -> int:
+        return self._renders
+
+    @property
+    def scrapes(self) -> int:
+        return self._scrapes
+
+
+def _sample(printer: BambuPrinter) -> tuple:
+    return (
+        printer.config.printer_model.name,
+        printer.config.firmware_version,
+        printer.state.name,
+        printer.stale,
+        printer.publish_inflight,
+        printer.bed_temp,
+        printer.bed_temp_target,
+        printer.tool_temp,
+        printer.tool_temp_target,
+        printer.chamber_temp,
+        printer.chamber_temp_target,
+        printer.fan_speed,
+        printer.fan_speed_target,
+        printer.heatbreak_fan_speed,
+        printer.fan_gear,
+        printer.gcode_state,
+        printer.percent_complete,
+        printer.current_layer,
+        printer.layer_count,
+        printer.time_remaining,
+        printer.current_stage,
+        len(printer.hms_data) if printer.hms_data else 0,
+    )
+
+
+def _render_samples(name: str, printer: BambuPrinter, fingerprint: tuple) -> tuple:
+    (model, firmware, state, stale, inflight, bed_temp, bed_temp_target, tool_temp, tool_temp_target,
+     chamber_temp, chamber_temp_target, fan_speed, fan_speed_target, heatbreak_fan_speed,
+     fan_gear, gcode_state, percent_complete, current_layer, layer_count, time_remaining,
+     current_stage, hms_active) = fingerprint
+
+    labels = f'serial="{_escape(printer.config.serial_number)}",name="{_escape(name)}"'
+
+    def gauge(family, value):
+        return [f"{family}{{{labels}}} {_number(value)}"]
+
+    def stateset(family, label, states, current):
+        if current and current not in states: states = states + (current,)
+        return [f'{family}{{{labels},{label}="{_escape(s)}"}} {1 if s == current else 0}' for s in states]
+
+    return (
+        [f'bambu_printer_info{{{labels},model="{_escape(model)}",firmware="{_escape(firmware)}"}} 1'],
+        stateset("bambu_printer_session_state", "bambu_printer_session_state", tuple(s.name for s in PrinterState), state),
+        gauge("bambu_printer_connected", 1 if state == PrinterState.CONNECTED.name else 0),
+        gauge("bambu_printer_stale", 1 if stale else 0),
+        gauge("bambu_printer_publish_inflight", inflight),
+        gauge("bambu_bed_temperature_celsius", bed_temp),
+        gauge("bambu_bed_target_temperature_celsius", bed_temp_target),
+        gauge("bambu_tool_temperature_celsius", tool_temp),
+        gauge("bambu_tool_target_temperature_celsius", tool_temp_target),
+        gauge("bambu_chamber_temperature_celsius", chamber_temp),
+        gauge("bambu_chamber_target_temperature_celsius", chamber_temp_target),
+        gauge("bambu_fan_speed_percent", fan_speed),
+        gauge("bambu_fan_target_speed_percent", fan_speed_target),
+        gauge("bambu_heatbreak_fan_speed", heatbreak_fan_speed),
+        gauge("bambu_fan_gear", fan_gear),
+        stateset("bambu_gcode_state", "bambu_gcode_state", GCODE_STATES, gcode_state),
+        gauge("bambu_print_progress_percent", percent_complete),
+        gauge("bambu_print_layer", current_layer),
+        gauge("bambu_print_layer_count", layer_count),
+        gauge("bambu_print_time_remaining_seconds", int(time_remaining) * 60),
+        gauge("bambu_print_stage", current_stage),
+        gauge("bambu_hms_active", hms_active),
+    )
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value) -> str:
+    try:
+        return repr(float(value)) if isinstance(value, float) else str(int(value))
+    except (TypeError, ValueError):
+        return "NaN"
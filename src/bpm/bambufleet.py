@@ -0,0 +1,258 @@
+"""
+`bambufleet` contains `BambuFleet` which starts the sessions of, and sends the same command to, a group of printers at once.
+"""
+import copy
+import json
+import math
+import threading
+import time
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from .bambucommands import CHAMBER_LIGHT_TOGGLE, PAUSE_PRINT, RESUME_PRINT, STOP_PRINT, SEND_GCODE_TEMPLATE
+from .bambutools import PrinterState, nextSequenceId
+
+logger = logging.getLogger("bambuprinter")
+
+
+@dataclass(frozen=True)
+class BambuBroadcastResult:
+    """
+    The outcome of a broadcast command for a single printer.
+
+    * `result` - the printer's reply (`success`, `failed`, ...), `timeout` if it did not reply
+      before the deadline, `sent` if acknowledgements were not requested, or `error`.
+    * `latency` - seconds from the start of the broadcast until the printer replied.
+    """
+    serial_number: str
+    result: str
+    latency: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.result in ("success", "sent")
+
+
+class BambuFleet:
+    """
+    `BambuFleet` is a group of `BambuPrinter` instances that can be started together and that
+    commands can be broadcast to.
+
+    A broadcast encodes the command once (with a single `sequence_id`), publishes it to every
+    connected printer in the group concurrently, and then collects every printer's acknowledgement
+    against one overall deadline - so a fleet of 50 printers takes roughly as long as the slowest
+    printer rather than the sum of all of them.  Printers that are not connected are reported as
+    an `error` without being sent anything.
+
+    Example
+    -------
+    ```py
+    bay3 = BambuFleet(printers).select(lambda printer: printer.config.serial_number in BAY_3)
+    results = bay3.pause_printing(deadline=5)
+    failed = [result.serial_number for result in results.values() if not result.ok]
+    ```
+    """
+    def __init__(self, printers=(), concurrency: Optional[int] = 16):
+        """
+        Sets up all internal storage attributes for `BambuFleet`.
+
+        Parameters
+        ----------
+        * printers : iterable = () - the `BambuPrinter` instances in the group
+        * concurrency : Optional[int] = 16 - maximum number of concurrent publishes
+
+        Attributes
+        ----------
+        * _printers : `READ ONLY` dict of `BambuPrinter` keyed by serial #.
+        * _stats : `READ ONLY` counts of broadcasts and of acknowledged, failed, and timed out printers.
+        """
+        self._concurrency = max(int(concurrency), 1)
+        self._lock = threading.Lock()
+        self._printers = {}
+        self._stats = {"broadcasts": 0, "acknowledged": 0, "failed": 0, "timeouts": 0}
+        for printer in printers:
+            self.add(printer)
+
+    def add(self, printer):
+        """
+        Adds a printer to the group.
+        """
+        with self._lock:
+            self._printers[printer.config.serial_number] = printer
+
+    def remove(self, printer):
+        """
+        Removes a printer from the group.
+        """
+        with self._lock:
+            self._printers.pop(printer.config.serial_number, None)
+
+    def select(self, predicate) -> "BambuFleet":
+        """
+        Returns a new `BambuFleet` with the printers `predicate(printer)` returns `True` for.
+        """
+        return BambuFleet([printer for printer in self.printers if predicate(printer)], self._concurrency)
+
+    def start_sessions(self, quorum=None, timeout: Optional[float] = 30) -> dict:
+        """
+        Starts the session of every printer in the group without waiting for each connection in
+        turn and returns once `quorum` printers are connected or `timeout` seconds have passed
+        (`timeout=None` waits until `quorum` printers are connected).
+
+        Each printer connects on its own session thread (`BambuPrinter.start_session(wait=False)`)
+        so a slow or offline printer only costs its own `config.connect_timeout`, and printers that
+        are not connected yet keep retrying in the background (following their reconnect policy).
+        `quorum` is a number of printers, a fraction of the group (e.g. `0.9`), or `None` for all of
+        them.  Returns a `dict` of each printer's `PrinterState` keyed by serial #.
+        """
+        printers = self.printers
+        if quorum is None:
+            needed = len(printers)
+        elif isinstance(quorum, float) and quorum <= 1:
+            needed = math.ceil(len(printers) * quorum)
+        else:
+            needed = min(int(quorum), len(printers))
+
+        for printer in printers:
+            if printer.state in (PrinterState.NO_STATE, PrinterState.QUIT):
+                printer.start_session(wait=False)
+
+        started = time.monotonic()
+        while True:
+            connected = sum(1 for printer in printers if printer.state == PrinterState.CONNECTED)
+            if connected >= needed or (timeout is not None and time.monotonic() - started >= timeout): break
+            time.sleep(0.05)
+
+        logger.debug(f"[{connected}] of [{len(printers)}] printers connected", extra={"quorum": needed, "seconds": time.monotonic() - started})
+        return {printer.config.serial_number: printer.state for printer in printers}
+
+    def quit(self):
+        """
+        Quits the session of every printer in the group concurrently.
+        """
+        printers = self.printers
+        with ThreadPoolExecutor(max_workers=min(self._concurrency, max(len(printers), 1)), thread_name_prefix="bambuprinter-fleet") as pool:
+            for future in [pool.submit(printer.quit) for printer in printers if printer.client]:
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception("unable to quit a printer session")
+
+    def broadcast(self, command: dict, deadline: Optional[float] = 10, wait_for_ack: Optional[bool] = True, priority: Optional[bool] = False) -> dict:
+        """
+        Sends `command` (a request document such as `bambucommands.PAUSE_PRINT`) to every printer
+        in the group and returns a `dict` of `BambuBroadcastResult` keyed by serial #.  With
+        `wait_for_ack` the call returns once every printer has replied or `deadline` seconds have
+        passed, whichever comes first.  `priority` requests bypass each printer's in-flight limit.
+        """
+        command = copy.deepcopy(command)
+        section = next(iter(command))
+        sequence = nextSequenceId()
+        command[section]["sequence_id"] = sequence
+        payload = json.dumps(command)
+        name = command[section].get("command")
+
+        printers = self.printers
+        started = time.monotonic()
+        results = {}
+
+        def publish(printer):
+            serial = printer.config.serial_number
+            if printer.state != PrinterState.CONNECTED:
+                return BambuBroadcastResult(serial, "error", error=f"printer is [{printer.state.name}]")
+            try:
+                printer.publish_request(payload, sequence if wait_for_ack else None, name, priority)
+            except Exception as e:
+                return BambuBroadcastResult(serial, "error", error=str(e))
+            return None
+
+        def collect(printer):
+            ack = printer.wait_for_ack(sequence, max(started + deadline - time.monotonic(), 0))
+            return BambuBroadcastResult(printer.config.serial_number, ack or "timeout", time.monotonic() - started)
+
+        with ThreadPoolExecutor(max_workers=min(self._concurrency, max(len(printers), 1)), thread_name_prefix="bambuprinter-fleet") as pool:
+            pending = []
+            for printer, failure in zip(printers, pool.map(publish, printers)):
+                serial = printer.config.serial_number
+                if failure:
+                    results[serial] = failure
+                elif not wait_for_ack:
+                    results[serial] = BambuBroadcastResult(serial, "sent", time.monotonic() - started)
+                else:
+                    pending.append(printer)
+
+            # every printer shares the same deadline, so waiting on them concurrently keeps latencies accurate
+            for result in pool.map(collect, pending):
+                results[result.serial_number] = result
+
+        with self._lock:
+            self._stats["broadcasts"] += 1
+            for result in results.values():
+                if result.result == "success": self._stats["acknowledged"] += 1
+                elif result.result == "timeout": self._stats["timeouts"] += 1
+                elif result.result != "sent": self._stats["failed"] += 1
+
+        logger.debug(f"broadcast [{name}] to [{len(printers)}] printers", extra={"sequence_id": sequence, "failed": [serial for serial, result in results.items() if not result.ok]})
+        return results
+
+    def pause_printing(self, deadline: Optional[float] = 10) -> dict:
+        """
+        Pauses the active job on every printer in the group.
+        """
+        return self.broadcast(PAUSE_PRINT, deadline)
+
+    def resume_printing(self, deadline: Optional[float] = 10) -> dict:
+        """
+        Resumes the paused job on every printer in the group.
+        """
+        return self.broadcast(RESUME_PRINT, deadline)
+
+    def stop_printing(self, deadline: Optional[float] = 10) -> dict:
+        """
+        Stops the active job on every printer in the group.
+        """
+        return self.broadcast(STOP_PRINT, deadline, priority=True)
+
+    def send_gcode(self, gcode: str, deadline: Optional[float] = 10) -> dict:
+        """
+        Submits one, or more (newline separated), gcode commands to every printer in the group.
+        """
+        command = copy.deepcopy(SEND_GCODE_TEMPLATE)
+        command["print"]["param"] = f"{gcode} \n"
+        return self.broadcast(command, deadline)
+
+    def set_light_state(self, value: bool, deadline: Optional[float] = 10) -> dict:
+        """
+        Turns the chamber light on (`True`) or off (`False`) on every printer in the group.
+        """
+        command = copy.deepcopy(CHAMBER_LIGHT_TOGGLE)
+        command["system"]["led_mode"] = "on" if value else "off"
+        return self.broadcast(command, deadline)
+
+    def set_fan_speed(self, value: int, deadline: Optional[float] = 10) -> dict:
+        """
+        Sets the part cooling, aux, and chamber fans (in percent) on every printer in the group.
+        """
+        speed = round(max(int(value), 0) * 2.55, 0)
+        return self.send_gcode(f"M106 P1 S{speed}\nM106 P2 S{speed}\nM106 P3 S{speed}", deadline)
+
+    @property
+    def printers(self) -> list:
+        with self._lock:
+            return list(self._printers.values())
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._printers)
+
+    def __iter__(self):
+        return iter(self.printers)
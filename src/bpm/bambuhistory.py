@@ -0,0 +1,230 @@
+"""
+`bambuhistory` contains `BambuHistory`, the bounded, queryable log of discrete state transitions
+(`gcode_state`, `current_stage`, HMS codes, session state, ...) recorded by `BambuPrinter`.
+"""
+import bisect
+import collections
+import json
+import os
+import threading
+import logging
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger("bambuprinter")
+
+# `BambuState` fields recorded as transitions, plus the synthetic `hms` (set of active ecodes) and
+# `session` (`PrinterState` name) events
+STATE_EVENTS = ("gcode_state", "current_stage", "spool_state", "active_spool")
+EVENTS = STATE_EVENTS + ("hms", "session")
+
+
+@dataclass(frozen=True)
+class BambuTransition:
+    """
+    A single recorded change of `event` from `old` to `new` at epoch `timestamp` (in seconds).
+    """
+    timestamp: float
+    event: str
+    old: Any
+    new: Any
+
+    def toJson(self) -> dict:
+        return {"timestamp": self.timestamp, "event": self.event, "old": self.old, "new": self.new}
+
+    @classmethod
+    def fromJson(cls, document: dict) -> "BambuTransition":
+        old = document.get("old")
+        new = document.get("new")
+        if document["event"] == "hms":
+            old = tuple(old) if old is not None else None
+            new = tuple(new) if new is not None else None
+        return cls(document["timestamp"], document["event"], old, new)
+
+
+class BambuHistory:
+    """
+    `BambuHistory` keeps the most recent `capacity` transitions in memory, ordered by time and
+    indexed by event, so range queries (`transitions`) and point in time queries (`state_at`) are
+    binary searches rather than scans.
+
+    When the log is full the oldest tenth is evicted in one step.  With a `spill_file` evicted
+    transitions are appended to it (one json document per line) instead of being discarded, and
+    queries that reach back further than memory transparently read the spilled transitions too.
+
+    Every `BambuPrinter` records into its own `history`; assign a new instance to change the
+    capacity or enable spilling.
+
+    Example
+    -------
+    ```py
+    printer.history = BambuHistory(capacity=50000, spill_file=f"/var/lib/bpm/{serial}.history")
+    pauses = printer.history.transitions(start=shift_start, events=("gcode_state",))
+    printer.history.state_at(pauses[-1].timestamp)["hms"]
+    ```
+    """
+    def __init__(self, capacity: Optional[int] = 10000, spill_file: Optional[str] = None):
+        """
+        Sets up all internal storage attributes for `BambuHistory`.
+
+        Parameters
+        ----------
+        * capacity : Optional[int] = 10000 - maximum transitions held in memory
+        * spill_file : Optional[str] = None - file evicted transitions are appended to (discarded if `None`)
+
+        Attributes
+        ----------
+        * _times / _transitions : `PRIVATE` parallel, time ordered lists of all transitions in memory.
+        * _index : `PRIVATE` per event `(times, transitions)` lists.
+        * _spilled : `READ ONLY` the number of transitions written to `spill_file`.
+        """
+        self._capacity = max(int(capacity), 10)
+        self._spill_file = os.path.expanduser(spill_file) if spill_file else None
+        self._lock = threading.Lock()
+        self._times = []
+        self._transitions = []
+        self._index = {}
+        self._spilled = 0
+        self._has_spilled = bool(self._spill_file and os.path.exists(self._spill_file))
+
+    def record(self, timestamp: float, event: str, old: Any, new: Any):
+        """
+        Appends a transition.  Transitions are expected in time order, a `timestamp` older than the
+        latest one recorded is clamped to it.
+        """
+        with self._lock:
+            if self._times and timestamp < self._times[-1]: timestamp = self._times[-1]
+            transition = BambuTransition(timestamp, event, old, new)
+            self._times.append(timestamp)
+            self._transitions.append(transition)
+            times, transitions = self._index.setdefault(event, ([], []))
+            times.append(timestamp)
+            transitions.append(transition)
+            if len(self._transitions) > self._capacity: self._evict()
+
+    def transitions(self, start: Optional[float] = None, end: Optional[float] = None, events: Optional[tuple] = None) -> list:
+        """
+        Returns the `BambuTransition`s with `start <= timestamp <= end` (either bound may be `None`),
+        optionally limited to `events`, in time order.
+        """
+        with self._lock:
+            if events is None:
+                found = self._slice(self._times, self._transitions, start, end)
+            else:
+                found = []
+                for event in events:
+                    if event in self._index:
+                        found.extend(self._slice(*self._index[event], start, end))
+                if len(events) > 1: found.sort(key=lambda transition: transition.timestamp)
+            oldest = self._times[0] if self._times else None
+            has_spilled = self._has_spilled
+
+        if has_spilled and (start is None or oldest is None or start < oldest):
+            found = self._read_spilled(start, end, events) + found
+        return found
+
+    def state_at(self, timestamp: float, events: Optional[tuple] = EVENTS) -> dict:
+        """
+        Returns the value of each event at epoch `timestamp` (the `new` value of its last transition
+        at or before `timestamp`, else the `old` value of its first transition after it, else `None`).
+        """
+        state = {}
+        missing = []
+        with self._lock:
+            for event in events:
+                times, transitions = self._index.get(event, ((), ()))
+                position = bisect.bisect_right(times, timestamp)
+                if position:
+                    state[event] = transitions[position - 1].new
+                    continue
+                if transitions: state[event] = transitions[0].old
+                else: state[event] = None
+                missing.append(event)
+            has_spilled = self._has_spilled
+
+        # the value may have been set by a transition that has since been spilled to disk, which can
+        # be the case for any event without an in memory transition at or before `timestamp` (even
+        # when `timestamp` is inside the window held in memory)
+        if missing and has_spilled:
+            settled = set()
+            for transition in self._read_spilled(None, None, tuple(missing)):
+                if transition.timestamp <= timestamp:
+                    state[transition.event] = transition.new
+                    settled.add(transition.event)
+                elif transition.event not in settled:
+                    state[transition.event] = transition.old
+                    settled.add(transition.event)
+        return state
+
+    def last(self, event: str) -> Optional[BambuTransition]:
+        """
+        Returns the most recent transition of `event` (held in memory) or `None`.
+        """
+        with self._lock:
+            transitions = self._index.get(event, ((), ()))[1]
+            return transitions[-1] if transitions else None
+
+    def clear(self):
+        """
+        Discards all transitions held in memory (the spill file is left as is).
+        """
+        with self._lock:
+            self._times = []
+            self._transitions = []
+            self._index = {}
+
+    def _slice(self, times: list, transitions: list, start: Optional[float], end: Optional[float]) -> list:
+        low = bisect.bisect_left(times, start) if start is not None else 0
+        high = bisect.bisect_right(times, end) if end is not None else len(times)
+        return transitions[low:high]
+
+    def _evict(self):
+        count = max(self._capacity // 10, 1)
+        evicted = self._transitions[:count]
+        del self._times[:count]
+        del self._transitions[:count]
+        # the evicted transitions of each event are always the oldest ones in its index
+        for event, evicted_count in collections.Counter(transition.event for transition in evicted).items():
+            times, transitions = self._index[event]
+            del times[:evicted_count]
+            del transitions[:evicted_count]
+
+        if self._spill_file:
+            try:
+                with open(self._spill_file, "a", encoding="utf-8") as f:
+                    for transition in evicted:
+                        f.write(json.dumps(transition.toJson(), separators=(",", ":")) + "\n")
+                self._spilled += len(evicted)
+                self._has_spilled = True
+            except Exception as e:
+                logger.warning(f"unable to spill history to [{self._spill_file}]: [{e}]")
+
+    def _read_spilled(self, start: Optional[float], end: Optional[float], events: Optional[tuple]) -> list:
+        found = []
+        try:
+            with open(self._spill_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    transition = BambuTransition.fromJson(json.loads(line))
+                    if end is not None and transition.timestamp > end: break
+                    if start is not None and transition.timestamp < start: continue
+                    if events is None or transition.event in events: found.append(transition)
+        except FileNotFoundError:
+            pass
+        return found
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def spill_file(self) -> Optional[str]:
+        return self._spill_file
+
+    @property
+    def spilled(self) -> int:
+        return self._spilled
+
+    def __len__(self):
+        with self._lock:
+            return len(self._transitions)
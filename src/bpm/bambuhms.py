@@ -0,0 +1,246 @@
+"""
+`bambuhms` contains `BambuHMSCatalogue`, the lazily loaded, versioned catalogue of HMS (Health
+Management System) and device error codes used to describe the errors and warnings printers report.
+"""
+import glob
+import json
+import os
+import threading
+import logging
+
+from typing import Optional
+
+from .bambutools import HMSSeverity
+
+logger = logging.getLogger("bambuprinter")
+
+CATALOGUE_FILE = os.path.dirname(os.path.realpath(__file__)) + "/bambuhms.json"
+CATALOGUE_SETS = ("device_hms", "device_error")
+
+
+class BambuHMSCatalogue:
+    """
+    `BambuHMSCatalogue` maps HMS codes (`device_hms`, 16 hex digits) and device error codes
+    (`device_error`, 8 hex digits) to their descriptions in any number of languages.
+
+    Catalogues are json documents in the format the Bambu Lab HMS service returns
+    (`{"ver": ..., "data": {"device_hms": {"ver": ..., "en": [...], "de": [...]}, "device_error": {...}}}`).
+    The packaged catalogue (`bambuhms.json`) is always loaded first, then every `*.json` file in
+    `directory` - for each set and language the entries from the newest `ver` win - so dropping a
+    newer (or translated) catalogue into the directory and calling `reload` (or handing a downloaded
+    document to `install`) updates descriptions without restarting any sessions.
+
+    Nothing is read until the first lookup.  Every load builds a complete, immutable index (by
+    ecode, by module, and by severity) and swaps it in with a single reference assignment, so
+    lookups never take a lock and never see a half built catalogue.
+
+    Example
+    -------
+    ```py
+    catalogue = BambuHMSCatalogue(directory="~/.config/bpm/hms", language="de")
+    catalogue.describe("0300010000010001")
+    catalogue.find(module=0x07, severity=HMSSeverity.FATAL)
+    ```
+    """
+    def __init__(self, file: Optional[str] = CATALOGUE_FILE, directory: Optional[str] = None, language: Optional[str] = "en"):
+        """
+        Sets up all internal storage attributes for `BambuHMSCatalogue`.
+
+        Parameters
+        ----------
+        * file : Optional[str] = CATALOGUE_FILE - the base catalogue json document
+        * directory : Optional[str] = None - directory of additional (newer / translated) catalogue documents
+        * language : Optional[str] = "en" - the default description language (falls back to `en`)
+
+        Attributes
+        ----------
+        * _directory : `READ/WRITE` directory of additional catalogue documents (call `reload` after changing it).
+        * _index : `PRIVATE` the current `_HMSIndex` (built on first lookup, replaced by `reload` / `install`).
+        """
+        self._file = file
+        self._directory = os.path.expanduser(directory) if directory else None
+        self._language = language
+        self._lock = threading.Lock()
+        self._index = None
+
+    def describe(self, ecode: str, language: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the description of an HMS ecode (16 hex digits, see `hmsCode`) or device error code
+        (8 hex digits), or `None` if the code is unknown.
+        """
+        index = self._index or self.reload(force=False)
+        ecode = ecode.upper()
+        language = language or self._language
+        codes = index.hms if len(ecode) == 16 else index.errors
+        entries = codes.get(language) or codes.get("en", {})
+        description = entries.get(ecode)
+        if description is None and language != "en":
+            description = codes.get("en", {}).get(ecode)
+        return description
+
+    def find(self, module: Optional[int] = None, severity: Optional[HMSSeverity] = None, language: Optional[str] = None) -> list:
+        """
+        Returns the `(ecode, description)` of every HMS code for a module (`attr >> 24`, see
+        `hmsModule`), a severity (`code >> 16`, see `hmsSeverity`), or both.
+        """
+        index = self._index or self.reload(force=False)
+        if module is not None and severity is not None:
+            ecodes = index.by_module_severity.get((int(module), _severity(severity)), ())
+        elif module is not None:
+            ecodes = index.by_module.get(int(module), ())
+        elif severity is not None:
+            ecodes = index.by_severity.get(_severity(severity), ())
+        else:
+            ecodes = index.ecodes
+        return [(ecode, self.describe(ecode, language)) for ecode in ecodes]
+
+    def reload(self, force: Optional[bool] = True) -> "_HMSIndex":
+        """
+        Re-reads the catalogue files and atomically swaps in the new index.
+        """
+        with self._lock:
+            if not force and self._index is not None: return self._index
+
+            documents = [self._file] if self._file else []
+            if self._directory: documents.extend(sorted(glob.glob(os.path.join(self._directory, "*.json"))))
+
+            merged = {}
+            for file in documents:
+                try:
+                    with open(file, "r", encoding="utf-8") as f:
+                        _merge(merged, json.load(f))
+                except Exception as e:
+                    logger.warning(f"ignoring unreadable hms catalogue [{file}]: [{e}]")
+
+            self._index = _HMSIndex(merged)
+            logger.debug("loaded hms catalogue", extra={"version": self._index.version, "languages": self._index.languages, "codes": len(self._index.ecodes)})
+            return self._index
+
+    def install(self, document: dict) -> int:
+        """
+        Adds a catalogue document (for example one freshly downloaded from the Bambu Lab HMS service)
+        and swaps in the updated index.  When the catalogue has a `directory` the document is also
+        saved there so it is picked up again on the next start.  Returns the resulting catalogue version.
+        """
+        data = document.get("data", {})
+        if not any(name in data for name in CATALOGUE_SETS):
+            raise Exception("document is not an hms catalogue")
+
+        if self._directory:
+            os.makedirs(self._directory, exist_ok=True)
+            languages = sorted({language for name in CATALOGUE_SETS for language in data.get(name, {}) if language != "ver"})
+            file = os.path.join(self._directory, f"hms_{document.get('ver', 0)}_{'_'.join(languages)}.json")
+            with open(f"{file}.tmp", "w", encoding="utf-8") as f:
+                json.dump(document, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(f"{file}.tmp", file)
+            return self.reload().version
+
+        self._index or self.reload(force=False)
+        with self._lock:
+            merged = dict(self._index.sources)
+            _merge(merged, document)
+            self._index = _HMSIndex(merged)
+            return self._index.version
+
+    @property
+    def version(self) -> int:
+        return (self._index or self.reload(force=False)).version
+
+    @property
+    def languages(self) -> tuple:
+        return (self._index or self.reload(force=False)).languages
+
+    @property
+    def language(self) -> str:
+        return self._language
+    @language.setter
+    def language(self, value: str):
+        self._language = str(value)
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+    @directory.setter
+    def directory(self, value: Optional[str]):
+        self._directory = os.path.expanduser(value) if value else None
+
+    @property
+    def document(self) -> dict:
+        """
+        The raw base catalogue json document.
+        """
+        with open(self._file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+class _HMSIndex:
+    __slots__ = ("sources", "version", "languages", "hms", "errors", "ecodes", "by_module", "by_severity", "by_module_severity")
+
+    def __init__(self, sources: dict):
+        # sources: {(set, language): (ver, entries)}
+        self.sources = sources
+        self.version = max((ver for ver, _ in sources.values()), default=0)
+        self.languages = tuple(sorted({language for _, language in sources}))
+        self.hms = {}
+        self.errors = {}
+        for (name, language), (_, entries) in sources.items():
+            target = self.hms if name == "device_hms" else self.errors
+            target[language] = {entry["ecode"].upper(): entry["intro"] for entry in entries if "ecode" in entry}
+
+        ecodes = set()
+        for entries in self.hms.values(): ecodes.update(entries)
+        self.ecodes = tuple(sorted(ecodes))
+
+        by_module, by_severity, by_module_severity = {}, {}, {}
+        for ecode in self.ecodes:
+            module = hmsModule(int(ecode[:8], 16))
+            severity = hmsSeverity(int(ecode[8:], 16))
+            by_module.setdefault(module, []).append(ecode)
+            by_severity.setdefault(severity, []).append(ecode)
+            by_module_severity.setdefault((module, severity), []).append(ecode)
+        self.by_module = {key: tuple(value) for key, value in by_module.items()}
+        self.by_severity = {key: tuple(value) for key, value in by_severity.items()}
+        self.by_module_severity = {key: tuple(value) for key, value in by_module_severity.items()}
+
+
+def _merge(sources: dict, document: dict):
+    data = document.get("data", {})
+    for name in CATALOGUE_SETS:
+        catalogue = data.get(name)
+        if not catalogue: continue
+        ver = int(catalogue.get("ver", document.get("ver", 0)))
+        for language, entries in catalogue.items():
+            if language == "ver" or not isinstance(entries, list): continue
+            current = sources.get((name, language))
+            if current is None or current[0] <= ver:
+                sources[(name, language)] = (ver, entries)
+
+
+def _severity(severity) -> int:
+    if isinstance(severity, HMSSeverity):
+        return severity.value[0] if isinstance(severity.value, tuple) else severity.value
+    return int(severity)
+
+
+def hmsCode(attr: int, code: int) -> str:
+    """
+    Formats the `attr` and `code` of a reported hms entry as the 16 hex digit ecode used by the catalogue.
+    """
+    return f"{int(attr):08X}{int(code):08X}"
+
+
+def hmsModule(attr: int) -> int:
+    """
+    Returns the module id (the high byte) of a reported hms `attr`.
+    """
+    return (int(attr) >> 24) & 0xFF
+
+
+def hmsSeverity(code: int) -> int:
+    """
+    Returns the severity (the high 16 bits, see `bambutools.HMSSeverity`) of a reported hms `code`.
+    """
+    return (int(code) >> 16) & 0xFFFF
+
+
+HMS_CATALOGUE = BambuHMSCatalogue()
@@ -0,0 +1,117 @@
+"""
+`bambujob` contains the `BambuJob` value object used by `bambuscheduler.BambuScheduler`.
+"""
+import time
+
+from dataclasses import dataclass
+from typing import Optional
+
+from webcolors import name_to_hex
+
+from .bambutools import PlateType, JobStatus
+
+
+@dataclass(eq=False)
+class BambuJob:
+    """
+    A `BambuJob` describes a 3mf file to be printed on any compatible printer in a fleet along with the
+    filament and plate it needs.  The scheduler fills in the tracking attributes as the job moves through
+    its lifecycle.
+
+    Parameters
+    ----------
+    * name : str - path, filename, and extension of the 3mf file on the printer's SDCard
+    * plate : int = 1 - the plate # from your slicer to use
+    * bed : PlateType = PlateType.AUTO - required build plate (`AUTO` matches any printer)
+    * filaments : tuple = () - filaments the job needs, in slicer filament order.  Each entry is either a
+      filament type (`"PLA"`) or a `(type, color)` tuple (`("PLA", "red")`).  Colors are compared against
+      `BambuSpool.color` (a color name or `#RRGGBBAA`).
+    * priority : int = 0 - higher priorities are dispatched first, ties are dispatched in submission order
+    * ams_mapping : Optional[str] = None - explicit `AMS Mapping` (derived from `filaments` when `None`)
+    * bedlevel : bool = True - passed through to `BambuPrinter.print_3mf_file`
+    * flow : bool = True - passed through to `BambuPrinter.print_3mf_file`
+    * timelapse : bool = False - passed through to `BambuPrinter.print_3mf_file`
+    * source : Optional[str] = None - local file the scheduler's `BambuStager` uploads to `name` before the
+      job is printed (`None` when the file is already on the SDCard)
+
+    Attributes
+    ----------
+    * id : int - assigned by the scheduler on submit
+    * status : JobStatus - current lifecycle state
+    * printer : Optional[str] - serial # of the printer the job was dispatched to
+    * enqueued : float - epoch timestamp the job was submitted
+    * dispatched : float - epoch timestamp the job was sent to a printer
+    * started : float - epoch timestamp the printer reported the job as active
+    * finished : float - epoch timestamp the job completed or failed
+    * staged : float - epoch timestamp `source` was verified on the printer's SDCard
+    """
+    name: str
+    plate: int = 1
+    bed: PlateType = PlateType.AUTO
+    filaments: tuple = ()
+    priority: int = 0
+    ams_mapping: Optional[str] = None
+    bedlevel: bool = True
+    flow: bool = True
+    timelapse: bool = False
+    source: Optional[str] = None
+
+    id: int = 0
+    status: JobStatus = JobStatus.QUEUED
+    printer: Optional[str] = None
+    enqueued: float = 0.0
+    dispatched: float = 0.0
+    started: float = 0.0
+    finished: float = 0.0
+    staged: float = 0.0
+
+    @property
+    def requirements(self) -> tuple:
+        """
+        The normalized multiset of `(TYPE, color)` filament requirements (`color` is `None` when any color
+        will do) as a sorted tuple of `((TYPE, color), count)`, so `("PLA", "PLA")` and `("PLA",)` differ.
+        """
+        return tokenCounts(filamentToken(f) for f in self.filaments)
+
+    @property
+    def wait_time(self) -> float:
+        """
+        Seconds spent in the queue (up to now if the job has not been dispatched yet).
+        """
+        if not self.enqueued: return 0.0
+        return (self.dispatched or time.time()) - self.enqueued
+
+
+def filamentToken(filament) -> tuple:
+    """
+    Normalizes a filament requirement (`"PLA"` or `("PLA", "red")`) into a `(TYPE, color)` tuple.
+    """
+    if isinstance(filament, (tuple, list)):
+        type, color = filament[0], filament[1] if len(filament) > 1 else None
+    else:
+        type, color = filament, None
+    return (str(type).upper(), normalizeColor(color) if color else None)
+
+
+def tokenCounts(tokens) -> tuple:
+    """
+    Counts `(TYPE, color)` filament tokens into a sorted tuple of `((TYPE, color), count)`.
+    """
+    counts = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    return tuple(sorted(counts.items(), key=lambda item: (item[0][0], item[0][1] or "")))
+
+
+def normalizeColor(color: str) -> str:
+    """
+    Reduces a color name or hex color code (`#RRGGBB` or `#RRGGBBAA`) to a lower case `#rrggbb`
+    so spool colors and job colors can be compared.
+    """
+    color = str(color).lower()
+    if not color.startswith("#"):
+        try:
+            color = name_to_hex(color)
+        except ValueError:
+            return color
+    return color[:7]
@@ -0,0 +1,181 @@
+"""
+`bambujobstore` contains `BambuJobStore`, a crash-safe `sqlite` backed store for the jobs managed
+by `bambuscheduler.BambuScheduler`.
+"""
+import json
+import sqlite3
+import threading
+import time
+import logging
+
+from typing import Optional
+
+from .bambujob import BambuJob
+from .bambutools import PlateType, JobStatus
+
+logger = logging.getLogger("bambuprinter")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    plate INTEGER NOT NULL,
+    bed TEXT NOT NULL,
+    filaments TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    ams_mapping TEXT,
+    bedlevel INTEGER NOT NULL,
+    flow INTEGER NOT NULL,
+    timelapse INTEGER NOT NULL,
+    source TEXT,
+    status TEXT NOT NULL,
+    printer TEXT,
+    enqueued REAL NOT NULL,
+    dispatched REAL NOT NULL,
+    started REAL NOT NULL,
+    finished REAL NOT NULL,
+    staged REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, priority DESC, id);
+CREATE TABLE IF NOT EXISTS transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    printer TEXT,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transitions_by_job ON transitions (job_id, id);
+"""
+
+COLUMNS = ("id", "name", "plate", "bed", "filaments", "priority", "ams_mapping", "bedlevel", "flow",
+           "timelapse", "source", "status", "printer", "enqueued", "dispatched", "started", "finished", "staged")
+
+
+class BambuJobStore:
+    """
+    `BambuJobStore` persists `BambuJob`s and every transition they go through (queued, dispatched,
+    running / acknowledged, completed, failed, cancelled) to a local `sqlite` database.
+
+    The database runs in write-ahead-log (`WAL`) mode and every transition is committed together with
+    the job's new state in a single transaction, so a crash or restart never loses an acknowledged
+    enqueue or a dispatch.  Pass the store to `BambuScheduler` and it will reload queued jobs and
+    reconcile in-flight jobs against live printer state on startup.
+    """
+    def __init__(self, path: str):
+        """
+        Opens (or creates) the job database.
+
+        Parameters
+        ----------
+        * path : str - the database filename (`":memory:"` can be used for a throw away store)
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit, NORMAL can lose the last transitions on power loss
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(SCHEMA)
+
+    def add(self, job: BambuJob) -> BambuJob:
+        """
+        Durably enqueues a job, assigning its `id`.
+        """
+        return self.add_many((job,))[0]
+
+    def add_many(self, jobs) -> list:
+        """
+        Durably enqueues several jobs in a single transaction, assigning their `id`s.
+        """
+        jobs = list(jobs)
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for job in jobs:
+                    row = _to_row(job)[1:]
+                    cursor = self._db.execute(f"INSERT INTO jobs ({', '.join(COLUMNS[1:])}) VALUES ({', '.join('?' * len(row))})", row)
+                    job.id = cursor.lastrowid
+                    self._db.execute("INSERT INTO transitions (job_id, status, printer, at) VALUES (?, ?, ?, ?)",
+                                     (job.id, job.status.name, job.printer, job.enqueued or time.time()))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return jobs
+
+    def record(self, job: BambuJob):
+        """
+        Durably records a job's current `status` (and tracking attributes) as a transition.
+        """
+        self.record_many((job,))
+
+    def record_many(self, jobs):
+        """
+        Durably records the current `status` of several jobs (in order, a job may appear more than
+        once) as transitions in a single transaction.
+        """
+        rows = [_to_row(job) for job in jobs]
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for row in rows:
+                    self._db.execute(f"UPDATE jobs SET {', '.join(f'{c} = ?' for c in COLUMNS[1:])} WHERE id = ?", row[1:] + (row[0],))
+                    self._db.execute("INSERT INTO transitions (job_id, status, printer, at) VALUES (?, ?, ?, ?)",
+                                     (row[0], row[11], row[12], now))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        logger.debug("job store recorded transitions", extra={"transitions": len(rows)})
+
+    def jobs(self, *statuses: JobStatus) -> list:
+        """
+        Returns the stored jobs with any of the given statuses (all jobs if none are given) in
+        dispatch order (highest priority first, then submission order).
+        """
+        query = f"SELECT {', '.join(COLUMNS)} FROM jobs"
+        params = ()
+        if statuses:
+            query += f" WHERE status IN ({', '.join('?' * len(statuses))})"
+            params = tuple(status.name for status in statuses)
+        query += " ORDER BY priority DESC, id"
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def transitions(self, job: BambuJob) -> list:
+        """
+        Returns the `(status, printer, at)` history of a job, oldest first.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT status, printer, at FROM transitions WHERE job_id = ? ORDER BY id", (job.id,)).fetchall()
+        return [(JobStatus[status], printer, at) for status, printer, at in rows]
+
+    def close(self):
+        """
+        Closes the underlying database connection.
+        """
+        with self._lock:
+            self._db.close()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+
+def _to_row(job: BambuJob) -> tuple:
+    return (job.id, job.name, int(job.plate), job.bed.name, json.dumps([list(f) if isinstance(f, (tuple, list)) else f for f in job.filaments]),
+            int(job.priority), job.ams_mapping, int(job.bedlevel), int(job.flow), int(job.timelapse), job.source,
+            job.status.name, job.printer, job.enqueued, job.dispatched, job.started, job.finished, job.staged)
+
+
+def _from_row(row: tuple) -> BambuJob:
+    (id, name, plate, bed, filaments, priority, ams_mapping, bedlevel, flow, timelapse, source,
+     status, printer, enqueued, dispatched, started, finished, staged) = row
+    return BambuJob(name=name, plate=plate, bed=PlateType[bed],
+                    filaments=tuple(tuple(f) if isinstance(f, list) else f for f in json.loads(filaments)),
+                    priority=priority, ams_mapping=ams_mapping, bedlevel=bool(bedlevel), flow=bool(flow),
+                    timelapse=bool(timelapse), source=source, id=id, status=JobStatus[status], printer=printer,
+                    enqueued=enqueued, dispatched=dispatched, started=started, finished=finished,
+                    staged=staged)
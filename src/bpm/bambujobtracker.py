@@ -0,0 +1,392 @@
+"""
+`bambujobtracker` contains `BambuJobTracker`, which builds an accounting record for every print job
+a printer runs from its status reports and stores the records in a local `sqlite` database.
+"""
+import json
+import sqlite3
+import threading
+import time
+import logging
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .bambustate import BambuState
+from .bambuhms import hmsCode
+
+logger = logging.getLogger("bambuprinter")
+
+ACTIVE_STATES = ("PREPARE", "RUNNING", "PAUSE")
+CLOSED_STATES = ("FINISH", "FAILED")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    serial_number TEXT NOT NULL,
+    subtask_name TEXT,
+    file TEXT,
+    plate INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL,
+    duration REAL NOT NULL DEFAULT 0,
+    pause_seconds REAL NOT NULL DEFAULT 0,
+    layers INTEGER NOT NULL DEFAULT 0,
+    layer_count INTEGER NOT NULL DEFAULT 0,
+    layer_rate REAL NOT NULL DEFAULT 0,
+    peak_bed_temp REAL NOT NULL DEFAULT 0,
+    peak_tool_temp REAL NOT NULL DEFAULT 0,
+    peak_chamber_temp REAL NOT NULL DEFAULT 0,
+    filament_changes INTEGER NOT NULL DEFAULT 0,
+    hms_events INTEGER NOT NULL DEFAULT 0,
+    stages TEXT NOT NULL DEFAULT '{}',
+    hms_codes TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS job_records_by_started ON job_records (started);
+CREATE INDEX IF NOT EXISTS job_records_by_printer ON job_records (serial_number, started);
+CREATE INDEX IF NOT EXISTS job_records_by_status ON job_records (status, started);
+"""
+
+COLUMNS = ("id", "serial_number", "subtask_name", "file", "plate", "status", "started", "ended", "duration",
+           "pause_seconds", "layers", "layer_count", "layer_rate", "peak_bed_temp", "peak_tool_temp",
+           "peak_chamber_temp", "filament_changes", "hms_events", "stages", "hms_codes")
+
+# `summary` groupings mapped to their sql expressions
+GROUPINGS = {
+    "serial_number": "serial_number",
+    "status": "status",
+    "subtask_name": "subtask_name",
+    "day": "date(started, 'unixepoch')",
+}
+
+
+@dataclass(frozen=True)
+class BambuJobRecord:
+    """
+    The accounting record of a single print job.
+
+    `status` is `RUNNING` while the job is open, then the printer's final `gcode_state` (`FINISH`
+    or `FAILED`), or `ABANDONED` if the printer went idle or started another job without reporting
+    either.  Durations are in seconds, `stages` holds the seconds spent in each stage (see
+    `bambutools.parseStage`), and `layer_rate` is layers per hour of (unpaused) printing.
+    """
+    id: int
+    serial_number: str
+    subtask_name: str
+    file: str
+    plate: int
+    status: str
+    started: float
+    ended: Optional[float] = None
+    duration: float = 0.0
+    pause_seconds: float = 0.0
+    layers: int = 0
+    layer_count: int = 0
+    layer_rate: float = 0.0
+    peak_bed_temp: float = 0.0
+    peak_tool_temp: float = 0.0
+    peak_chamber_temp: float = 0.0
+    filament_changes: int = 0
+    hms_events: int = 0
+    stages: dict = field(default_factory=dict)
+    hms_codes: tuple = ()
+
+    def toJson(self) -> dict:
+        document = {column: getattr(self, column) for column in COLUMNS}
+        document["hms_codes"] = list(self.hms_codes)
+        return document
+
+
+class BambuJobTracker:
+    """
+    `BambuJobTracker` opens a record when an attached printer starts a job (its `gcode_state` moves
+    to `PREPARE` / `RUNNING`), accumulates the job's statistics with every report - time per stage,
+    time paused, layers, peak temperatures, spool changes, and newly raised HMS codes - and closes
+    the record when the printer reports `FINISH` or `FAILED`.
+
+    Accumulating happens in memory on the `mqtt` thread at the cost of a few comparisons per report.
+    Records are written when they are opened and closed (and every `flush_interval` seconds while
+    open, so a restart resumes a running job's record instead of starting a new one) to an indexed
+    `sqlite` table, so `records` and `summary` over thousands of jobs are single indexed queries.
+
+    Example
+    -------
+    ```py
+    tracker = BambuJobTracker("/var/lib/bpm/jobs.db")
+    for printer in printers: tracker.attach(printer)
+    tracker.summary(start=time.time() - 7 * 86400, group_by=("serial_number",))
+    ```
+    """
+    def __init__(self, path: Optional[str] = ":memory:", flush_interval: Optional[float] = 60):
+        """
+        Opens (or creates) the job record database.
+
+        Parameters
+        ----------
+        * path : Optional[str] = ":memory:" - the database filename
+        * flush_interval : Optional[float] = 60 - seconds between writes of open records
+
+        Attributes
+        ----------
+        * _open : `PRIVATE` dict of `_OpenJob` accumulators keyed by printer serial #.
+        """
+        self._path = path
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._open = {}
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def attach(self, printer):
+        """
+        Starts tracking the jobs `printer` runs.
+        """
+        printer.job_tracker = self
+
+    def detach(self, printer):
+        """
+        Stops tracking `printer`, writing its open record (if any) as it stands.
+        """
+        if printer.job_tracker is self: printer.job_tracker = None
+        with self._lock:
+            job = self._open.pop(printer.config.serial_number, None)
+            if job: self._write(job)
+
+    def update(self, printer, old: BambuState, new: BambuState):
+        """
+        Folds a state change of `printer` into its open record.  Called by `BambuPrinter` for every
+        report that changed its state.  Reports are ignored while the printer's state is still the
+        `stale` one restored from its checkpoint.
+        """
+        if printer.stale: return
+        now = time.time()
+        serial = printer.config.serial_number
+        with self._lock:
+            job = self._open.get(serial)
+            if job:
+                job.accumulate(old, new, now)
+                switched = new.subtask_name and job.subtask_name and new.subtask_name != job.subtask_name and new.gcode_state in ACTIVE_STATES
+                if new.gcode_state in CLOSED_STATES or new.gcode_state == "IDLE" or switched:
+                    job.status = new.gcode_state if new.gcode_state in CLOSED_STATES else "ABANDONED"
+                    job.ended = now
+                    self._write(job)
+                    del self._open[serial]
+                    logger.debug(f"closed job record [{job.id}] for [{serial}]", extra={"status": job.status})
+                    job = None
+                elif now - job.flushed >= self._flush_interval:
+                    self._write(job)
+
+            if job is None and new.gcode_state in ACTIVE_STATES:
+                self._open[serial] = self._resume(serial, new, now) or self._start(serial, new, now)
+
+    def active(self, serial_number: str) -> Optional[BambuJobRecord]:
+        """
+        Returns the open record of a printer (as it stands) or `None` if it is not running a job.
+        """
+        with self._lock:
+            job = self._open.get(serial_number)
+            return job.record() if job else None
+
+    def records(self,
+                serial_number: Optional[str] = None,
+                start: Optional[float] = None,
+                end: Optional[float] = None,
+                status: Optional[str] = None,
+                limit: Optional[int] = None) -> list:
+        """
+        Returns the stored `BambuJobRecord`s (most recent first) for jobs started between `start`
+        and `end` (epoch seconds), optionally limited to one printer and / or status.
+        """
+        where, params = _filters(serial_number, start, end, status)
+        query = f"SELECT {', '.join(COLUMNS)} FROM job_records{where} ORDER BY started DESC"
+        if limit: query += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def summary(self,
+                serial_number: Optional[str] = None,
+                start: Optional[float] = None,
+                end: Optional[float] = None,
+                group_by: Optional[tuple] = ()) -> list:
+        """
+        Aggregates closed job records (count, finished, failed, total / paused seconds, average
+        layer rate, peak temperatures, spool changes, and HMS events) and returns a `dict` per group.
+        `group_by` may contain `serial_number`, `status`, `subtask_name`, and `day`.
+        """
+        for grouping in group_by:
+            if grouping not in GROUPINGS: raise Exception(f"unable to group job records by [{grouping}]")
+        where, params = _filters(serial_number, start, end, None)
+        where = f"{where} AND ended IS NOT NULL" if where else " WHERE ended IS NOT NULL"
+        groups = [f"{GROUPINGS[grouping]} AS {grouping}" for grouping in group_by]
+        query = (f"SELECT {''.join(group + ', ' for group in groups)}"
+                 "COUNT(*), SUM(status = 'FINISH'), SUM(status = 'FAILED'), TOTAL(duration), TOTAL(pause_seconds), "
+                 "AVG(NULLIF(layer_rate, 0)), MAX(peak_bed_temp), MAX(peak_tool_temp), MAX(peak_chamber_temp), "
+                 f"SUM(filament_changes), SUM(hms_events) FROM job_records{where}")
+        if group_by: query += f" GROUP BY {', '.join(group_by)} ORDER BY {', '.join(group_by)}"
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+
+        names = tuple(group_by) + ("jobs", "finished", "failed", "seconds", "pause_seconds", "layer_rate",
+                                   "peak_bed_temp", "peak_tool_temp", "peak_chamber_temp", "filament_changes", "hms_events")
+        return [dict(zip(names, row)) for row in rows if row[len(group_by)]]
+
+    def close(self):
+        """
+        Writes all open records and closes the database.
+        """
+        with self._lock:
+            for job in self._open.values():
+                self._write(job)
+            self._open = {}
+            self._db.close()
+
+    def _start(self, serial: str, state: BambuState, now: float) -> "_OpenJob":
+        job = _OpenJob(serial, state, now)
+        cursor = self._db.execute("INSERT INTO job_records (serial_number, subtask_name, file, plate, status, started) VALUES (?, ?, ?, ?, ?, ?)",
+                                  (serial, job.subtask_name, job.file, job.plate, job.status, job.started))
+        job.id = cursor.lastrowid
+        job.flushed = now
+        logger.debug(f"opened job record [{job.id}] for [{serial}]", extra={"subtask_name": job.subtask_name})
+        return job
+
+    def _resume(self, serial: str, state: BambuState, now: float) -> Optional["_OpenJob"]:
+        # a record left open by an earlier run is picked up again if the printer is still running that job
+        row = self._db.execute(f"SELECT {', '.join(COLUMNS)} FROM job_records WHERE serial_number = ? AND ended IS NULL ORDER BY started DESC LIMIT 1",
+                               (serial,)).fetchone()
+        if row is None: return None
+        record = _from_row(row)
+        if record.subtask_name != state.subtask_name:
+            self._db.execute("UPDATE job_records SET status = 'ABANDONED', ended = ? WHERE id = ?", (record.started + record.duration, record.id))
+            return None
+        job = _OpenJob(serial, state, now)
+        job.restore(record, now)
+        logger.debug(f"resumed job record [{job.id}] for [{serial}]")
+        return job
+
+    def _write(self, job: "_OpenJob"):
+        record = job.record()
+        row = tuple(getattr(record, column) for column in COLUMNS[1:])
+        row = row[:-2] + (json.dumps(record.stages), json.dumps(list(record.hms_codes)))
+        self._db.execute(f"UPDATE job_records SET {', '.join(f'{c} = ?' for c in COLUMNS[1:])} WHERE id = ?", row + (job.id,))
+        job.flushed = time.time()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+
+class _OpenJob:
+    __slots__ = ("id", "serial_number", "subtask_name", "file", "plate", "status", "started", "ended", "updated",
+                 "flushed", "pause_seconds", "layers", "layer_count", "peak_bed_temp", "peak_tool_temp",
+                 "peak_chamber_temp", "filament_changes", "last_spool", "hms_events", "stages", "hms_codes", "active_hms")
+
+    def __init__(self, serial: str, state: BambuState, now: float):
+        self.id = None
+        self.serial_number = serial
+        self.subtask_name = state.subtask_name
+        self.file = state.current_3mf_file or state.gcode_file
+        self.plate = state.plate_num
+        self.status = "RUNNING"
+        self.started = now
+        self.ended = None
+        self.updated = now
+        self.flushed = now
+        self.pause_seconds = 0.0
+        self.layers = state.current_layer
+        self.layer_count = state.layer_count
+        self.peak_bed_temp = state.bed_temp
+        self.peak_tool_temp = state.tool_temp
+        self.peak_chamber_temp = state.chamber_temp
+        self.filament_changes = 0
+        self.last_spool = state.active_spool if state.active_spool != 255 else None
+        self.stages = {}
+        self.active_hms = _codes(state)
+        self.hms_codes = set(self.active_hms)
+        self.hms_events = len(self.active_hms)
+
+    def accumulate(self, old: BambuState, new: BambuState, now: float):
+        elapsed = now - self.updated
+        self.updated = now
+        if old.gcode_state == "PAUSE":
+            self.pause_seconds += elapsed
+        else:
+            stage = old.current_stage_text or "Unknown"
+            self.stages[stage] = self.stages.get(stage, 0.0) + elapsed
+
+        if new.current_layer > self.layers: self.layers = new.current_layer
+        if new.layer_count: self.layer_count = new.layer_count
+        if new.bed_temp > self.peak_bed_temp: self.peak_bed_temp = new.bed_temp
+        if new.tool_temp > self.peak_tool_temp: self.peak_tool_temp = new.tool_temp
+        if new.chamber_temp > self.peak_chamber_temp: self.peak_chamber_temp = new.chamber_temp
+        if not self.subtask_name and new.subtask_name: self.subtask_name = new.subtask_name
+        if not self.file: self.file = new.current_3mf_file or new.gcode_file
+
+        # an AMS swap reports spool 255 while it unloads and loads, so a change is counted against
+        # the last loaded spool rather than the previous report
+        if new.active_spool != old.active_spool and new.active_spool != 255:
+            if self.last_spool is not None and new.active_spool != self.last_spool: self.filament_changes += 1
+            self.last_spool = new.active_spool
+
+        # `hms_data` is only replaced by reports that carry an hms list, so the active set is never
+        # cleared by a delta report and a code that stays active is counted once
+        if new.hms_data is not old.hms_data and new.hms_data is not None:
+            active = _codes(new)
+            raised = active - self.active_hms
+            self.hms_events += len(raised)
+            self.hms_codes |= raised
+            self.active_hms = active
+
+    def restore(self, record: BambuJobRecord, now: float):
+        for name in ("id", "subtask_name", "file", "plate", "started", "pause_seconds", "filament_changes", "hms_events"):
+            setattr(self, name, getattr(record, name))
+        self.layers = max(self.layers, record.layers)
+        self.layer_count = self.layer_count or record.layer_count
+        self.peak_bed_temp = max(self.peak_bed_temp, record.peak_bed_temp)
+        self.peak_tool_temp = max(self.peak_tool_temp, record.peak_tool_temp)
+        self.peak_chamber_temp = max(self.peak_chamber_temp, record.peak_chamber_temp)
+        self.stages = dict(record.stages)
+        self.hms_codes = set(record.hms_codes) | self.active_hms
+        # the time the tracker was not running is not attributed to any stage
+        self.stages["Untracked"] = self.stages.get("Untracked", 0.0) + max(now - (record.started + record.duration), 0.0)
+
+    def record(self) -> BambuJobRecord:
+        duration = (self.ended or self.updated) - self.started
+        printing = duration - self.pause_seconds
+        return BambuJobRecord(
+            self.id, self.serial_number, self.subtask_name, self.file, self.plate, self.status, self.started,
+            self.ended, duration, self.pause_seconds, self.layers, self.layer_count,
+            self.layers * 3600 / printing if printing > 0 else 0.0,
+            self.peak_bed_temp, self.peak_tool_temp, self.peak_chamber_temp, self.filament_changes,
+            self.hms_events, dict(self.stages), tuple(sorted(self.hms_codes)))
+
+
+def _codes(state: BambuState) -> set:
+    return {hmsCode(hms.get("attr", 0), hms.get("code", 0)) for hms in state.hms_data or ()}
+
+
+def _filters(serial_number: Optional[str], start: Optional[float], end: Optional[float], status: Optional[str]) -> tuple:
+    clauses = []
+    params = []
+    if serial_number is not None:
+        clauses.append("serial_number = ?")
+        params.append(serial_number)
+    if start is not None:
+        clauses.append("started >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("started <= ?")
+        params.append(end)
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status)
+    return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), tuple(params)
+
+
+def _from_row(row: tuple) -> BambuJobRecord:
+    values = dict(zip(COLUMNS, row))
+    values["stages"] = json.loads(values["stages"] or "{}")
+    values["hms_codes"] = tuple(json.loads(values["hms_codes"] or "[]"))
+    return BambuJobRecord(**values)
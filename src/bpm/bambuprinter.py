@@ -11,22 +11,38 @@ import traceback
 import math
 
 from typing import Optional
+from enum import Enum
 
 from .bambucommands import *
 from .bambuspool import BambuSpool
 from .bambutools import PrinterState, PlateType, PrintOption, AMSControlCommand, AMSUserSetting
-from .bambutools import parseStage, parseFan
+from .bambutools import parseStage, parseFan, parseSubtaskName, enumToJson, nextSequenceId
 from .bambuconfig import BambuConfig
+from .bambusubscription import BambuSubscription
+from .bambustate import BambuState
+from .bambuhistory import BambuHistory, STATE_EVENTS
+from .bambu3mf import Bambu3mfInspector
+from .bambuhms import HMS_CATALOGUE, hmsCode, hmsSeverity
+from .bambureconnect import connectFTPS
 
 from .ftpsclient.ftpsclient import IoTFTPSClient
 
 import os
+import re
+import zlib
 import atexit
 import logging.config
 import logging.handlers
 import copy
+import collections
 
 logger = logging.getLogger("bambuprinter")
+
+# report sections whose `push_status` reports are skipped when identical to the previous one (apart
+# from their `sequence_id`, which increments with every report).  Command replies are always parsed.
+DEDUPLICATED_SECTIONS = (b"print",)
+PUSH_STATUS = b'"command":"push_status"'
+REPORT_SEQUENCE_ID = re.compile(rb'"sequence_id":(?:"[^"]*"|\d+),?')
     
 class BambuPrinter:
     """
@@ -48,6 +64,7 @@ class BambuPrinter:
         ----------
         * _mqtt_client_thread: `PRIVATE` Thread handle for the mqtt client thread
         * _watchdog_thread: `PRIVATE` Thread handle for the watchdog thread
+        * _quit_event: `PRIVATE` Set by `quit` to stop the session thread (including any reconnect backoff).
         * _internalExcepton: `READ ONLY` Returns the underlying `Exception` object if a failure occurred.
         * _lastMessageTime: `READ ONLY` Epoch timestamp (in seconds) for the last time an update was received from the printer.
         * _recent_update: `READ ONLY` Indicates that a message from the printer has been recently processed.
@@ -55,6 +72,23 @@ class BambuPrinter:
         * _state: `READ/WRITE` `bambutools.PrinterState` enum reports on health / status of the connection to the printer.
         * _client: `READ ONLY` Provides access to the underlying `paho.mqtt.client` library.
         * _on_update: `READ/WRITE` Callback used for pushing updates.  Includes a self reference to `BambuPrinter` as an argument.
+        * _subscriptions: `PRIVATE` List of `BambuSubscription` objects created by `subscribe`.
+        * _last_payloads: `PRIVATE` The last `push_status` payload (without its `sequence_id`) received for each deduplicated section.
+        * _message_stats: `READ ONLY` Per section counts of received and skipped (duplicate) reports, `skipped / received` is the hit rate.
+        * _inspector: `PRIVATE` `bambu3mf.Bambu3mfInspector` used to slim uploads when one is not supplied.
+        * _upload_stats: `READ ONLY` Totals for `upload_sdcard_file` (uploads, bytes, seconds, bytes_saved, seconds_saved).
+        * _inflight: `PRIVATE` Publish time of each request handed to the `mqtt` client that is not yet sent / acknowledged, keyed by `mid`.
+        * _publish_stats: `READ ONLY` Totals for published, completed, dropped (no connection), and rejected (backpressure) requests along with publish latency.
+        * _history: `READ/WRITE` `bambuhistory.BambuHistory` log of `gcode_state`, `current_stage`, `spool_state`, `active_spool`, HMS, and session state transitions.
+        * _job_tracker: `READ/WRITE` The `bambujobtracker.BambuJobTracker` (if any) that builds accounting records for this printer's jobs.
+        * _report_count: `PRIVATE` The number of reports received from the printer (including skipped duplicates).
+        * _request_acks: `PRIVATE` The expected `command` and the printer's `result` (`None` until acknowledged) for each outstanding request, keyed by `sequence_id`.
+        * _gcode_stats: `READ ONLY` Totals for `stream_gcode` (streams, lines, chunks, bytes, acks, implicit, seconds).
+        * _gcode_acked: `PRIVATE` Indicates the printer has acknowledged a `gcode_line` request, so its firmware is not drained by reports.
+        * _stale: `READ ONLY` Indicates the printer state was restored from `config.state_file` and the printer has not sent a full report yet.
+        * _checkpointed: `PRIVATE` The snapshot most recently written to `config.state_file`.
+        * _checkpoint_time: `PRIVATE` Epoch timestamp (in seconds) of the last checkpoint.
+        * _refresh_after: `PRIVATE` Epoch timestamp (in seconds) before which the session's initial full refresh is held back.
         * _bed_temp: `READ ONLY` The current printer bed temperature.
         * _bed_temp_target: `READ/WRITE` The target bed temperature for the printer.
         * _bed_temp_target_time: `READ ONLY` Epoch timetamp for when target bed temperature was last set.
@@ -95,11 +129,16 @@ class BambuPrinter:
         * _ams_rfid_status `READ ONLY` Bitwise encoded status of the AMS RFID reader (not currently used).
         * _sdcard_contents `READ ONLY` `dict` (json) value of all files on the SDCard (requires `get_sdcard_contents` be called first).
         * _sdcard_3mf_files `READ ONLY` `dict` (json) value of all `.3mf` files on the SDCard (requires `get_sdcard_3mf_files` be called first).
-        * _hms_data `READ ONLY` `dict` (json) value of any active hms codes with descriptions attached if they are known codes.
+        * _hms_data `READ ONLY` tuple of `dict` (json) values of any active hms codes with descriptions attached if they are known codes.
         * _hms_message `READ ONLY` all hms_data `desc` fields concatinated into a single string for ease of use.
         * _print_type `READ ONLY` can be `cloud` or `local`
         * _skipped_objects `READ ONLY` array of objects that have been skipped / cancelled
 
+        All of the printer status attributes above (`_bed_temp` through `_skipped_objects`) are
+        held in an immutable, slotted `bambustate.BambuState` snapshot (`_snapshot`) that is replaced
+        as a whole once per message received from the printer.  Use the `snapshot` property to read
+        several values that must be consistent with each other.
+
         The attributes (where appropriate) are included whenever the class is serialized
         using its `toJson()` method.  
         
@@ -110,6 +149,7 @@ class BambuPrinter:
 
         self._mqtt_client_thread = None
         self._watchdog_thread = None
+        self._quit_event = threading.Event()
 
         self._internalException = None
         self._lastMessageTime = None
@@ -120,62 +160,40 @@ class BambuPrinter:
 
         self._client = None
         self._on_update = None
+        self._subscriptions = []
 
-        self._bed_temp = 0.0
-        self._bed_temp_target = 0.0
-        self._bed_temp_target_time = 0
-
-        self._tool_temp = 0.0
-        self._tool_temp_target = 0.0
-        self._tool_temp_target_time = 0
-
-        self._chamber_temp = 0.0
-        self._chamber_temp_target = 0.0
-        self._chamber_temp_target_time = 0
-
-        self._fan_gear = 0
-        self._heatbreak_fan_speed = 0
-        self._fan_speed = 0
-        self._fan_speed_target = 0
-        self._fan_speed_target_time = 0
-
-        self._light_state = ""
-        self._wifi_signal = ""
-        self._speed_level = 0
-
-        self._gcode_state = ""
-        self._gcode_file = ""
-        self._3mf_file = ""
-        self._plate_num = 0
-        self._subtask_name = ""
-        self._print_type = ""
-        self._percent_complete = 0
-        self._time_remaining = 0
-        self._start_time = 0
-        self._elapsed_time = 0
-        self._layer_count = 0
-        self._current_layer = 0
-        
-        self._current_stage = 0
-        self._current_stage_text = ""
-
-        self._spools = ()
-        self._target_spool = 255
-        self._active_spool = 255
-        self._spool_state = ""
-        self._ams_status = None
-        self._ams_exists = False
-        self._ams_rfid_status = None
+        self._snapshot = BambuState()
+        self._history = BambuHistory()
+        self._job_tracker = None
+        self._state_lock = threading.Lock()
 
         self._sdcard_contents = None
         self._sdcard_3mf_files = None
 
-        self._hms_data = None
-        self._hms_message = ""
-        self._print_type = ""
-        self._skipped_objects = []
+        self._last_payloads = {}
+        self._message_stats = {}
+
+        self._inspector = None
+        self._upload_stats = {"uploads": 0, "bytes": 0, "seconds": 0.0, "bytes_saved": 0, "seconds_saved": 0.0}
+
+        self._inflight = {}
+        self._published_early = {}
+        self._publish_pending = 0
+        self._publish_condition = threading.Condition()
+        self._publish_stats = {"published": 0, "completed": 0, "dropped": 0, "rejected": 0, "latency_total": 0.0, "latency_max": 0.0}
+
+        self._report_count = 0
+        self._request_acks = {}
+        self._ack_condition = threading.Condition()
+        self._gcode_stats = {"streams": 0, "lines": 0, "chunks": 0, "bytes": 0, "acks": 0, "implicit": 0, "seconds": 0.0}
+        self._gcode_acked = False
+
+        self._stale = False
+        self._checkpointed = None
+        self._checkpoint_time = 0.0
+        self._refresh_after = 0.0
 
-    def start_session(self):
+    def start_session(self, wait: Optional[bool] = True):
         """
         Initiates a connection to the Bambu Lab printer and provides a stateful
         session, with built-in recovery in the event `BambuPrinter` 
@@ -183,6 +201,11 @@ class BambuPrinter:
 
         This method is required to be called before any commands or data 
         collection / callbacks can take place with the machine.
+
+        By default the initial connection is made on the caller's thread and a failure ends the
+        session (`QUIT`).  With `wait=False` the method returns immediately and the session thread
+        makes the initial connection, retrying according to `config.reconnect_policy` until it
+        succeeds or `quit` is called - see `bambufleet.BambuFleet.start_sessions`.
         """
         logger.debug("session start_session")
         if self.config.hostname is None or self.config.access_code is None or self.config.serial_number is None:
@@ -204,42 +227,87 @@ class BambuPrinter:
                 raise self._internalException
             if self.state != PrinterState.PAUSED:
                 self.state = PrinterState.DISCONNECTED
+            if self.config.publish_qos == 0:
+                # unsent QoS 0 requests are discarded by paho when the connection drops
+                with self._publish_condition:
+                    self._publish_stats["dropped"] += len(self._inflight)
+                    self._inflight.clear()
+                    self._publish_condition.notify_all()
+        def on_publish(client, userdata, mid, reason_code, properties):
+            with self._publish_condition:
+                sent = self._inflight.pop(mid, None)
+                if sent is None:
+                    # paho can finish a publish before `client.publish` has returned its mid
+                    self._published_early[mid] = time.monotonic()
+                else:
+                    self._record_publish(time.monotonic() - sent)
+                self._publish_condition.notify_all()
         def on_message(client, userdata, msg):
             logger.debug("session on_message", extra={"state": self.state.name})
             if self._lastMessageTime and self._recent_update: self._lastMessageTime = time.time()
+            if self._is_duplicate_payload(msg.payload):
+                self._refresh_elapsed_time()
+                return
             self._on_message(json.loads(msg.payload.decode("utf-8")))
-        def loop_forever(printer):
+        def loop_forever(printer, connected):
             logger.debug("session loop_forever")
+            policy = printer.config.reconnect_policy
             try:
-                printer.client.loop_forever(retry_first_connection=True)            
+                # paho's own reconnect loop is disabled so (re)connects follow the config's reconnect policy
+                if not connected: connected = printer._reconnect(policy, immediate=True)
+                while connected:
+                    printer.client.loop_forever()
+                    if printer._quit_event.is_set() or printer._internalException: break
+
+                    lost = time.monotonic()
+                    connected = printer._reconnect(policy, immediate=False)
+                    if connected: policy.record(time.monotonic() - lost)
             except Exception as e:
                 logger.exception("an internal exception occurred")
                 printer._internalException = e
                 if printer.client and printer.client.is_connected(): printer.client.disconnect() 
             printer.state = PrinterState.QUIT
 
-        self.client =  mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        self._last_payloads = {}
+
+        if self.config.state_file: self._restore_checkpoint()
+
+        # the same printer always lands on the same offset within the stagger window
+        stagger = self.config.refresh_stagger or 0
+        self._refresh_after = time.time() + stagger * zlib.crc32(self.config.serial_number.encode("utf-8")) / 0xFFFFFFFF
+
+        # a quit session can be restarted (the watchdog only runs while the state is not QUIT)
+        self._quit_event.clear()
+        self._internalException = None
+        if self.state == PrinterState.QUIT: self.state = PrinterState.NO_STATE
+        self.client =  mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, reconnect_on_failure=False)
 
         self.client.on_connect = on_connect
         self.client.on_disconnect = on_disconnect
         self.client.on_message = on_message
+        self.client.on_publish = on_publish
 
         self.client.tls_set(tls_version=ssl.PROTOCOL_TLS, cert_reqs=ssl.CERT_NONE)
         self.client.tls_insecure_set(True)
-        self.client.reconnect_delay_set(min_delay=1, max_delay=1)
 
         self.client.username_pw_set(self.config.mqtt_username, password=self.config.access_code)
         self.client.user_data_set(self.config.mqtt_client_id)
+        self.client.connect_timeout = self.config.connect_timeout
 
-        try:
-            self.client.connect(self.config.hostname, self.config.mqtt_port, 60)
-        except Exception as e:
-            self._internalException = e
-            logger.warning(f"unable to connect to printer - reason: {e}", extra={"exception": traceback.format_exc()})
-            self.state = PrinterState.QUIT
-            return
+        if wait:
+            try:
+                with self.config.reconnect_policy.handshake():
+                    self.client.connect(self.config.hostname, self.config.mqtt_port, 60)
+            except Exception as e:
+                self._internalException = e
+                logger.warning(f"unable to connect to printer - reason: {e}", extra={"exception": traceback.format_exc()})
+                self.state = PrinterState.QUIT
+                return
+        else:
+            # only records the connection parameters, the session thread connects
+            self.client.connect_async(self.config.hostname, self.config.mqtt_port, 60)
 
-        self._mqtt_client_thread = threading.Thread(target=loop_forever, name="bambuprinter-session", args=(self,))
+        self._mqtt_client_thread = threading.Thread(target=loop_forever, name="bambuprinter-session", args=(self, wait))
         self._mqtt_client_thread.start()
 
         self._start_watchdog()
@@ -269,10 +337,11 @@ class BambuPrinter:
 
     def quit(self):
         """
-        Shuts down all threads.  Your `BambuPrinter` instance should probably be 
-        considered dead after making this call although you may be able to restart a
-        session with [start_session](./#bpm.bambuprinter.BambuPrinter.start_session)().
+        Shuts down all threads, including those of every subscription (after delivering the final
+        update).  Your `BambuPrinter` instance should probably be considered dead after making
+        this call although you may be able to restart a session (subscribing again) with [start_session](./#bpm.bambuprinter.BambuPrinter.start_session)().
         """
+        self._quit_event.set()
         if self.client and self.client.is_connected():
             self.client.disconnect()
             logger.debug("mqtt client was connected and is now disconnected")
@@ -280,10 +349,15 @@ class BambuPrinter:
             logger.debug("mqtt client was already disconnected")
 
         self._state == PrinterState.QUIT
-        if self.on_update: self.on_update()
+        if self.config.state_file: self.checkpoint()
+        self._notify_update()
 
         if self._mqtt_client_thread.is_alive(): self._mqtt_client_thread.join()
         if self._watchdog_thread.is_alive(): self._watchdog_thread.join()
+
+        subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription.close(drain=True)
         logger.debug("all threads have terminated")
 
     def refresh(self):
@@ -293,15 +367,15 @@ class BambuPrinter:
         """
         if self.state == PrinterState.CONNECTED:
             logger.debug(f"publishing ANNOUNCE_PUSH to [device/{self.config.serial_number}/request]")
-            self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(ANNOUNCE_PUSH))
+            self._publish(ANNOUNCE_PUSH)
             logger.debug(f"publishing ANNOUNCE_VERSION to [device/{self.config.serial_number}/request]")
-            self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(ANNOUNCE_VERSION))
+            self._publish(ANNOUNCE_VERSION)
 
     def unload_filament(self):
         """
         Requests the printer to unload whatever filament / spool may be currently loaded.
         """
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(UNLOAD_FILAMENT))
+        self._publish(UNLOAD_FILAMENT)
         logger.debug(f"published UNLOAD_FILAMENT to [device/{self.config.serial_number}/request]")
 
     def load_filament(self, slot: int):
@@ -320,7 +394,7 @@ class BambuPrinter:
         """
         msg = AMS_FILAMENT_CHANGE
         msg["print"]["target"] = int(slot)
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(msg))
+        self._publish(msg)
         logger.debug(f"published AMS_FILAMENT_CHANGE to [device/{self.config.serial_number}/request]", extra={"target": slot, "bambu_msg": msg})
 
     def send_gcode(self, gcode: str):
@@ -338,9 +412,255 @@ class BambuPrinter:
         """
         cmd = copy.deepcopy(SEND_GCODE_TEMPLATE)
         cmd["print"]["param"] = f"{gcode} \n"
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published SEND_GCODE_TEMPLATE to [device/{self.config.serial_number}/request]", extra={"gcode": gcode})
 
+    def stream_gcode(self,
+                     gcode=None,
+                     chunk_size: Optional[int] = 4096,
+                     chunk_lines: Optional[int] = 64,
+                     window: Optional[int] = 1,
+                     ack_timeout: Optional[float] = 30,
+                     strip_comments: Optional[bool] = True,
+                     ack_grace: Optional[float] = 1.5,
+                     file: Optional[str] = None) -> dict:
+        """
+        Streams a long series of gcode commands (a macro, calibration routine, etc) to the printer
+        with flow control and blocks until the printer has accepted all of it.
+
+        Lines are packed into `gcode_line` requests of at most `chunk_size` bytes and `chunk_lines`
+        lines, each tagged with its own `sequence_id`.  No more than `window` chunks are ever
+        outstanding: the next chunk is only sent once the printer acknowledges an earlier one (by
+        echoing its `sequence_id`).  On firmware that does not acknowledge `gcode_line` requests a
+        chunk is considered drained once a report received more than `ack_grace` seconds after it
+        was sent shows the printer idle (no job active and no `current_stage` such as homing or
+        heating in progress).  A printer that has acknowledged `gcode_line` requests before is always
+        waited on for its acknowledgement.  An exception is raised if the printer rejects a chunk,
+        disconnects, or neither acknowledges a chunk nor reports idle within `ack_timeout` seconds.
+        Idle reports can't tell when the moves of a chunk have finished, so keep `window` at 1 on
+        such firmware.
+
+        Parameters
+        ----------
+        * gcode : str | iterable - a string of newline separated commands, or any iterable (or file object) of lines
+        * chunk_size : Optional[int] = 4096 - maximum payload bytes per request (longer single lines are sent on their own)
+        * chunk_lines : Optional[int] = 64 - maximum lines per request
+        * window : Optional[int] = 1 - maximum number of unacknowledged requests
+        * ack_timeout : Optional[float] = 30 - seconds to wait for each acknowledgement
+        * strip_comments : Optional[bool] = True - drop `;` comments and blank lines before sending
+        * ack_grace : Optional[float] = 1.5 - seconds to wait for an acknowledgement before an idle report drains a chunk
+        * file : Optional[str] = None - path of a gcode file to stream instead of `gcode`
+
+        Returns a `dict` with the `lines`, `chunks`, and `bytes` sent, the number of explicit `acks` and
+        `implicit` (report driven) drains, the elapsed `seconds`, and `lines_per_second`.
+
+        Example
+        -------
+        * `printer.stream_gcode(file="/macros/nozzle_wipe.gcode")`
+        * `printer.stream_gcode(f"G1 X{x} Y{y}" for x, y in points)`
+        """
+        if file is not None:
+            if gcode is not None: raise Exception("stream either gcode or a gcode file, not both")
+            with open(file, "r", encoding="utf-8") as f:
+                return self.stream_gcode(f, chunk_size, chunk_lines, window, ack_timeout, strip_comments, ack_grace)
+        if gcode is None: raise Exception("no gcode to stream")
+        if isinstance(gcode, str):
+            gcode = gcode.splitlines()
+
+        window = max(int(window), 1)
+        result = {"lines": 0, "chunks": 0, "bytes": 0, "acks": 0, "implicit": 0}
+        outstanding = collections.deque()
+        started = time.monotonic()
+
+        try:
+            chunk = []
+            size = 0
+            for line in gcode:
+                if strip_comments: line = line.split(";", 1)[0]
+                line = line.strip()
+                if not line: continue
+                if chunk and (size + len(line) + 1 > chunk_size or len(chunk) >= chunk_lines):
+                    self._send_gcode_chunk(chunk, size, outstanding, window, ack_timeout, ack_grace, result)
+                    chunk = []
+                    size = 0
+                chunk.append(line)
+                size += len(line) + 1
+            if chunk:
+                self._send_gcode_chunk(chunk, size, outstanding, window, ack_timeout, ack_grace, result)
+            self._wait_for_gcode_acks(outstanding, 0, ack_timeout, ack_grace, result)
+        finally:
+            with self._ack_condition:
+                for sequence, _, _ in outstanding:
+                    self._request_acks.pop(sequence, None)
+
+        result["seconds"] = time.monotonic() - started
+        result["lines_per_second"] = result["lines"] / result["seconds"] if result["seconds"] > 0 else 0.0
+
+        with self._ack_condition:
+            self._gcode_stats["streams"] += 1
+            for stat in ("lines", "chunks", "bytes", "acks", "implicit", "seconds"):
+                self._gcode_stats[stat] += result[stat]
+        logger.debug(f"streamed gcode to [{self.config.serial_number}]", extra=result)
+        return result
+
+    def _send_gcode_chunk(self, chunk: list, size: int, outstanding: collections.deque, window: int, ack_timeout: float, ack_grace: float, result: dict):
+        self._wait_for_gcode_acks(outstanding, window - 1, ack_timeout, ack_grace, result)
+
+        sequence = nextSequenceId()
+        self._expect_ack(sequence, "gcode_line")
+        # the report count is taken once the grace period is over (see _wait_for_gcode_acks)
+        outstanding.append([sequence, time.monotonic(), None])
+
+        cmd = copy.deepcopy(SEND_GCODE_TEMPLATE)
+        cmd["print"]["sequence_id"] = sequence
+        cmd["print"]["param"] = "\n".join(chunk) + "\n"
+        self._publish(cmd)
+
+        result["lines"] += len(chunk)
+        result["chunks"] += 1
+        result["bytes"] += size
+
+    def _wait_for_gcode_acks(self, outstanding: collections.deque, limit: int, ack_timeout: float, ack_grace: float, result: dict):
+        with self._ack_condition:
+            while len(outstanding) > limit:
+                sequence, sent, reports = outstanding[0]
+                ack = self._request_acks[sequence][1]
+                if ack is not None:
+                    outstanding.popleft()
+                    del self._request_acks[sequence]
+                    self._gcode_acked = True
+                    if ack != "success":
+                        raise Exception(f"printer rejected gcode chunk [{sequence}]: [{ack}]")
+                    result["acks"] += 1
+                    continue
+
+                if self.state in (PrinterState.DISCONNECTED, PrinterState.QUIT):
+                    raise Exception("printer disconnected while streaming gcode")
+                elapsed = time.monotonic() - sent
+                if elapsed >= ack_grace and not self._gcode_acked:
+                    # only a report received after the grace period can show the chunk was executed
+                    if reports is None:
+                        outstanding[0][2] = self._report_count
+                    elif self._report_count > reports and _gcode_idle(self._snapshot):
+                        # not acknowledging gcode_line requests (older firmware) but done with the chunk
+                        outstanding.popleft()
+                        del self._request_acks[sequence]
+                        result["implicit"] += 1
+                        continue
+                if elapsed < ack_timeout:
+                    # reports are not signalled, so poll for one more often once the grace period is over
+                    self._ack_condition.wait(min(ack_timeout - elapsed, max(ack_grace - elapsed, 0.1), 1.0))
+                else:
+                    raise Exception(f"printer did not acknowledge gcode chunk [{sequence}] within [{ack_timeout}] seconds")
+
+    def publish_request(self, payload: str, sequence_id: Optional[str] = None, command: Optional[str] = None, priority: Optional[bool] = False):
+        """
+        Publishes an already encoded request to the printer.  When `sequence_id` (and the request's
+        `command`) are supplied the printer's acknowledgement is tracked and can be collected with
+        `wait_for_ack`.  `priority` requests never wait for room under `config.max_inflight`, but are
+        still sent in order behind requests already handed to the `mqtt` client.  Mainly
+        used by `bambufleet.BambuFleet` to send the same encoded request to many printers.
+        """
+        if sequence_id is not None: self._expect_ack(sequence_id, command)
+        self._publish(payload, priority)
+
+    def wait_for_ack(self, sequence_id: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Waits for the printer to acknowledge the request published with `sequence_id` and returns
+        its `result` (`"success"`, `"failed"`, ...), or `None` if it was not acknowledged in time.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._ack_condition:
+            try:
+                while True:
+                    ack = self._request_acks.get(sequence_id, (None, None))[1]
+                    if ack is not None: return ack
+                    remaining = deadline - time.monotonic() if deadline is not None else 1.0
+                    if remaining <= 0 or self.state == PrinterState.QUIT: return None
+                    self._ack_condition.wait(min(remaining, 1.0))
+            finally:
+                self._request_acks.pop(sequence_id, None)
+
+    def _reconnect(self, policy, immediate: bool) -> bool:
+        # retries until connected (True) or the session is quit (False)
+        attempt = 0
+        while not self._quit_event.wait(0 if immediate and attempt == 0 else policy.delay(attempt)):
+            try:
+                with policy.handshake():
+                    self.client.reconnect()
+                return True
+            except OSError as e:
+                attempt += 1
+                logger.debug(f"connection attempt [{attempt}] to [{self.config.hostname}] failed: [{e}]")
+        return False
+
+    def _publish(self, request, priority: Optional[bool] = False):
+        # every request to the printer goes through here so in-flight requests can be tracked
+        payload = request if isinstance(request, str) else json.dumps(request)
+        config = self.config
+
+        with self._publish_condition:
+            def has_room():
+                return len(self._inflight) + self._publish_pending < config.max_inflight
+            if not priority and not has_room():
+                # never wait on the mqtt thread, it is the one that drains the queue
+                timeout = 0 if threading.current_thread() is self._mqtt_client_thread else config.publish_timeout
+                if not self._publish_condition.wait_for(has_room, timeout=timeout):
+                    self._publish_stats["rejected"] += 1
+                    raise Exception(f"[{len(self._inflight)}] requests are already in flight to [{config.serial_number}]")
+            self._publish_pending += 1
+
+        sent = time.monotonic()
+        try:
+            info = self.client.publish(f"device/{config.serial_number}/request", payload, qos=config.publish_qos)
+        finally:
+            with self._publish_condition:
+                self._publish_pending -= 1
+
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            if config.publish_qos:
+                # paho keeps a QoS 1 / 2 request it could not send and sends it after reconnecting, a
+                # request reported as failed must never reach the printer later (a requeued job
+                # would be printed twice)
+                with self.client._out_message_mutex:
+                    self.client._out_messages.pop(info.mid, None)
+            with self._publish_condition:
+                self._publish_stats["published"] += 1
+                self._publish_stats["dropped"] += 1
+                self._published_early.pop(info.mid, None)
+                self._publish_condition.notify_all()
+            raise Exception(f"request to [{config.serial_number}] was dropped: [{mqtt.error_string(info.rc)}]")
+
+        with self._publish_condition:
+            self._publish_stats["published"] += 1
+            if info.mid in self._published_early:
+                self._record_publish(self._published_early.pop(info.mid) - sent)
+            else:
+                self._inflight[info.mid] = sent
+            self._publish_condition.notify_all()
+        return info
+
+    def _record_publish(self, latency: float):
+        stats = self._publish_stats
+        stats["completed"] += 1
+        stats["latency_total"] += latency
+        if latency > stats["latency_max"]: stats["latency_max"] = latency
+
+    def _expect_ack(self, sequence_id: str, command: Optional[str]):
+        with self._ack_condition:
+            self._request_acks[sequence_id] = (command, None)
+
+    def _ack_request(self, reply: dict):
+        # push_status reports carry the printer's own sequence_id, only replies to requests are matched
+        command = reply.get("command")
+        if command == "push_status": return
+        with self._ack_condition:
+            sequence = str(reply.get("sequence_id", ""))
+            expected = self._request_acks.get(sequence)
+            if expected and expected[0] in (None, command):
+                self._request_acks[sequence] = (expected[0], str(reply.get("result", "success")).lower())
+                self._ack_condition.notify_all()
+
     def print_3mf_file(self, 
                         name: str, 
                         plate: int,
@@ -376,48 +696,45 @@ class BambuPrinter:
         * `[0,-1,-1,3]`  - use AMS spools #1 and #4
         * `[0,1,2,3]`    - use all 4 AMS spools
         """
-        self._3mf_file = f"{name}"
-        self._plate_num = int(plate)
+        self._update_state(current_3mf_file=f"{name}", plate_num=int(plate))
 
         file = copy.deepcopy(PRINT_3MF_FILE)
 
-        subtask = name[name.rindex("/") + 1::] if "/" in name else name
-        subtask = subtask[::-1].replace(".3mf"[::-1], "", 1)[::-1] if subtask.endswith(".3mf") else subtask 
-        subtask = subtask[::-1].replace(".gcode"[::-1], "", 1)[::-1] if subtask.endswith(".gcode") else subtask 
+        subtask = parseSubtaskName(name)
 
-        file["print"]["file"] = self._3mf_file
-        file["print"]["url"] = f"file:///sdcard{self._3mf_file}"
+        file["print"]["file"] = name
+        file["print"]["url"] = f"file:///sdcard{name}"
         file["print"]["subtask_name"] = subtask
         file["print"]["bed_type"] = bed.name.lower()
-        file["print"]["param"] = file["print"]["param"].replace("#", str(self._plate_num))
+        file["print"]["param"] = file["print"]["param"].replace("#", str(int(plate)))
         file["print"]["use_ams"] = use_ams
         if len(ams_mapping) > 0:
             file["print"]["ams_mapping"] = json.loads(ams_mapping)
         file["print"]["bed_leveling"] = bedlevel
         file["print"]["flow_cali"] = flow
         file["print"]["timelapse"] = timelapse
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(file))
+        self._publish(file)
         logger.debug(f"published PRINT_3MF_FILE to [device/{self.config.serial_number}/request]", extra={"print_command": file})
 
     def stop_printing(self):
         """
         Requests the printer to stop printing if a job is currently running.
         """
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(STOP_PRINT))
+        self._publish(STOP_PRINT, priority=True)
         logger.debug(f"published STOP_PRINT to [device/{self.config.serial_number}/request]")
 
     def pause_printing(self):
         """
         Pauses the current print job if one is running.
         """
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(PAUSE_PRINT))
+        self._publish(PAUSE_PRINT)
         logger.debug(f"published PAUSE_PRINT to [device/{self.config.serial_number}/request]")
 
     def resume_printing(self):
         """
         Resumes the current print job if one is paused.
         """
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(RESUME_PRINT))
+        self._publish(RESUME_PRINT)
         logger.debug(f"published RESUME_PRINT to [device/{self.config.serial_number}/request]")
 
     def get_sdcard_3mf_files(self):
@@ -440,7 +757,7 @@ class BambuPrinter:
         -----
         The return value of this method is very useful for binding to things like a clientside `TreeView`
         """
-        ftps = IoTFTPSClient(self._config.hostname, 990, self._config.mqtt_username, self._config.access_code, ssl_implicit=True)
+        ftps = connectFTPS(self._config)
         fs = self._get_sftp_files(ftps, "/")
         logger.debug("read all sdcard files", extra={"fs": fs})
         self._sdcard_contents = fs
@@ -465,7 +782,7 @@ class BambuPrinter:
         * file : str - the full path filename to be deleted
         """
         logger.debug(f"deleting remote file: [{file}]", extra={"file": file})
-        ftps = IoTFTPSClient(self._config.hostname, 990, self._config.mqtt_username, self._config.access_code, ssl_implicit=True)
+        ftps = connectFTPS(self._config)
         ftps.delete_file(file)
 
         def search_for_and_remove_file(file: str, entry: dict):
@@ -478,7 +795,7 @@ class BambuPrinter:
         search_for_and_remove_file(file, self._sdcard_3mf_files)
         return self._sdcard_contents
 
-    def upload_sdcard_file(self, src: str, dest: str) -> {}:
+    def upload_sdcard_file(self, src: str, dest: str, plate: Optional[int] = None, inspector: Optional[Bambu3mfInspector] = None) -> {}:
         """
         Uploads the local filesystem file to the printer and returns an updated dict of all files on the printer
 
@@ -486,10 +803,35 @@ class BambuPrinter:
         ----------
         * src : str - the full path filename on the host to be uploaded to the printer
         * dest : str - the full path filename on the printer to upload to
+        * plate : Optional[int] = None - when set, `src` (a sliced `.3mf`) is slimmed down to only this plate before it is uploaded
+        * inspector : Optional[Bambu3mfInspector] = None - the inspector (and cache) used for slimming (a shared in memory one if `None`)
+
+        Bytes and (estimated) seconds saved by slimming are accumulated in `upload_stats`.
         """
+        slim = None
+        if plate is not None:
+            if inspector is None:
+                if self._inspector is None: self._inspector = Bambu3mfInspector()
+                inspector = self._inspector
+            slim = inspector.slim(src, plate)
+            src = slim.path
+
         logger.debug(f"uploading file src: [{src}] dest: [{dest}]")
-        ftps = IoTFTPSClient(self._config.hostname, 990, self._config.mqtt_username, self._config.access_code, ssl_implicit=True)
+        ftps = connectFTPS(self._config)
+        started = time.monotonic()
         ftps.upload_file(src, dest)
+        elapsed = time.monotonic() - started
+
+        size = os.path.getsize(src)
+        stats = self._upload_stats
+        stats["uploads"] += 1
+        stats["bytes"] += size
+        stats["seconds"] += elapsed
+        if slim:
+            rate = size / elapsed if elapsed > 0 else 0.0
+            stats["bytes_saved"] += slim.bytes_saved
+            stats["seconds_saved"] += slim.time_saved(rate)
+            logger.debug(f"uploaded slimmed file [{dest}]", extra={"bytes_saved": slim.bytes_saved, "seconds_saved": slim.time_saved(rate)})
         return self.get_sdcard_contents()
 
     def download_sdcard_file(self, src: str, dest: str):
@@ -502,7 +844,7 @@ class BambuPrinter:
         * dest : str - the full path filename on the host to store the downloaded file
         """
         logger.debug(f"downloading file src: [{src}] dest: [{dest}]")
-        ftps = IoTFTPSClient(self._config.hostname, 990, self._config.mqtt_username, self._config.access_code, ssl_implicit=True)
+        ftps = connectFTPS(self._config)
         ftps.download_file(src, dest)
         return 
     
@@ -514,7 +856,7 @@ class BambuPrinter:
         ----------
         * dir : str - the full path directory name to be created
         """
-        ftps = IoTFTPSClient(self._config.hostname, 990, self._config.mqtt_username, self._config.access_code, ssl_implicit=True)
+        ftps = connectFTPS(self._config)
         logger.debug(f"creating remote directory [{dir}]")
         ftps.mkdir(dir)
         return self.get_sdcard_contents()
@@ -528,7 +870,7 @@ class BambuPrinter:
         * src : str - the full path name to be renamed
         * dest : str - the full path name to be renamed to
         """
-        ftps = IoTFTPSClient(self._config.hostname, 990, self._config.mqtt_username, self._config.access_code, ssl_implicit=True)
+        ftps = connectFTPS(self._config)
         logger.debug(f"renaming printer file [{src}] to [{dest}]")
         ftps.move_file(src, dest)
         return self.get_sdcard_contents()
@@ -550,7 +892,7 @@ class BambuPrinter:
         elif option == PrintOption.SOUND_ENABLE:
             self.config.sound_enable = enabled
 
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published PRINT_OPTION_COMMAND to [device/{self.config.serial_number}/request]", extra={"bambu_msg": cmd})
 
     def set_ams_user_setting(self, setting: AMSUserSetting, enabled: bool, ams_id : Optional[int] = 0):
@@ -572,7 +914,7 @@ class BambuPrinter:
         elif setting == AMSUserSetting.CALIBRATE_REMAIN_FLAG:
             self.config.calibrate_remain_flag = enabled
 
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published AMS_USER_SETTING to [device/{self.config.serial_number}/request]", extra={"bambu_msg": cmd})
 
     def set_spool_k_factor(self, 
@@ -597,7 +939,7 @@ class BambuPrinter:
         if max_volumetric_speed != -1:
             cmd["print"]["max_volumetric_speed"] = max_volumetric_speed
         
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published EXTRUSION_CALI_SET to [device/{self.config.serial_number}/request]", extra={"bambu_msg": cmd})
 
     def set_spool_details(self, 
@@ -636,7 +978,7 @@ class BambuPrinter:
         if nozzle_temp_max != -1:
             cmd["print"]["nozzle_temp_max"] = nozzle_temp_max
         
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published AMS_FILAMENT_SETTING to [device/{self.config.serial_number}/request]", extra={"bambu_msg": cmd})
 
     def send_ams_control_command(self, ams_control_cmd : AMSControlCommand):
@@ -647,7 +989,7 @@ class BambuPrinter:
         cmd = copy.deepcopy(AMS_CONTROL)
         cmd["print"]["param"] = ams_cmd
 
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published AMS_CONTROL to [device/{self.config.serial_number}/request]", extra={"bambu_msg": cmd})
 
     def skip_objects(self, objects):
@@ -664,43 +1006,101 @@ class BambuPrinter:
 
         cmd = copy.deepcopy(SKIP_OBJECTS)
         cmd["print"]["obj_list"] = objs
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
         logger.debug(f"published SKIP_OBJECTS to [device/{self.config.serial_number}/request]", extra={"bambu_msg": cmd})
 
 
+    def subscribe(self, callback, max_frequency: Optional[float] = 0) -> BambuSubscription:
+        """
+        Registers a callback that is notified of printer updates on its own thread instead of the
+        mqtt network thread.  Bursts of updates are collapsed so a slow callback only ever sees the
+        latest state, and `max_frequency` caps how often the callback is invoked.
+
+        Parameters
+        ----------
+        * callback : callable - invoked as `callback(printer)`
+        * max_frequency : Optional[float] = 0 - maximum deliveries per second (`0` is unthrottled)
+
+        Example
+        -------
+        * `printer.subscribe(redraw_dashboard, max_frequency=2)` - redraw at most twice a second
+        * `printer.subscribe(advance_queue)` - unthrottled, for job control
+        """
+        subscription = BambuSubscription(self, callback, max_frequency)
+        self._subscriptions = self._subscriptions + [subscription]
+        logger.debug("subscription added", extra={"max_frequency": max_frequency})
+        return subscription
+
+    def unsubscribe(self, subscription: BambuSubscription):
+        """
+        Removes (and closes) a subscription previously returned by `subscribe`.
+        """
+        self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+        subscription.close()
+        logger.debug("subscription removed")
+
     def toJson(self):
         """
         Returns a `dict` (json document) representing this object's private class
-        level attributes that are serializable (most are).
+        level attributes that are serializable (most are).  The printer status 
+        attributes are generated from the `bambustate.STATE_SCHEMA`.
         """
-        response = json.dumps(self, default=self.jsonSerializer, indent=4, sort_keys=True)
-        return json.loads(response)
+        droids = "these are not the droids you are looking for"
+
+        document = self._snapshot.toJson()
+        document.update({
+            "_client": droids if self._client else None,
+            "_config": self._config.toJson() if self._config else None,
+            "_internalException": str(self._internalException) if self._internalException else None,
+            "_lastMessageTime": self._lastMessageTime,
+            "_message_stats": self.message_stats,
+            "_mqtt_client_thread": droids if self._mqtt_client_thread else None,
+            "_on_update": droids if self._on_update else None,
+            "_recent_update": self._recent_update,
+            "_sdcard_3mf_files": self._sdcard_3mf_files,
+            "_sdcard_contents": self._sdcard_contents,
+            "_stale": self._stale,
+            "_state": enumToJson(self._state),
+            "_subscriptions": [droids for _ in self._subscriptions],
+            "_upload_stats": self.upload_stats,
+            "_gcode_stats": self.gcode_stats,
+            "_publish_stats": self.publish_stats,
+            "_watchdog_thread": droids if self._watchdog_thread else None,
+        })
+        return dict(sorted(document.items()))
 
     def jsonSerializer(self, obj):
         """
-        Helper method used by `toJson()` to serialize this object.  
+        Helper method used for serializing this object with `json.dumps(printer, default=printer.jsonSerializer)`.
         """
-        try:
-            if isinstance(obj, mqtt.Client) or isinstance(obj, Thread):
-                return "these are not the droids you are looking for"
-            if str(obj.__class__).replace("<class '", "").replace("'>", "") == "mappingproxy":
-                return "this space intentionally left blank"
-            return obj.__dict__
-        except Exception as e:
-            logger.warn("unable to serialize object", extra={"obj": obj})
-            return "not available"
+        if obj is self:
+            return self.toJson()
+        if isinstance(obj, (BambuState, BambuSpool, BambuConfig)):
+            return obj.toJson()
+        if isinstance(obj, Enum):
+            return enumToJson(obj)
+        if isinstance(obj, mqtt.Client) or isinstance(obj, Thread) or isinstance(obj, BambuSubscription):
+            return "these are not the droids you are looking for"
+        logger.warn("unable to serialize object", extra={"obj": str(obj)})
+        return "not available"
 
 
     def _start_watchdog(self): 
         def watchdog_thread(printer):
             try:
                 while printer.state != PrinterState.QUIT:
-                    if printer.state == PrinterState.CONNECTED and (printer._lastMessageTime is None or printer._lastMessageTime + printer.config.watchdog_timeout < time.time()):
+                    if printer.config.state_file and printer._checkpoint_time + printer.config.checkpoint_interval < time.time():
+                        printer.checkpoint()
+                    if printer.state == PrinterState.CONNECTED and ((printer._lastMessageTime is None and printer._refresh_after <= time.time()) or 
+                                                                    (printer._lastMessageTime is not None and printer._lastMessageTime + printer.config.watchdog_timeout < time.time())):
                         if printer._lastMessageTime: logger.warn("BambuPrinter watchdog timeout")
                         printer._lastMessageTime = time.time()
                         printer._recent_update = False
-                        printer.client.publish(f"device/{printer.config.serial_number}/request", json.dumps(ANNOUNCE_PUSH))
-                        printer.client.publish(f"device/{printer.config.serial_number}/request", json.dumps(ANNOUNCE_VERSION))
+                        try:
+                            printer._publish(ANNOUNCE_PUSH, priority=True)
+                            printer._publish(ANNOUNCE_VERSION, priority=True)
+                        except Exception as e:
+                            logger.warning(f"watchdog unable to request a full refresh: [{e}]")
                     time.sleep(.1)
             except Exception as e:
                 logger.exception("an internal exception occurred")
@@ -710,215 +1110,353 @@ class BambuPrinter:
         self._watchdog_thread = threading.Thread(target=watchdog_thread, name="bambuprinter-session-watchdog", args=(self,))
         self._watchdog_thread.start()
 
+    def checkpoint(self):
+        """
+        Writes the current printer state (and the firmware versions reported by the printer) to
+        `config.state_file` if it changed since the last checkpoint.  This is called periodically
+        (every `config.checkpoint_interval` seconds) and when the session quits.
+        """
+        self._checkpoint_time = time.time()
+        snapshot = self._snapshot
+        if snapshot is self._checkpointed or self._stale: return
+
+        document = {
+            "version": 1,
+            "serial_number": self.config.serial_number,
+            "saved": self._checkpoint_time,
+            "config": {
+                "firmware_version": self.config.firmware_version,
+                "ams_firmware_version": self.config.ams_firmware_version,
+                "printer_model": self.config.printer_model.name,
+            },
+            "state": snapshot.toJson(),
+        }
+        temp = f"{self.config.state_file}.tmp"
+        try:
+            with open(temp, "w") as f:
+                json.dump(document, f)
+            os.replace(temp, self.config.state_file)
+            self._checkpointed = snapshot
+            logger.debug(f"checkpointed printer state to [{self.config.state_file}]")
+        except Exception as e:
+            logger.warning(f"unable to checkpoint printer state to [{self.config.state_file}]: [{e}]")
+
+    def _restore_checkpoint(self):
+        try:
+            with open(self.config.state_file, "r") as f:
+                document = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"ignoring unreadable printer state checkpoint [{self.config.state_file}]: [{e}]")
+            return
+        if document.get("version") != 1 or document.get("serial_number") != self.config.serial_number:
+            logger.warning(f"ignoring printer state checkpoint [{self.config.state_file}] for a different printer")
+            return
+
+        self.config.firmware_version = document["config"]["firmware_version"]
+        self.config.ams_firmware_version = document["config"]["ams_firmware_version"]
+        self._snapshot = BambuState.fromJson(document["state"])
+        self._checkpointed = self._snapshot
+        self._stale = True
+        # subscribers are not notified, the restored state only becomes live with the printer's first full report
+        logger.debug(f"restored printer state from [{self.config.state_file}]", extra={"saved": document.get("saved")})
+
     def _on_message(self, message: str):
         logger.debug("_on_message", extra={"bambu_msg": message})
 
-        if "system" in message:
-            system = message["system"]
+        refresh = False
 
-        elif "print" in message:
-            status = message["print"]
+        with self._state_lock:
+            state = self._snapshot
+            changes = {}
 
-            if "command" in status and status["command"] == "project_file":
-                self._start_time = 0
-                if self._3mf_file:
-                    logger.debug("project_file request acknowledged")
-                else:
-                    url = status["url"]                   
-                    subtask = status["subtask_name"]
-                    if url.startswith("https://"):
-                        self._3mf_file = f"/cache/{subtask}.3mf"
+            if "system" in message:
+                system = message["system"]
+                if "sequence_id" in system: self._ack_request(system)
+
+            elif "print" in message:
+                status = message["print"]
+
+                # a full status report (msg 0) confirms state restored from a checkpoint
+                if self._stale and status.get("command") == "push_status" and status.get("msg", 0) == 0:
+                    self._stale = False
+
+                if "sequence_id" in status: self._ack_request(status)
+
+                if "command" in status and status["command"] == "project_file":
+                    changes["start_time"] = 0
+                    if state.current_3mf_file:
+                        logger.debug("project_file request acknowledged")
                     else:
-                        self._3mf_file = status["file"]
-
-            # let's sleep for a couple seconds and do a full refresh
-            if "command" in status and status["command"] == "ams_filament_setting":
-                time.sleep(2)
-                logger.debug(f"filament change triggered publishing ANNOUNCE_PUSH to [device/{self.config.serial_number}/request]")
-                self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(ANNOUNCE_PUSH))
-
-            if "bed_temper" in status: self._bed_temp = float(status["bed_temper"])
-            if "bed_target_temper" in status: 
-                bed_temp_target = float(status["bed_target_temper"]) 
-                if bed_temp_target != self._bed_temp_target:
-                    self._bed_temp_target = bed_temp_target
-                    self._bed_temp_target_time = round(time.time())
-
-            if "nozzle_temper" in status: self._tool_temp = float(status["nozzle_temper"])
-            if "nozzle_target_temper" in status: 
-                tool_temp_target = float(status["nozzle_target_temper"])
-                if tool_temp_target != self._tool_temp_target:
-                    self._tool_temp_target = tool_temp_target
-                    self._tool_temp_target_time = round(time.time())
-
-            if not self._config.external_chamber and "chamber_temper" in status: self._chamber_temp = float(status["chamber_temper"])
-
-            if "fan_gear" in status: self._fan_gear = int(status["fan_gear"])
-            if "heatbreak_fan_speed" in status: self._heatbreak_fan_speed = int(status["heatbreak_fan_speed"])
-            if "cooling_fan_speed" in status: self._fan_speed = parseFan(int(status["cooling_fan_speed"]))
-
-            if "wifi_signal" in status: self._wifi_signal = status["wifi_signal"] 
-            if "lights_report" in status: self._light_state = (status["lights_report"])[0]["mode"]
-            if "spd_lvl" in status: self._speed_level = status["spd_lvl"]
-
-            if "gcode_state" in status: 
-                self._gcode_state = status["gcode_state"]
-                if self._gcode_state in ("FINISH", "FAILED") and self._3mf_file:
-                    self._3mf_file = ""
-
-            if "subtask_name" in status: self._subtask_name = status["subtask_name"]
-            if "gcode_file" in status: self._gcode_file = status["gcode_file"]
-            if "print_type" in status: self._print_type = status["print_type"]
-            if "mc_percent" in status: self._percent_complete = status["mc_percent"]
-            if "mc_remaining_time" in status: self._time_remaining = int(status["mc_remaining_time"])
-            if "total_layer_num" in status: self._layer_count = status["total_layer_num"]
-            if "layer_num" in status: self._current_layer = status["layer_num"]
-            
-            if "stg_cur" in status: 
-                self._current_stage = int(status["stg_cur"])
-                self._current_stage_text = parseStage(self._current_stage)
-
-            if "ams_status" in status: self._ams_status = status["ams_status"]
-            if "ams_rfid_status" in status: self._ams_rfid_status = status["ams_rfid_status"]
-
-            if "ams" in status and "ams" in status["ams"] and "ams_exist_bits" in status["ams"]:
-                self._ams_exists = int(status["ams"]["ams_exist_bits"]) == 1
-                if self._ams_exists:
-                    spools = []
-                    ams = (status["ams"]["ams"])[0]
-
-                    self.config.startup_read_option = status["ams"].get("power_on_flag", False)
-                    self.config.tray_read_option = status["ams"].get("insert_flag", False)
-
-                    for tray in ams["tray"]:
-                        try:
-                            tray_color = hex_to_name("#" + tray["tray_color"][:6])
-                        except:
+                        url = status["url"]                   
+                        subtask = status["subtask_name"]
+                        if url.startswith("https://"):
+                            changes["current_3mf_file"] = f"/cache/{subtask}.3mf"
+                        else:
+                            changes["current_3mf_file"] = status["file"]
+
+                # let's sleep for a couple seconds and do a full refresh (once the new state is in place)
+                if "command" in status and status["command"] == "ams_filament_setting":
+                    refresh = True
+
+                if "bed_temper" in status: changes["bed_temp"] = float(status["bed_temper"])
+                if "bed_target_temper" in status: 
+                    bed_temp_target = float(status["bed_target_temper"]) 
+                    if bed_temp_target != state.bed_temp_target:
+                        changes["bed_temp_target"] = bed_temp_target
+                        changes["bed_temp_target_time"] = round(time.time())
+
+                if "nozzle_temper" in status: changes["tool_temp"] = float(status["nozzle_temper"])
+                if "nozzle_target_temper" in status: 
+                    tool_temp_target = float(status["nozzle_target_temper"])
+                    if tool_temp_target != state.tool_temp_target:
+                        changes["tool_temp_target"] = tool_temp_target
+                        changes["tool_temp_target_time"] = round(time.time())
+
+                if not self._config.external_chamber and "chamber_temper" in status: changes["chamber_temp"] = float(status["chamber_temper"])
+
+                if "fan_gear" in status: changes["fan_gear"] = int(status["fan_gear"])
+                if "heatbreak_fan_speed" in status: changes["heatbreak_fan_speed"] = int(status["heatbreak_fan_speed"])
+                if "cooling_fan_speed" in status: changes["fan_speed"] = parseFan(int(status["cooling_fan_speed"]))
+
+                if "wifi_signal" in status: changes["wifi_signal"] = status["wifi_signal"] 
+                if "lights_report" in status: changes["light_state"] = (status["lights_report"])[0]["mode"]
+                if "spd_lvl" in status: changes["speed_level"] = status["spd_lvl"]
+
+                if "gcode_state" in status: 
+                    changes["gcode_state"] = status["gcode_state"]
+                    if changes["gcode_state"] in ("FINISH", "FAILED") and changes.get("current_3mf_file", state.current_3mf_file):
+                        changes["current_3mf_file"] = ""
+
+                if "subtask_name" in status: changes["subtask_name"] = status["subtask_name"]
+                if "gcode_file" in status: changes["gcode_file"] = status["gcode_file"]
+                if "print_type" in status: changes["print_type"] = status["print_type"]
+                if "mc_percent" in status: changes["percent_complete"] = status["mc_percent"]
+                if "mc_remaining_time" in status: changes["time_remaining"] = int(status["mc_remaining_time"])
+                if "total_layer_num" in status: changes["layer_count"] = status["total_layer_num"]
+                if "layer_num" in status: changes["current_layer"] = status["layer_num"]
+                
+                if "stg_cur" in status: 
+                    changes["current_stage"] = int(status["stg_cur"])
+                    changes["current_stage_text"] = parseStage(changes["current_stage"])
+
+                if "ams_status" in status: changes["ams_status"] = status["ams_status"]
+                if "ams_rfid_status" in status: changes["ams_rfid_status"] = status["ams_rfid_status"]
+
+                if "ams" in status and "ams" in status["ams"] and "ams_exist_bits" in status["ams"]:
+                    changes["ams_exists"] = int(status["ams"]["ams_exist_bits"]) == 1
+                    if changes["ams_exists"]:
+                        spools = []
+                        ams = (status["ams"]["ams"])[0]
+
+                        self.config.startup_read_option = status["ams"].get("power_on_flag", False)
+                        self.config.tray_read_option = status["ams"].get("insert_flag", False)
+
+                        for tray in ams["tray"]:
                             try:
-                                tray_color = "#" + tray["tray_color"]
+                                tray_color = hex_to_name("#" + tray["tray_color"][:6])
                             except:
-                                tray_color = ""
-                        
-                        if tray.get("id"):
-                            spool = BambuSpool( 
-                                                int(tray["id"]),  
-                                                tray.get("tray_id_name", ""),  
-                                                tray.get("tray_type", ""), 
-                                                tray.get("tray_sub_brands", ""), 
-                                                tray_color,
-                                                tray.get("tray_info_idx", ""),
-                                                tray.get("k", 0.0),
-                                                tray.get("bed_temp", 0),
-                                                tray.get("nozzle_temp_min", 0),
-                                                tray.get("nozzle_temp_max", 0) 
-                                              )
-                            spools.append(spool)
-                    self._spools = tuple(spools)
-
-            if "vt_tray" in status:
-                tray = status["vt_tray"]
-                try:
-                    tray_color = hex_to_name("#" + tray["tray_color"][:6])
-                except:
+                                try:
+                                    tray_color = "#" + tray["tray_color"]
+                                except:
+                                    tray_color = ""
+                            
+                            if tray.get("id"):
+                                spool = BambuSpool( 
+                                                    int(tray["id"]),  
+                                                    tray.get("tray_id_name", ""),  
+                                                    tray.get("tray_type", ""), 
+                                                    tray.get("tray_sub_brands", ""), 
+                                                    tray_color,
+                                                    tray.get("tray_info_idx", ""),
+                                                    tray.get("k", 0.0),
+                                                    tray.get("bed_temp", 0),
+                                                    tray.get("nozzle_temp_min", 0),
+                                                    tray.get("nozzle_temp_max", 0) 
+                                                  )
+                                spools.append(spool)
+                        changes["spools"] = tuple(spools)
+
+                if "vt_tray" in status:
+                    tray = status["vt_tray"]
                     try:
-                        tray_color = "#" + tray["tray_color"]
+                        tray_color = hex_to_name("#" + tray["tray_color"][:6])
                     except:
-                        tray_color = ""
-
-                if tray.get("id", None):
-                    spool = BambuSpool( 
-                                        int(tray.get("id")), 
-                                        tray.get("tray_id_name", ""),
-                                        tray.get("tray_type", ""),
-                                        tray.get("tray_sub_brands", ""),
-                                        tray_color,
-                                        tray.get("tray_info_idx", ""),
-                                        tray.get("k", 0.0),
-                                        tray.get("bed_temp", 0),
-                                        tray.get("nozzle_temp_min", 0),
-                                        tray.get("nozzle_temp_max", 0)
-                                      )
-                    if not self._ams_exists: 
-                        spools = (spool,)
+                        try:
+                            tray_color = "#" + tray["tray_color"]
+                        except:
+                            tray_color = ""
+
+                    if tray.get("id", None):
+                        spool = BambuSpool( 
+                                            int(tray.get("id")), 
+                                            tray.get("tray_id_name", ""),
+                                            tray.get("tray_type", ""),
+                                            tray.get("tray_sub_brands", ""),
+                                            tray_color,
+                                            tray.get("tray_info_idx", ""),
+                                            tray.get("k", 0.0),
+                                            tray.get("bed_temp", 0),
+                                            tray.get("nozzle_temp_min", 0),
+                                            tray.get("nozzle_temp_max", 0)
+                                          )
+                        if not changes.get("ams_exists", state.ams_exists): 
+                            spools = (spool,)
+                        else:
+                            spools = list(changes.get("spools", state.spools))
+                            spools.append(spool)
+
+                        changes["spools"] = tuple(spools)
+
+                tray_tar = None
+                tray_now = None
+                tray_pre = None
+
+                if "ams" in status and "tray_tar" in status["ams"]:
+                    tray_tar = int(status["ams"]["tray_tar"])
+                    changes["target_spool"] = tray_tar
+
+                if "ams" in status and "tray_now" in status["ams"]:
+                    tray_now = int(status["ams"]["tray_now"])
+                    changes["active_spool"] = tray_now
+
+                if "ams" in status and "tray_pre" in status["ams"]:
+                    tray_pre = int(status["ams"]["tray_pre"])
+
+                if not tray_tar is None or not tray_now is None or not tray_pre is None:
+                    target_spool = changes.get("target_spool", state.target_spool)
+                    active_spool = changes.get("active_spool", state.active_spool)
+                    if target_spool == 255 and active_spool == 255:
+                        changes["spool_state"] = "Unloaded"
+                    elif target_spool == 255 and active_spool != 255:
+                        changes["spool_state"] = "Unloading"
+                    elif active_spool != 255 and target_spool != 255 and target_spool != active_spool:
+                        changes["spool_state"] = "Unloading"
+                    elif target_spool != 255 and active_spool == 255:
+                        changes["spool_state"] = "Loading"
                     else:
-                        spools = list(self.spools)
-                        spools.append(spool)
-
-                    self._spools = tuple(spools)
-
-            tray_tar = None
-            tray_now = None
-            tray_pre = None
-
-            if "ams" in status and "tray_tar" in status["ams"]:
-                tray_tar = int(status["ams"]["tray_tar"])
-                self._target_spool = tray_tar
-
-            if "ams" in status and "tray_now" in status["ams"]:
-                tray_now = int(status["ams"]["tray_now"])
-                self._active_spool = tray_now
-
-            if "ams" in status and "tray_pre" in status["ams"]:
-                tray_pre = int(status["ams"]["tray_pre"])
-
-            if not tray_tar is None or not tray_now is None or not tray_pre is None:
-                if self._target_spool == 255 and self._active_spool == 255:
-                    self._spool_state = "Unloaded"
-                elif self._target_spool == 255 and self._active_spool != 255:
-                    self._spool_state = "Unloading"
-                elif self._active_spool != 255 and self._target_spool != 255 and self._target_spool != self._active_spool:
-                    self._spool_state = "Unloading"
-                elif self._target_spool != 255 and self._active_spool == 255:
-                    self._spool_state = "Loading"
-                else:
-                    self._spool_state = "Loaded"
-
-            self._hms_data = status.get("hms", [])
-            self._hms_message = ""
- 
-            for hms in self._hms_data:
-                hms_attr = hex(hms.get("attr", 0))[2:].zfill(8).upper()
-                hms_code = hex(hms.get("code", 0))[2:].zfill(8).upper()
-                for entry in HMS_STATUS["data"]["device_hms"]["en"]:
-                    if entry["ecode"] == f"{hms_attr}{hms_code}":
-                        hms["desc"] = entry["intro"]
-                        self._hms_message = f"{self._hms_message}{entry['intro']} "
-                        break
-
-            self._hms_message = self._hms_message.rstrip()
-
-            if "home_flag" in status:
-                flag = int(status["home_flag"])
-                self.config.sound_enable = (flag >> 17) & 0x1 != 0
-                self.config.auto_recovery = (flag >> 4) & 0x1 != 0
-                self.config.auto_switch_filament = (flag >> 10) & 0x1 != 0
-                self.config.filament_tangle_detect = (flag >> 20) & 0x1 != 0
-                self.config.calibrate_remain_flag = (flag >> 7) & 0x1 != 0
-
-            if "print_type" in status:
-                self._print_type = status["print_type"]
-
-            if "s_obj" in status:
-                self._skipped_objects = status["s_obj"]
-
-
-        elif "info" in message and "result" in message["info"] and message["info"]["result"] == "success": 
-            self._recent_update = True
-            info = message["info"]
-            for module in info["module"]:
-                if "ota" in module["name"]: 
-                    self.config.serial_number = module["sn"]
-                    self.config.firmware_version = module["sw_ver"]
-                if "ams" in module["name"]:
-                    self.config.ams_firmware_version = module["sw_ver"]
-        else:
-            logger.warn("unknown message type received")
-            
-        if self._gcode_state in ("PREPARE", "RUNNING", "PAUSE"):
-            if (self._start_time == 0): self._start_time = int(round(time.time() / 60, 0))
-            self._elapsed_time = int(round(time.time() / 60, 0)) - self._start_time
+                        changes["spool_state"] = "Loaded"
+
+                # delta reports and command replies carry no hms list, only a report with one changes it
+                if "hms" in status:
+                    # snapshots hold copies so they never share (mutable) dicts with the payload
+                    hms_data = tuple(dict(hms) for hms in status["hms"])
+                    hms_message = ""
+
+                    for hms in hms_data:
+                        hms["severity"] = hmsSeverity(hms.get("code", 0))
+                        desc = HMS_CATALOGUE.describe(hmsCode(hms.get("attr", 0), hms.get("code", 0)))
+                        if desc:
+                            hms["desc"] = desc
+                            hms_message = f"{hms_message}{desc} "
+
+                    changes["hms_data"] = hms_data
+                    changes["hms_message"] = hms_message.rstrip()
+
+                if "home_flag" in status:
+                    flag = int(status["home_flag"])
+                    self.config.sound_enable = (flag >> 17) & 0x1 != 0
+                    self.config.auto_recovery = (flag >> 4) & 0x1 != 0
+                    self.config.auto_switch_filament = (flag >> 10) & 0x1 != 0
+                    self.config.filament_tangle_detect = (flag >> 20) & 0x1 != 0
+                    self.config.calibrate_remain_flag = (flag >> 7) & 0x1 != 0
+
+                if "s_obj" in status:
+                    changes["skipped_objects"] = tuple(status["s_obj"])
+
+
+            elif "info" in message and "result" in message["info"] and message["info"]["result"] == "success": 
+                self._recent_update = True
+                info = message["info"]
+                for module in info["module"]:
+                    if "ota" in module["name"]: 
+                        self.config.serial_number = module["sn"]
+                        self.config.firmware_version = module["sw_ver"]
+                    if "ams" in module["name"]:
+                        self.config.ams_firmware_version = module["sw_ver"]
+            else:
+                logger.warn("unknown message type received")
+                
+            if changes.get("gcode_state", state.gcode_state) in ("PREPARE", "RUNNING", "PAUSE"):
+                start_time = changes.get("start_time", state.start_time)
+                if (start_time == 0): changes["start_time"] = start_time = int(round(time.time() / 60, 0))
+                changes["elapsed_time"] = int(round(time.time() / 60, 0)) - start_time
 
+            # a single reference assignment publishes the new state to all readers
+            self._snapshot = state.evolve(**changes)
+
+            if changes: self._record_transitions(state, changes)
+
+        tracker = self._job_tracker
+        if tracker and changes:
+            try:
+                tracker.update(self, state, self._snapshot)
+            except Exception:
+                logger.exception("job tracker update failed")
+
+        if refresh:
+            time.sleep(2)
+            logger.debug(f"filament change triggered publishing ANNOUNCE_PUSH to [device/{self.config.serial_number}/request]")
+            try:
+                self._publish(ANNOUNCE_PUSH, priority=True)
+            except Exception as e:
+                logger.warning(f"unable to request a full refresh after a filament change: [{e}]")
+
+        self._notify_update()
+
+    def _is_duplicate_payload(self, payload: bytes) -> bool:
+        # reports are compact json so the section is the first key (e.g. b'{"print":{...')
+        section = payload[2:payload.find(b'"', 2)] if payload[:2] == b'{"' else b""
+        name = section.decode("utf-8", "replace")
+
+        stats = self._message_stats.get(name)
+        if stats is None:
+            stats = self._message_stats[name] = {"received": 0, "skipped": 0}
+        stats["received"] += 1
+        self._report_count += 1
+
+        # `info` replies drive the watchdog's liveness check and command replies carry acknowledgements,
+        # so only status reports are ever skipped
+        if section not in DEDUPLICATED_SECTIONS or PUSH_STATUS not in payload:
+            return False
+
+        key = REPORT_SEQUENCE_ID.sub(b"", payload)
+        if self._last_payloads.get(section) == key:
+            stats["skipped"] += 1
+            return True
+
+        self._last_payloads[section] = key
+        return False
+
+    def _refresh_elapsed_time(self):
+        # a skipped report changes nothing but the time derived fields
+        with self._state_lock:
+            state = self._snapshot
+            if state.gcode_state not in ("PREPARE", "RUNNING", "PAUSE") or not state.start_time: return
+            elapsed_time = int(round(time.time() / 60, 0)) - state.start_time
+            if elapsed_time == state.elapsed_time: return
+            self._snapshot = state.evolve(elapsed_time=elapsed_time)
+        self._notify_update()
+
+    def _record_transitions(self, state: BambuState, changes: dict):
+        now = time.time()
+        for event in STATE_EVENTS:
+            if event in changes and changes[event] != getattr(state, event):
+                self._history.record(now, event, getattr(state, event), changes[event])
+        if "hms_data" in changes:
+            old = _hms_codes(state.hms_data)
+            new = _hms_codes(changes["hms_data"])
+            if old != new: self._history.record(now, "hms", old, new)
+
+    def _update_state(self, **changes):
+        with self._state_lock:
+            self._snapshot = self._snapshot.evolve(**changes)
+
+    def _notify_update(self):
         if self.on_update: self.on_update()
+        for subscription in self._subscriptions:
+            subscription.notify()
 
     def _get_sftp_files(self, ftps: IoTFTPSClient, directory: str, mask: Optional[str] = None):
         try:
@@ -962,6 +1500,7 @@ class BambuPrinter:
         return self._state
     @state.setter 
     def state(self, value: PrinterState):
+        if value != self._state: self._history.record(time.time(), "session", self._state.name, value.name)
         self._state = value
 
     @property 
@@ -978,103 +1517,153 @@ class BambuPrinter:
     def on_update(self, value):
         self._on_update = value
 
+    @property 
+    def stale(self) -> bool:
+        return self._stale
+
+    @property 
+    def upload_stats(self) -> dict:
+        return dict(self._upload_stats)
+
+    @property
+    def publish_inflight(self) -> int:
+        with self._publish_condition:
+            return len(self._inflight) + self._publish_pending
+
+    @property
+    def publish_stats(self) -> dict:
+        with self._publish_condition:
+            stats = dict(self._publish_stats)
+            stats["inflight"] = len(self._inflight) + self._publish_pending
+        stats["latency_avg"] = stats["latency_total"] / stats["completed"] if stats["completed"] else 0.0
+        return stats
+
+    @property
+    def gcode_stats(self) -> dict:
+        with self._ack_condition:
+            return dict(self._gcode_stats)
+
+    @property 
+    def message_stats(self) -> dict:
+        return {section: dict(stats) for section, stats in self._message_stats.items()}
+
+    @property 
+    def snapshot(self) -> BambuState:
+        return self._snapshot
+
+    @property 
+    def history(self) -> BambuHistory:
+        return self._history
+    @history.setter 
+    def history(self, value: BambuHistory):
+        self._history = value
+
+    @property 
+    def job_tracker(self):
+        return self._job_tracker
+    @job_tracker.setter 
+    def job_tracker(self, value):
+        self._job_tracker = value
+
+    @property 
+    def subscriptions(self):
+        return tuple(self._subscriptions)
+
     @property 
     def recent_update(self):
         return self._recent_update
 
     @property 
     def bed_temp(self):
-        return self._bed_temp
+        return self._snapshot.bed_temp
 
     @property 
     def bed_temp_target(self):
-        return self._bed_temp_target
+        return self._snapshot.bed_temp_target
     @bed_temp_target.setter 
     def bed_temp_target(self, value: float):
         value = float(value)
         if value < 0.0: value = 0.0
         gcode = SEND_GCODE_TEMPLATE
         gcode["print"]["param"] = f"M140 S{value}\n"
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(gcode))
-        self._bed_temp_target_time = round(time.time())
+        self._publish(gcode)
+        self._update_state(bed_temp_target_time=round(time.time()))
 
     @property 
     def tool_temp(self):
-        return self._tool_temp
+        return self._snapshot.tool_temp
 
     @property 
     def tool_temp_target(self):
-        return self._tool_temp_target
+        return self._snapshot.tool_temp_target
     @tool_temp_target.setter 
     def tool_temp_target(self, value: float):
         value = float(value)
         if value < 0.0: value = 0.0
         gcode = SEND_GCODE_TEMPLATE
         gcode["print"]["param"] = f"M104 S{value}\n"
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(gcode))
-        self._tool_temp_target_time = round(time.time())
+        self._publish(gcode)
+        self._update_state(tool_temp_target_time=round(time.time()))
 
     @property 
     def chamber_temp(self):
-        return self._chamber_temp
+        return self._snapshot.chamber_temp
     @chamber_temp.setter 
     def chamber_temp(self, value: float):
-        self._chamber_temp = value
+        self._update_state(chamber_temp=value)
 
     @property 
     def chamber_temp_target(self):
-        return self._chamber_temp_target
+        return self._snapshot.chamber_temp_target
     @chamber_temp_target.setter 
     def chamber_temp_target(self, value: float):
-        self._chamber_temp_target = value
-        self._chamber_temp_target_time = round(time.time())
+        self._update_state(chamber_temp_target=value, chamber_temp_target_time=round(time.time()))
 
     @property 
     def fan_speed(self):
-        return self._fan_speed
+        return self._snapshot.fan_speed
 
     @property 
     def fan_speed_target(self):
-        return self._fan_speed_target
+        return self._snapshot.fan_speed_target
     @fan_speed_target.setter 
     def fan_speed_target(self, value: int):
         value = int(value)
         if value < 0: value = 0
-        self._fan_speed_target = value
         speed = round(value * 2.55, 0)
         gcode = SEND_GCODE_TEMPLATE
         gcode["print"]["param"] = f"M106 P1 S{speed}\nM106 P2 S{speed}\nM106 P3 S{speed}\n"
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(gcode))
-        self._fan_speed_target_time = round(time.time())
+        self._publish(gcode)
+        self._update_state(fan_speed_target=value, fan_speed_target_time=round(time.time()))
 
     @property 
     def bed_temp_target_time(self):
-        return self._bed_temp_target_time
+        return self._snapshot.bed_temp_target_time
     @property 
     def tool_temp_target_time(self):
-        return self._tool_temp_target_time
+        return self._snapshot.tool_temp_target_time
     @property 
     def chamber_temp_target_time(self):
-        return self._chamber_temp_target_time
+        return self._snapshot.chamber_temp_target_time
     @property 
     def fan_speed_target_time(self):
-        return self._fan_speed_target_time
+        return self._snapshot.fan_speed_target_time
 
     @property 
     def fan_gear(self):
-        return self._fan_gear
+        return self._snapshot.fan_gear
 
     @property 
     def heatbreak_fan_speed(self):
-        return self._heatbreak_fan_speed
+        return self._snapshot.heatbreak_fan_speed
 
     @property 
     def wifi_signal(self):
-        return self._wifi_signal
+        return self._snapshot.wifi_signal
 
     @property 
     def light_state(self):
-        return self._light_state == "on"
+        return self._snapshot.light_state == "on"
     @light_state.setter 
     def light_state(self, value: bool):
         value = bool(value)
@@ -1083,108 +1672,109 @@ class BambuPrinter:
             cmd["system"]["led_mode"] = "on"
         else:
             cmd["system"]["led_mode"] = "off"
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
 
     @property 
     def speed_level(self):
-        return self._speed_level
+        return self._snapshot.speed_level
     @speed_level.setter 
     def speed_level(self, value: str):
         value = str(value)
         cmd = SPEED_PROFILE_TEMPLATE
         cmd["print"]["param"] = value
-        self.client.publish(f"device/{self.config.serial_number}/request", json.dumps(cmd))
+        self._publish(cmd)
 
     @property 
     def gcode_state(self):
-        return self._gcode_state
+        return self._snapshot.gcode_state
 
     @property 
     def subtask_name(self):
-        return self._subtask_name
+        return self._snapshot.subtask_name
 
     @property 
     def current_3mf_file(self):
-        return self._3mf_file
+        return self._snapshot.current_3mf_file
 
     @property 
     def current_plate_num(self):
-        return self._plate_num
+        return self._snapshot.plate_num
 
     @property 
     def subtask_name(self):
-        return self._subtask_name
+        return self._snapshot.subtask_name
 
     @property 
     def gcode_file(self):
-        return self._gcode_file
+        return self._snapshot.gcode_file
     @gcode_file.setter 
     def gcode_file(self, value):
-        self._gcode_file = value
+        self._update_state(gcode_file=value)
 
     @property 
     def print_type(self):
-        return self._print_type
+        return self._snapshot.print_type
 
     @property 
     def percent_complete(self) -> int:
-        return int(self._percent_complete) if str(self._percent_complete).isnumeric() else int(0)
+        percent_complete = self._snapshot.percent_complete
+        return int(percent_complete) if str(percent_complete).isnumeric() else int(0)
 
     @property 
     def time_remaining(self) -> int:
-        return self._time_remaining
+        return self._snapshot.time_remaining
 
     @property 
     def start_time(self) -> int:
-        return self._start_time
+        return self._snapshot.start_time
 
     @property 
     def elapsed_time(self) -> int:
-        return self._elapsed_time
+        return self._snapshot.elapsed_time
 
     @property 
     def layer_count(self):
-        return self._layer_count
+        return self._snapshot.layer_count
 
     @property 
     def current_layer(self):
-        return self._current_layer
+        return self._snapshot.current_layer
 
     @property 
     def current_stage(self):
-        return self._current_stage
+        return self._snapshot.current_stage
 
     @property 
     def current_stage_text(self):
-        return parseStage(self._current_stage)
+        return parseStage(self._snapshot.current_stage)
 
     @property 
     def spools(self):
-        return self._spools
+        return self._snapshot.spools
 
     @property 
     def target_spool(self):
-        return self._target_spool
+        return self._snapshot.target_spool
 
     @property 
     def active_spool(self):
-        return self._active_spool
+        return self._snapshot.active_spool
 
     @property 
     def spool_state(self):
-        return self._spool_state
+        return self._snapshot.spool_state
 
     @property 
     def ams_status(self):
-        return self._ams_status
+        return self._snapshot.ams_status
 
     @property 
     def ams_exists(self):
-        return self._ams_exists
+        return self._snapshot.ams_exists
 
     @property 
     def ams_rfid_status(self):
-        return self._ams_rfid_status
+        return self._snapshot.ams_rfid_status
 
     @property 
     def internalException(self):
@@ -1200,15 +1790,15 @@ class BambuPrinter:
 
     @property
     def hms_data(self):
-        return self._hms_data
+        return self._snapshot.hms_data
 
     @property
     def print_type(self):
-        return self._print_type
+        return self._snapshot.print_type
 
     @property
     def skipped_objects(self):
-        return self._skipped_objects
+        return self._snapshot.skipped_objects
 
 
 def setup_logging():
@@ -1220,4 +1810,13 @@ def setup_logging():
     queue_handler = logging.getHandlerByName("queue_handler")
     if queue_handler is not None:
         queue_handler.listener.start()
-        atexit.register(queue_handler.listener.stop)
\ No newline at end of file
+        atexit.register(queue_handler.listener.stop)
+
+
+def _gcode_idle(snapshot: BambuState) -> bool:
+    # no job is active and the printer reports no stage (homing, heating, leveling, ...) in progress
+    return snapshot.gcode_state not in ("PREPARE", "RUNNING", "PAUSE", "SLICING") and snapshot.current_stage in (-1, 0, 255)
+
+
+def _hms_codes(hms_data: Optional[tuple]) -> tuple:
+    return tuple(sorted({hmsCode(hms.get("attr", 0), hms.get("code", 0)) for hms in hms_data or ()}))
@@ -0,0 +1,183 @@
+"""
+`bambureconnect` contains `BambuReconnectPolicy`, the backoff and handshake limits used whenever
+`bambu-printer-manager` (re)connects to a printer's `mqtt` or FTPS service.
+"""
+import ftplib
+import random
+import threading
+import time
+import logging
+
+from contextlib import contextmanager
+from typing import Optional
+
+from .ftpsclient.ftpsclient import IoTFTPSClient
+
+logger = logging.getLogger("bambuprinter")
+
+FTPS_PORT = 990
+RETRYABLE_ERRORS = (OSError, EOFError, ftplib.error_temp, ftplib.error_reply)
+
+
+class BambuReconnectPolicy:
+    """
+    `BambuReconnectPolicy` decides how long to wait before each connection attempt and how many
+    connection handshakes (TCP + TLS) may be in progress at the same time.
+
+    Delays grow exponentially from `min_delay` by `multiplier` per failed attempt up to `max_delay`,
+    with "full jitter" (a uniformly random delay between 0 and that value) so printers that lost
+    their connection at the same moment - an access point reboot for example - spread their
+    reconnects out instead of retrying in lockstep.  `max_concurrent` caps the number of
+    simultaneous handshakes across every printer that shares the policy, which keeps a large fleet
+    from overwhelming the network (or the host's CPU with TLS handshakes) while it recovers.
+
+    Every `BambuConfig` uses the shared `DEFAULT_RECONNECT_POLICY` unless it is given its own, so
+    assigning one policy instance to a group of configs applies the limits to that group.
+
+    Example
+    -------
+    ```py
+    policy = BambuReconnectPolicy(min_delay=1, max_delay=120, max_concurrent=8)
+    configs = [BambuConfig(hostname, access_code, serial, reconnect_policy=policy) for hostname, access_code, serial in fleet]
+    ```
+    """
+    def __init__(self,
+                 min_delay: Optional[float] = 1,
+                 max_delay: Optional[float] = 60,
+                 multiplier: Optional[float] = 2,
+                 jitter: Optional[bool] = True,
+                 max_concurrent: Optional[int] = None):
+        """
+        Sets up all internal storage attributes for `BambuReconnectPolicy`.
+
+        Parameters
+        ----------
+        * min_delay : Optional[float] = 1 - the (maximum) delay before the first reconnect attempt
+        * max_delay : Optional[float] = 60 - the cap on the delay between attempts
+        * multiplier : Optional[float] = 2 - growth factor of the delay per failed attempt
+        * jitter : Optional[bool] = True - use a random delay between 0 and the computed delay
+        * max_concurrent : Optional[int] = None - maximum simultaneous handshakes (unlimited if `None`)
+
+        Attributes
+        ----------
+        * _handshakes : `PRIVATE` `threading.BoundedSemaphore` limiting concurrent handshakes (`None` if unlimited).
+        * _stats : `READ ONLY` counts of reconnects and failed attempts along with total, max, and last time to reconnect.
+        """
+        self._min_delay = max(float(min_delay), 0.0)
+        self._max_delay = max(float(max_delay), self._min_delay)
+        self._multiplier = max(float(multiplier), 1.0)
+        self._jitter = jitter
+        self._max_concurrent = max_concurrent
+        self._handshakes = threading.BoundedSemaphore(int(max_concurrent)) if max_concurrent else None
+        self._lock = threading.Lock()
+        self._active = 0
+        self._stats = {"reconnects": 0, "attempts": 0, "failures": 0, "seconds_total": 0.0, "seconds_max": 0.0, "seconds_last": 0.0}
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the number of seconds to wait before connection attempt # `attempt` (0 based).
+        """
+        ceiling = min(self._max_delay, self._min_delay * self._multiplier ** min(int(attempt), 64))
+        return random.uniform(0, ceiling) if self._jitter else ceiling
+
+    @contextmanager
+    def handshake(self):
+        """
+        Context manager that holds one of the policy's handshake slots while a connection is opened.
+        """
+        if self._handshakes: self._handshakes.acquire()
+        with self._lock:
+            self._active += 1
+            self._stats["attempts"] += 1
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                self._stats["failures"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+            if self._handshakes: self._handshakes.release()
+
+    def record(self, seconds: float):
+        """
+        Records a successful reconnect that took `seconds` from losing the connection.
+        """
+        with self._lock:
+            self._stats["reconnects"] += 1
+            self._stats["seconds_total"] += seconds
+            self._stats["seconds_last"] = seconds
+            if seconds > self._stats["seconds_max"]: self._stats["seconds_max"] = seconds
+
+    def call(self, connect, attempts: Optional[int] = 3, retry_on: Optional[tuple] = RETRYABLE_ERRORS):
+        """
+        Calls `connect()` inside a handshake slot, retrying up to `attempts` times (with the
+        policy's delays in between) when it raises one of `retry_on`, and returns its result.
+        """
+        started = time.monotonic()
+        for attempt in range(max(int(attempts), 1)):
+            if attempt: time.sleep(self.delay(attempt - 1))
+            try:
+                with self.handshake():
+                    result = connect()
+            except retry_on as e:
+                if attempt + 1 >= attempts: raise
+                logger.debug(f"connection attempt [{attempt + 1}] failed: [{e}]")
+                continue
+            if attempt: self.record(time.monotonic() - started)
+            return result
+
+    def toJson(self) -> dict:
+        """
+        Returns a `dict` (json document) representing this object's private class level attributes.
+        """
+        return {
+            "_min_delay": self._min_delay,
+            "_max_delay": self._max_delay,
+            "_multiplier": self._multiplier,
+            "_jitter": self._jitter,
+            "_max_concurrent": self._max_concurrent,
+            "_stats": self.stats,
+        }
+
+    @property
+    def min_delay(self) -> float:
+        return self._min_delay
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+    @property
+    def multiplier(self) -> float:
+        return self._multiplier
+
+    @property
+    def jitter(self) -> bool:
+        return self._jitter
+
+    @property
+    def max_concurrent(self) -> Optional[int]:
+        return self._max_concurrent
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["active"] = self._active
+        stats["seconds_avg"] = stats["seconds_total"] / stats["reconnects"] if stats["reconnects"] else 0.0
+        return stats
+
+
+DEFAULT_RECONNECT_POLICY = BambuReconnectPolicy()
+
+
+def connectFTPS(config, attempts: Optional[int] = 3) -> IoTFTPSClient:
+    """
+    Opens an FTPS session to the printer described by `config` (a `BambuConfig`), retrying
+    transient failures according to `config.reconnect_policy`.
+    """
+    return config.reconnect_policy.call(
+        lambda: IoTFTPSClient(config.hostname, FTPS_PORT, config.mqtt_username, config.access_code, ssl_implicit=True),
+        attempts)
@@ -0,0 +1,614 @@
+"""
+`bambuscheduler` contains `BambuScheduler`, a fleet wide print job scheduler that dispatches
+`BambuJob`s to idle `BambuPrinter`s whose loaded spools and build plate match each job.
+"""
+import copy
+import heapq
+import itertools
+import threading
+import time
+import logging
+
+from typing import Optional
+
+from .bambuprinter import BambuPrinter
+from .bambujob import BambuJob, filamentToken, tokenCounts
+from .bambujobstore import BambuJobStore
+from .bambustager import BambuStager
+from .bambutools import PrinterState, PlateType, JobStatus, parseSubtaskName
+
+logger = logging.getLogger("bambuprinter")
+
+IDLE_STATES = ("IDLE", "FINISH", "FAILED")
+ACTIVE_STATES = ("PREPARE", "RUNNING", "PAUSE", "SLICING")
+STAGING_ATTEMPTS = 3
+
+
+class BambuScheduler:
+    """
+    `BambuScheduler` owns a priority queue of `BambuJob`s across any number of `BambuPrinter`s.
+
+    Whenever a printer reports an idle `gcode_state` (`IDLE`, `FINISH`, or `FAILED`) the scheduler picks
+    the highest priority queued job whose filament requirements are satisfied by the printer's loaded
+    `spools` and whose `bed` matches the printer's build plate, and calls `print_3mf_file` for it.  Newly
+    submitted jobs are likewise sent straight to the longest idle compatible printer.
+
+    Queued jobs are bucketed by their (filament requirements, plate) and idle printers by their
+    (loaded filaments, plate), each bucket being a heap.  Filaments are counted (a job needing two
+    PLA spools is not bucketed with one needing a single PLA spool), so whether a printer can take
+    a job only depends on the buckets and only the top of each job heap needs to be checked.  A dispatch decision only visits the bucket
+    keys (the distinct filament/plate combinations in use, not the jobs or printers) and pops a
+    single heap, so it takes O(log n) time as the queue and the fleet grow.
+
+    Example
+    -------
+    ```py
+    scheduler = BambuScheduler()
+    scheduler.add_printer(printer1, PlateType.TEXTURED_PLATE)
+    scheduler.add_printer(printer2)
+    scheduler.submit(BambuJob("/jobs/widget.gcode.3mf", filaments=("PLA",)))
+    scheduler.submit(BambuJob("/jobs/bracket.gcode.3mf", filaments=(("PETG", "black"),), priority=10))
+    ```
+
+    When a `BambuJobStore` is supplied every submit and transition is written to it before it takes
+    effect (transitions are journaled under the scheduler's lock and written, in order, once it is
+    released and before any resulting `print_3mf_file` request is sent, so the store's `fsync`s
+    never hold up other printers' updates), queued jobs are reloaded on startup, and jobs that were dispatched or running when the
+    process stopped are reconciled against each printer's first report (`gcode_state`,
+    `subtask_name`, and `current_3mf_file`) once the printer is added back to the scheduler.
+
+    When a `BambuStager` is supplied, jobs with a local `source` file are staged before they are
+    printed.  While a printer is running a job the scheduler reserves the next job it would give
+    that printer (`STAGING`) and uploads and verifies its file in the background, so the job is
+    started the moment the printer reports `FINISH` instead of after a transfer.
+    """
+    def __init__(self, start_timeout: Optional[int] = 300, store: Optional[BambuJobStore] = None, stager: Optional[BambuStager] = None):
+        """
+        Sets up all internal storage attributes for `BambuScheduler`.
+
+        Parameters
+        ----------
+        * start_timeout : Optional[int] = 300 - seconds a printer has to report a dispatched job as active
+          before the job is marked as `FAILED`
+        * store : Optional[BambuJobStore] = None - durable job store (jobs are only held in memory when `None`)
+        * stager : Optional[BambuStager] = None - uploads job `source` files (required to submit jobs with a `source`)
+
+        Attributes
+        ----------
+        * _members : `PRIVATE` dict of `_FleetMember` keyed by printer serial #.
+        * _queues : `PRIVATE` dict of job heaps keyed by (filament requirements, plate).
+        * _idle : `PRIVATE` dict of idle printer heaps keyed by (loaded filaments, plate).
+        * _jobs : `READ ONLY` dict of every submitted `BambuJob` keyed by job id.
+        * _unreconciled : `PRIVATE` dict of jobs reloaded from the store that were in flight, keyed by printer serial #.
+        * _outbox : `PRIVATE` list of dispatched jobs whose `print_3mf_file` request is sent once the lock is released.
+        * _journal : `PRIVATE` list of copies of jobs whose transitions are written to `store` once the lock is released.
+        """
+        self._lock = threading.RLock()
+        self._start_timeout = start_timeout
+        self._store = store
+        self._stager = stager
+
+        self._members = {}
+        self._queues = {}
+        self._idle = {}
+        self._jobs = {}
+        self._unreconciled = {}
+        self._staging_failures = {}
+        self._outbox = []
+        self._journal = []
+        self._journal_lock = threading.Lock()
+
+        self._sequence = itertools.count(1)
+        self._job_ids = itertools.count(1)
+        self._queue_version = 0
+        self._started = time.time()
+
+        self._dispatched = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._handoffs = 0
+        self._handoff_total = 0.0
+        self._handoff_max = 0.0
+
+        if store:
+            for job in store.jobs(JobStatus.QUEUED, JobStatus.STAGING):
+                if job.status == JobStatus.STAGING: self._requeue(job)
+                self._jobs[job.id] = job
+                self._enqueue(job)
+            for job in store.jobs(JobStatus.DISPATCHED, JobStatus.RUNNING):
+                self._jobs[job.id] = job
+                self._unreconciled.setdefault(job.printer, []).append(job)
+            self._write_journal()
+            logger.debug("scheduler reloaded jobs from store", extra={"jobs": len(self._jobs)})
+
+    def add_printer(self, printer: BambuPrinter, plate: Optional[PlateType] = None):
+        """
+        Adds a printer to the fleet managed by this scheduler.
+
+        Parameters
+        ----------
+        * printer : BambuPrinter - a printer with an active (or soon to be active) session
+        * plate : Optional[PlateType] = None - the build plate installed on the printer (`None` accepts jobs for any plate)
+        """
+        serial = printer.config.serial_number
+        with self._lock:
+            if serial in self._members:
+                raise Exception(f"printer [{serial}] is already managed by this scheduler")
+            member = _FleetMember(printer, plate)
+            self._members[serial] = member
+        member.subscription = printer.subscribe(self._on_printer_update)
+        self._on_printer_update(printer)
+
+    def remove_printer(self, printer: BambuPrinter):
+        """
+        Removes a printer from the fleet.  A job running on it is left running but is no longer tracked.
+        """
+        with self._lock:
+            member = self._members.pop(printer.config.serial_number, None)
+            if member:
+                # its entry in an idle heap is stale once the key and token are cleared
+                member.idle_key = None
+                member.idle_token = None
+            if member and member.next:
+                self._requeue(member.next)
+                self._enqueue(member.next)
+                member.next = None
+        self._write_journal()
+        if member:
+            printer.unsubscribe(member.subscription)
+
+    def submit(self, job: BambuJob) -> BambuJob:
+        """
+        Queues a job and dispatches it immediately if a compatible printer is idle.
+        """
+        if job.source and not self._stager:
+            raise Exception("jobs with a source file require a scheduler with a stager")
+        job.status = JobStatus.QUEUED
+        job.enqueued = time.time()
+        # the job is not visible to the scheduler yet, so it is stored without holding the lock
+        if self._store: self._store.add(job)
+        with self._lock:
+            if not self._store: job.id = next(self._job_ids)
+            self._jobs[job.id] = job
+            self._enqueue(job)
+            logger.debug("scheduler job submitted", extra={"job": job.name, "job_id": job.id})
+
+            member = self._pop_idle_printer_for(job)
+            if member:
+                self._start(job, member)
+        self._send_dispatched()
+        return job
+
+    def cancel(self, job: BambuJob) -> bool:
+        """
+        Cancels a queued (or staging) job.  Returns `False` if the job was already dispatched.
+        """
+        with self._lock:
+            if job.status not in (JobStatus.QUEUED, JobStatus.STAGING): return False
+            member = self._members.get(job.printer)
+            if member and member.next is job: member.next = None
+            job.status = JobStatus.CANCELLED
+            job.finished = time.time()
+            self._record(job)
+        self._write_journal()
+        return True
+
+    def close(self):
+        """
+        Stops listening to all printers.  Queued jobs remain queued but are no longer dispatched.
+        """
+        with self._lock:
+            members = list(self._members.values())
+            self._members = {}
+            self._idle = {}
+            for member in members:
+                member.idle_key = None
+                member.idle_token = None
+        for member in members:
+            member.printer.unsubscribe(member.subscription)
+
+    def stats(self) -> dict:
+        """
+        Returns a `dict` of scheduler statistics.
+
+        * queued / staging / running / completed / failed - job counts
+        * throughput_per_hour - completed jobs per hour since the scheduler was created
+        * wait_time_avg / wait_time_max - seconds jobs waited in the queue before being dispatched
+        * handoff_avg / handoff_max - seconds a printer sat idle between finishing a job and being sent
+          the next one while jobs were waiting for it
+        * utilization - `dict` of the fraction of time each printer (by serial #) spent on scheduled jobs
+        """
+        with self._lock:
+            now = time.time()
+            elapsed = max(now - self._started, 1e-9)
+            queued = sum(1 for job in self._jobs.values() if job.status == JobStatus.QUEUED)
+            staging = sum(1 for job in self._jobs.values() if job.status == JobStatus.STAGING)
+            running = sum(1 for job in self._jobs.values() if job.status in (JobStatus.DISPATCHED, JobStatus.RUNNING))
+            return {
+                "queued": queued,
+                "staging": staging,
+                "running": running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "throughput_per_hour": self._completed * 3600.0 / elapsed,
+                "wait_time_avg": self._wait_total / self._dispatched if self._dispatched else 0.0,
+                "wait_time_max": self._wait_max,
+                "handoff_avg": self._handoff_total / self._handoffs if self._handoffs else 0.0,
+                "handoff_max": self._handoff_max,
+                "utilization": {serial: member.utilization(now) for serial, member in self._members.items()},
+            }
+
+    def _on_printer_update(self, printer: BambuPrinter):
+        # a state restored from a checkpoint may describe a previous job, wait for a live report
+        if printer.stale: return
+        try:
+            self._update(printer)
+        finally:
+            self._send_dispatched()
+
+    def _update(self, printer: BambuPrinter):
+        with self._lock:
+            member = self._members.get(printer.config.serial_number)
+            if member is None: return
+
+            now = time.time()
+            snapshot = printer.snapshot
+            gcode_state = snapshot.gcode_state
+
+            if gcode_state and member.serial in self._unreconciled:
+                self._reconcile(member, snapshot, now)
+
+            job = member.job
+            if job and job.status == JobStatus.DISPATCHED:
+                if gcode_state in ACTIVE_STATES:
+                    job.status = JobStatus.RUNNING
+                    job.started = now
+                    self._record(job)
+                    logger.debug("scheduler job started", extra={"job": job.name, "job_id": job.id, "printer": job.printer})
+                elif now - job.dispatched > self._start_timeout:
+                    logger.warning(f"printer [{job.printer}] never started job [{job.name}]")
+                    self._finish(member, JobStatus.FAILED, now)
+            elif job and job.status == JobStatus.RUNNING:
+                if gcode_state == "FINISH":
+                    self._finish(member, JobStatus.COMPLETED, now)
+                elif gcode_state in ("FAILED", "IDLE"):
+                    self._finish(member, JobStatus.FAILED, now)
+
+            if member.job is None and printer.state == PrinterState.CONNECTED and gcode_state in IDLE_STATES:
+                job = member.next
+                if job:
+                    # a reserved job is started as soon as it is staged (see _on_staged)
+                    if job.staged: self._start_reserved(member)
+                    if member.job or member.next: return
+                capabilities = _capabilities(snapshot.spools)
+                if member.idle_key is None or member.idle_key[0] != capabilities:
+                    member.idle_since = member.idle_since or now
+                    self._set_idle(member, (capabilities, member.plate))
+                job = self._pop_job_for(member, member.idle_key)
+                if job:
+                    self._start(job, member)
+            else:
+                member.idle_key = None
+                member.idle_since = 0.0
+                if self._stager and member.job and member.job.status == JobStatus.RUNNING and member.next is None:
+                    self._reserve_next(member, snapshot)
+
+    def _enqueue(self, job: BambuJob):
+        key = (job.requirements, job.bed)
+        heapq.heappush(self._queues.setdefault(key, []), (-job.priority, job.id, job))
+        self._queue_version += 1
+
+    def _requeue(self, job: BambuJob):
+        job.status = JobStatus.QUEUED
+        job.printer = None
+        job.dispatched = 0.0
+        job.staged = 0.0
+        self._record(job)
+
+    def _set_idle(self, member: "_FleetMember", key: tuple):
+        member.idle_key = key
+        member.idle_token = next(self._sequence)
+        heapq.heappush(self._idle.setdefault(key, []), (member.idle_since, member.idle_token, member))
+
+    def _pop_job_for(self, member: "_FleetMember", key: tuple) -> Optional[BambuJob]:
+        capabilities, plate = key
+        best_key = None
+        best = None
+        for key in list(self._queues.keys()):
+            requirements, bed = key
+            if not _satisfies(requirements, capabilities) or not _plate_matches(bed, plate): continue
+            heap = self._queues[key]
+            while heap and heap[0][2].status != JobStatus.QUEUED:
+                heapq.heappop(heap)
+            if not heap:
+                del self._queues[key]
+                continue
+            if _assign_spools(heap[0][2], member.printer.snapshot.spools) is None: continue
+            if best is None or heap[0] < best:
+                best_key, best = key, heap[0]
+        if best is None: return None
+        heapq.heappop(self._queues[best_key])
+        return best[2]
+
+    def _pop_idle_printer_for(self, job: BambuJob) -> Optional["_FleetMember"]:
+        requirements = job.requirements
+        best_key = None
+        best = None
+        for key in list(self._idle.keys()):
+            capabilities, plate = key
+            if not _satisfies(requirements, capabilities) or not _plate_matches(job.bed, plate): continue
+            heap = self._idle[key]
+            # printers sharing a key can still differ in which spools are in the AMS and which is
+            # the external spool, so look past the ones that can't take the job
+            skipped = []
+            while heap:
+                entry = heap[0]
+                member = entry[2]
+                if member.idle_key != key or member.idle_token != entry[1] or self._members.get(member.serial) is not member:
+                    heapq.heappop(heap)
+                elif _assign_spools(job, member.printer.snapshot.spools) is None:
+                    skipped.append(heapq.heappop(heap))
+                else:
+                    break
+            candidate = heap[0] if heap else None
+            for entry in skipped:
+                heapq.heappush(heap, entry)
+            if not heap:
+                del self._idle[key]
+                continue
+            if candidate is None: continue
+            if best is None or candidate[:2] < best[:2]:
+                best_key, best = key, candidate
+        if best is None: return None
+        heap = self._idle[best_key]
+        heap.remove(best)
+        heapq.heapify(heap)
+        return best[2]
+
+    def _start(self, job: BambuJob, member: "_FleetMember"):
+        if job.source and not job.staged:
+            self._reserve(job, member)
+        else:
+            self._dispatch(job, member)
+
+    def _reserve(self, job: BambuJob, member: "_FleetMember"):
+        job.status = JobStatus.STAGING
+        job.printer = member.serial
+        self._record(job)
+        member.next = job
+        member.idle_key = None
+        member.idle_since = 0.0
+        logger.debug("scheduler staging job", extra={"job": job.name, "job_id": job.id, "printer": job.printer})
+        self._stager.stage(member.printer, job, self._on_staged)
+
+    def _reserve_next(self, member: "_FleetMember", snapshot):
+        # only look for a job to prefetch when the queue or the printer's filaments changed
+        key = (self._queue_version, _capabilities(snapshot.spools))
+        if member.reserve_key == key: return
+        job = self._pop_job_for(member, (key[1], member.plate))
+        if job and job.source and not job.staged:
+            self._reserve(job, member)
+        elif job:
+            # nothing to prefetch, the job stays queued for whichever printer frees up first
+            heapq.heappush(self._queues.setdefault((job.requirements, job.bed), []), (-job.priority, job.id, job))
+        member.reserve_key = key
+
+    def _start_reserved(self, member: "_FleetMember"):
+        job = member.next
+        member.next = None
+        if job.filaments and job.ams_mapping is None and _assign_spools(job, member.printer.snapshot.spools) is None:
+            logger.debug("scheduler released staged job, printer filaments changed", extra={"job": job.name, "job_id": job.id, "printer": member.serial})
+            self._requeue(job)
+            self._enqueue(job)
+            return
+        self._dispatch(job, member)
+
+    def _on_staged(self, job: BambuJob, ok: bool):
+        staged = False
+        with self._lock:
+            if job.status != JobStatus.STAGING: return
+            member = self._members.get(job.printer)
+            if not ok or member is None or member.next is not job:
+                if member and member.next is job: member.next = None
+                failures = self._staging_failures[job.id] = self._staging_failures.get(job.id, 0) + (0 if ok else 1)
+                if failures >= STAGING_ATTEMPTS:
+                    logger.warning(f"unable to stage job [{job.name}] after [{failures}] attempts")
+                    self._close(job, JobStatus.FAILED, time.time())
+                    return
+                self._requeue(job)
+                self._enqueue(job)
+                member = self._pop_idle_printer_for(job)
+                if member: self._start(job, member)
+            else:
+                job.staged = time.time()
+                self._record(job)
+                staged = True
+        if staged: self._on_printer_update(member.printer)
+        else: self._send_dispatched()
+
+    def _dispatch(self, job: BambuJob, member: "_FleetMember"):
+        printer = member.printer
+        now = time.time()
+
+        use_ams, ams_mapping = False, ""
+        if job.ams_mapping is not None:
+            use_ams, ams_mapping = len(job.ams_mapping) > 0, job.ams_mapping
+        elif job.filaments:
+            trays = _assign_spools(job, printer.snapshot.spools)
+            if any(tray != 254 for tray in trays):
+                use_ams, ams_mapping = True, "[" + ",".join(str(tray) for tray in trays) + "]"
+
+        bed = job.bed
+        if bed == PlateType.AUTO and member.plate is not None: bed = member.plate
+
+        job.status = JobStatus.DISPATCHED
+        job.printer = printer.config.serial_number
+        job.dispatched = now
+        self._record(job)
+        member.job = job
+        member.idle_key = None
+        member.idle_since = 0.0
+        member.busy_since = now
+
+        wait = job.dispatched - job.enqueued
+        self._dispatched += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+
+        if member.finished and job.enqueued < member.finished:
+            handoff = now - member.finished
+            self._handoffs += 1
+            self._handoff_total += handoff
+            self._handoff_max = max(self._handoff_max, handoff)
+
+        logger.debug("scheduler dispatching job", extra={"job": job.name, "job_id": job.id, "printer": job.printer, "ams_mapping": ams_mapping})
+        self._outbox.append((job, member, (job.name, job.plate, bed, use_ams, ams_mapping, job.bedlevel, job.flow, job.timelapse)))
+
+    def _send_dispatched(self):
+        # publishing can wait out a printer's in-flight limit, so it never happens while holding the lock.
+        # the outbox is taken with the journal so every dispatch is stored before it is sent
+        with self._journal_lock:
+            with self._lock:
+                journal, self._journal = self._journal, []
+                outbox, self._outbox = self._outbox, []
+            if journal: self._store.record_many(journal)
+        for job, member, arguments in outbox:
+            try:
+                member.printer.print_3mf_file(*arguments)
+            except Exception as e:
+                logger.warning(f"unable to send job [{job.name}] to printer [{member.serial}]: [{e}]")
+                with self._lock:
+                    if job.status != JobStatus.DISPATCHED or member.job is not job: continue
+                    member.job = None
+                    member.busy_total += time.time() - member.busy_since
+                    member.busy_since = 0.0
+                    self._dispatched -= 1
+                    self._requeue(job)
+                    self._enqueue(job)
+                self._write_journal()
+
+    def _finish(self, member: "_FleetMember", status: JobStatus, now: float):
+        job = member.job
+        member.job = None
+        member.busy_total += now - member.busy_since
+        member.busy_since = 0.0
+        member.finished = now
+        self._close(job, status, now)
+
+    def _close(self, job: BambuJob, status: JobStatus, now: float):
+        job.status = status
+        job.finished = now
+        self._record(job)
+        if status == JobStatus.COMPLETED:
+            self._completed += 1
+        else:
+            self._failed += 1
+        logger.debug("scheduler job finished", extra={"job": job.name, "job_id": job.id, "printer": job.printer, "status": status.name})
+
+    def _reconcile(self, member: "_FleetMember", snapshot, now: float):
+        for job in self._unreconciled.pop(member.serial):
+            matches = snapshot.subtask_name == parseSubtaskName(job.name) or snapshot.current_3mf_file == job.name
+            if matches and snapshot.gcode_state in ACTIVE_STATES and member.job is None:
+                job.status = JobStatus.RUNNING
+                job.started = job.started or now
+                self._record(job)
+                member.job = job
+                member.busy_since = job.dispatched or now
+            elif matches and snapshot.gcode_state in ("FINISH", "FAILED"):
+                # a dispatched job may have started and finished while the scheduler was down
+                self._close(job, JobStatus.COMPLETED if snapshot.gcode_state == "FINISH" else JobStatus.FAILED, now)
+            elif job.status == JobStatus.DISPATCHED and not matches:
+                # the printer shows no sign of the job so it is safe to send it again
+                self._requeue(job)
+                self._enqueue(job)
+            else:
+                self._close(job, JobStatus.FAILED, now)
+            logger.debug("scheduler reconciled job", extra={"job": job.name, "job_id": job.id, "printer": member.serial, "status": job.status.name})
+
+    def _record(self, job: BambuJob):
+        # a copy, the job keeps changing until the journal is written
+        if self._store: self._journal.append(copy.copy(job))
+
+    def _write_journal(self):
+        # the journal lock keeps concurrent writers from storing transitions out of order
+        if not self._store: return
+        with self._journal_lock:
+            with self._lock:
+                journal, self._journal = self._journal, []
+            if journal: self._store.record_many(journal)
+
+    @property
+    def jobs(self) -> tuple:
+        with self._lock:
+            return tuple(self._jobs.values())
+
+    @property
+    def printers(self) -> tuple:
+        with self._lock:
+            return tuple(member.printer for member in self._members.values())
+
+
+class _FleetMember:
+    __slots__ = ("printer", "serial", "plate", "subscription", "job", "next", "reserve_key", "idle_key", "idle_token",
+                 "idle_since", "busy_since", "busy_total", "finished", "added")
+
+    def __init__(self, printer: BambuPrinter, plate: Optional[PlateType]):
+        self.printer = printer
+        self.serial = printer.config.serial_number
+        self.plate = plate
+        self.subscription = None
+        self.job = None
+        self.next = None
+        self.reserve_key = None
+        self.idle_key = None
+        self.idle_token = 0
+        self.idle_since = 0.0
+        self.busy_since = 0.0
+        self.busy_total = 0.0
+        self.finished = 0.0
+        self.added = time.time()
+
+    def utilization(self, now: float) -> float:
+        busy = self.busy_total + (now - self.busy_since if self.busy_since else 0.0)
+        return busy / max(now - self.added, 1e-9)
+
+
+def _capabilities(spools) -> tuple:
+    # every spool counts towards its type and, if known, its (type, color)
+    tokens = []
+    for spool in spools:
+        if not spool.type: continue
+        tokens.append(filamentToken(spool.type))
+        if spool.color: tokens.append(filamentToken((spool.type, spool.color)))
+    return tokenCounts(tokens)
+
+
+def _satisfies(requirements: tuple, capabilities: tuple) -> bool:
+    available = dict(capabilities)
+    return all(available.get(token, 0) >= count for token, count in requirements)
+
+
+def _plate_matches(bed: PlateType, plate: Optional[PlateType]) -> bool:
+    return bed == PlateType.AUTO or plate is None or plate == bed
+
+
+def _assign_spools(job: BambuJob, spools) -> Optional[list]:
+    # maps every job filament (in slicer order) to a distinct tray id, preferring AMS trays.  Filaments
+    # with a color are matched first so one that takes any color never uses up a spool a colored one
+    # needs, which makes the result depend only on the counted requirements (see `_capabilities`)
+    available = sorted(spools, key=lambda spool: int(spool.id) == 254)
+    tokens = [filamentToken(filament) for filament in job.filaments]
+    trays = [None] * len(tokens)
+    for index in sorted(range(len(tokens)), key=lambda index: tokens[index][1] is None):
+        type, color = tokens[index]
+        for spool in available:
+            if filamentToken(spool.type)[0] == type and (color is None or filamentToken((spool.type, spool.color))[1] == color):
+                trays[index] = int(spool.id)
+                available.remove(spool)
+                break
+        else:
+            return None
+    if 254 in trays and len(trays) > 1: return None
+    return trays
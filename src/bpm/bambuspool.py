@@ -6,6 +6,8 @@ class BambuSpool:
     It is used primarily within `BambuPrinter`'s `_spools` attribute and is returned as part of a 
     Tuple when there are spools active on machine.
     """    
+    __slots__ = ("_id", "_name", "_type", "_sub_brands", "_color", "_tray_info_idx", "_k", "_bed_temp", "_nozzle_temp_min", "_nozzle_temp_max")
+
     def __repr__(self):
         return str(self)
     def __str__(self):
@@ -39,6 +41,25 @@ class BambuSpool:
         self.nozzle_temp_min = nozzle_temp_min
         self.nozzle_temp_max = nozzle_temp_max
 
+    def __eq__(self, other):
+        if not isinstance(other, BambuSpool): return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    __hash__ = None
+
+    def toJson(self) -> dict:
+        """
+        Returns a `dict` (json document) of this spool keyed by its private attribute names.
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def fromJson(cls, document: dict):
+        """
+        Builds a `BambuSpool` from a `dict` previously produced by `toJson`.
+        """
+        return cls(*(document.get(slot) for slot in cls.__slots__))
+
     @property 
     def id(self):
         return self._id
@@ -0,0 +1,174 @@
+"""
+`bambustager` contains `BambuStager` which uploads and verifies job files on printers' SDCards
+in the background so `bambuscheduler.BambuScheduler` can start the next job the moment a
+printer finishes its current one.
+"""
+import os
+import hashlib
+import queue
+import tempfile
+import threading
+import time
+import logging
+
+from typing import Optional
+
+from .bambu3mf import Bambu3mfInspector
+from .bambureconnect import connectFTPS
+
+logger = logging.getLogger("bambuprinter")
+
+
+class BambuStager:
+    """
+    `BambuStager` stages `BambuJob` files (`BambuJob.source`) onto printers' SDCards (`BambuJob.name`).
+
+    Every printer gets its own worker thread so uploads to one printer are serialized (the printers
+    only handle a single transfer well) while uploads to different printers run in parallel.  Sliced
+    `.3mf` files are slimmed to the job's plate first (see `Bambu3mfInspector.slim`) and every upload
+    is verified with an FTPS `SIZE` request (or, with `verify=True`, by downloading it again and
+    comparing its sha256) before the job is reported as staged.  The sha256 of every verified upload
+    is recorded, and an upload is only skipped when the file recorded for that printer and SDCard
+    path has the same sha256 as the file being staged - a matching size alone never skips one.
+
+    Staging is normally driven by `BambuScheduler`, which reserves the next job for a busy printer
+    and stages it while the current job prints.
+    """
+    def __init__(self, inspector: Optional[Bambu3mfInspector] = None, slim: Optional[bool] = True, verify: Optional[bool] = False):
+        """
+        Sets up all internal storage attributes for `BambuStager`.
+
+        Parameters
+        ----------
+        * inspector : Optional[Bambu3mfInspector] = None - the inspector (and cache) used for slimming (an in memory one if `None`)
+        * slim : Optional[bool] = True - slim `.3mf` files to the job's plate before uploading them
+        * verify : Optional[bool] = False - download every upload again and compare its sha256 instead of only its size
+
+        Attributes
+        ----------
+        * _workers : `PRIVATE` dict of (queue, thread) keyed by printer serial #.
+        * _uploaded : `PRIVATE` dict of the (sha256, size) of verified uploads keyed by (printer serial #, SDCard path).
+        * _stats : `READ ONLY` Totals of staged, failed, and skipped (already present) jobs along with bytes and seconds uploaded.
+        """
+        self._inspector = inspector or Bambu3mfInspector()
+        self._slim = slim
+        self._verify = verify
+        self._lock = threading.Lock()
+        self._workers = {}
+        self._uploaded = {}
+        self._closed = False
+        self._stats = {"staged": 0, "failed": 0, "skipped": 0, "bytes": 0, "seconds": 0.0}
+
+    def stage(self, printer, job, callback):
+        """
+        Queues `job`'s file for upload to `printer`.  `callback(job, ok)` is invoked from the
+        printer's worker thread once the file has (`ok=True`) or has not (`ok=False`) been verified
+        on the SDCard.
+        """
+        serial = printer.config.serial_number
+        with self._lock:
+            if self._closed:
+                raise Exception("stager has been closed")
+            worker = self._workers.get(serial)
+            if worker is None:
+                jobs = queue.Queue()
+                thread = threading.Thread(target=self._work, args=(jobs,), name="bambuprinter-stager", daemon=True)
+                worker = self._workers[serial] = (jobs, thread)
+                thread.start()
+        worker[0].put((printer, job, callback))
+
+    def close(self):
+        """
+        Stops all worker threads once their current upload completes.  Queued uploads are discarded.
+        """
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers.values())
+            self._workers = {}
+        for jobs, thread in workers:
+            jobs.put(None)
+        for jobs, thread in workers:
+            thread.join()
+
+    def _work(self, jobs: queue.Queue):
+        while True:
+            item = jobs.get()
+            if item is None or self._closed: return
+            printer, job, callback = item
+            ok = False
+            try:
+                ok = self._stage(printer, job)
+            except Exception:
+                logger.exception(f"unable to stage [{job.source}] to [{printer.config.serial_number}]")
+            with self._lock:
+                self._stats["staged" if ok else "failed"] += 1
+            try:
+                callback(job, ok)
+            except Exception:
+                logger.exception("stager callback raised an exception")
+
+    def _stage(self, printer, job) -> bool:
+        source = job.source
+        if self._slim and source.lower().endswith(".3mf"):
+            try:
+                source = self._inspector.slim(source, job.plate).path
+            except Exception as e:
+                logger.warning(f"uploading [{job.source}] without slimming: [{e}]")
+
+        digest, size = self._inspector.digest(source)
+        config = printer.config
+        key = (config.serial_number, job.name)
+        with self._lock:
+            uploaded = self._uploaded.pop(key, None)
+        ftps = connectFTPS(config)
+        try:
+            # the size check only catches a recorded file that was since deleted or replaced
+            if uploaded == (digest, size) and ftps.get_file_size(job.name) == size:
+                with self._lock:
+                    self._uploaded[key] = uploaded
+                    self._stats["skipped"] += 1
+                logger.debug(f"[{job.name}] is already staged on [{config.serial_number}]")
+                return True
+
+            started = time.monotonic()
+            ftps.upload_file(source, job.name)
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._stats["bytes"] += size
+                self._stats["seconds"] += elapsed
+
+            remote = ftps.get_file_size(job.name)
+            if remote != size:
+                logger.warning(f"staged [{job.name}] on [{config.serial_number}] is [{remote}] bytes, expected [{size}]")
+                return False
+            if self._verify:
+                remote = self._remote_digest(ftps, job.name)
+                if remote != digest:
+                    logger.warning(f"staged [{job.name}] on [{config.serial_number}] has sha256 [{remote}], expected [{digest}]")
+                    return False
+        finally:
+            ftps.disconnect()
+
+        with self._lock:
+            self._uploaded[key] = (digest, size)
+
+        logger.debug(f"staged [{job.name}] on [{config.serial_number}]", extra={"bytes": size, "seconds": elapsed})
+        return True
+
+    def _remote_digest(self, ftps, path: str) -> str:
+        handle, local = tempfile.mkstemp(suffix=".3mf")
+        os.close(handle)
+        try:
+            ftps.download_file(path, local)
+            sha = hashlib.sha256()
+            with open(local, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+            return sha.hexdigest()
+        finally:
+            os.remove(local)
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,154 @@
+"""
+`bambustate` contains `BambuState`, the immutable snapshot of everything `BambuPrinter`
+knows about a printer's current status, along with the schema describing its fields.
+"""
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, NamedTuple, Optional
+
+from .bambuspool import BambuSpool
+
+
+@dataclass(frozen=True, slots=True)
+class BambuState:
+    """
+    `BambuState` is an immutable, slotted snapshot of a printer's reported state.
+
+    `BambuPrinter` builds a new `BambuState` for every message it receives from the printer and
+    swaps it in with a single reference assignment.  Reading `BambuPrinter.snapshot` once and then
+    reading any number of fields from the returned object is therefore always consistent (you will
+    never see a new `gcode_state` paired with an old `current_3mf_file`), and requires no locking.
+
+    The individual `BambuPrinter` properties (`bed_temp`, `gcode_state`, etc) read from the current
+    snapshot and remain the simplest way to access a single value.  See `BambuPrinter.__init__` for a
+    description of each field.
+
+    The declared fields double as the state schema (see `STATE_SCHEMA`) which drives `toJson`,
+    `fromJson` and `diff`.
+    """
+    bed_temp: float = 0.0
+    bed_temp_target: float = 0.0
+    bed_temp_target_time: int = 0
+
+    tool_temp: float = 0.0
+    tool_temp_target: float = 0.0
+    tool_temp_target_time: int = 0
+
+    chamber_temp: float = 0.0
+    chamber_temp_target: float = 0.0
+    chamber_temp_target_time: int = 0
+
+    fan_gear: int = 0
+    heatbreak_fan_speed: int = 0
+    fan_speed: int = 0
+    fan_speed_target: int = 0
+    fan_speed_target_time: int = 0
+
+    light_state: str = ""
+    wifi_signal: str = ""
+    speed_level: int = 0
+
+    gcode_state: str = ""
+    gcode_file: str = ""
+    current_3mf_file: str = field(default="", metadata={"json": "_3mf_file"})
+    plate_num: int = 0
+    subtask_name: str = ""
+    print_type: str = ""
+    percent_complete: int = 0
+    time_remaining: int = 0
+    start_time: int = 0
+    elapsed_time: int = 0
+    layer_count: int = 0
+    current_layer: int = 0
+
+    current_stage: int = 0
+    current_stage_text: str = ""
+
+    spools: tuple[BambuSpool, ...] = ()
+    target_spool: int = 255
+    active_spool: int = 255
+    spool_state: str = ""
+    ams_status: Optional[int] = None
+    ams_exists: bool = False
+    ams_rfid_status: Optional[int] = None
+
+    hms_data: Optional[tuple[dict, ...]] = None
+    hms_message: str = ""
+    skipped_objects: tuple[int, ...] = ()
+
+    def evolve(self, **changes) -> "BambuState":
+        """
+        Returns a new `BambuState` with `changes` applied (or this instance if there are none).
+        """
+        return replace(self, **changes) if changes else self
+
+    def diff(self, other: "BambuState") -> dict[str, tuple[Any, Any]]:
+        """
+        Returns a `dict` of `(old, new)` value tuples keyed by field name for every field whose value
+        differs between this snapshot (old) and `other` (new).
+        """
+        if other is self: return {}
+        changes = {}
+        for f in STATE_SCHEMA:
+            old = getattr(self, f.name)
+            new = getattr(other, f.name)
+            if old is not new and old != new:
+                changes[f.name] = (old, new)
+        return changes
+
+    def toJson(self) -> dict:
+        """
+        Returns a `dict` (json document) of every field keyed by its schema `json_name`.
+        """
+        return {f.json_name: _jsonable(getattr(self, f.name)) for f in STATE_SCHEMA}
+
+    @classmethod
+    def fromJson(cls, document: dict) -> "BambuState":
+        """
+        Builds a `BambuState` from a `dict` previously produced by `toJson`.  Unknown keys are
+        ignored and missing keys fall back to their schema defaults.
+        """
+        values = {}
+        for f in STATE_SCHEMA:
+            if f.json_name not in document: continue
+            value = document[f.json_name]
+            if f.name == "spools":
+                value = tuple(BambuSpool.fromJson(spool) for spool in value)
+            elif f.name == "skipped_objects":
+                value = tuple(value)
+            elif f.name == "hms_data" and value is not None:
+                value = tuple(dict(hms) for hms in value)
+            values[f.name] = value
+        return cls(**values)
+
+    @classmethod
+    def schema(cls) -> tuple["BambuStateField", ...]:
+        """
+        Returns the declared state schema (see `STATE_SCHEMA`).
+        """
+        return STATE_SCHEMA
+
+
+class BambuStateField(NamedTuple):
+    """
+    Describes a single `BambuState` field.
+
+    * name : str - the attribute name on `BambuState` (and the matching `BambuPrinter` property)
+    * type : type - the declared type annotation
+    * default : Any - the value used before the printer reports one
+    * json_name : str - the key used by `toJson` (historically the private `BambuPrinter` attribute name)
+    """
+    name: str
+    type: Any
+    default: Any
+    json_name: str
+
+
+STATE_SCHEMA = tuple(
+    BambuStateField(f.name, f.type, f.default, f.metadata.get("json", f"_{f.name}")) for f in fields(BambuState)
+)
+
+
+def _jsonable(value):
+    if isinstance(value, BambuSpool): return value.toJson()
+    if isinstance(value, (tuple, list)): return [_jsonable(v) for v in value]
+    return value
@@ -0,0 +1,122 @@
+"""
+`bambusubscription` contains `BambuSubscription` which is used by `BambuPrinter.subscribe` to
+deliver update notifications off of the mqtt network thread.
+"""
+import threading
+import time
+import logging
+
+from typing import Optional
+
+logger = logging.getLogger("bambuprinter")
+
+
+class BambuSubscription:
+    """
+    A `BambuSubscription` delivers update notifications for a single `BambuPrinter` to a single
+    callback on its own thread.  Notifications that arrive while the callback is still running (or
+    while the subscription is waiting out its `max_frequency` interval) are collapsed into a single
+    delivery so the callback always observes the latest printer state and never falls behind.
+
+    Subscriptions are created with `BambuPrinter.subscribe` and released with
+    `BambuPrinter.unsubscribe` (or `close`).
+    """
+    def __init__(self, printer, callback, max_frequency: Optional[float] = 0):
+        """
+        Sets up all internal storage attributes for `BambuSubscription` and starts its delivery thread.
+
+        Parameters
+        ----------
+        * printer : BambuPrinter - the printer passed to `callback` on every delivery
+        * callback : callable - invoked as `callback(printer)`
+        * max_frequency : Optional[float] = 0 - maximum deliveries per second (`0` is unthrottled)
+
+        Attributes
+        ----------
+        * _notifications : `READ ONLY` Number of update notifications received.
+        * _deliveries : `READ ONLY` Number of times `callback` was invoked.
+        * _last_delivery : `PRIVATE` Monotonic timestamp (in seconds) of the last delivery.
+        """
+        self._printer = printer
+        self._callback = callback
+        self._max_frequency = float(max_frequency) if max_frequency else 0.0
+
+        self._condition = threading.Condition()
+        self._pending = False
+        self._closed = False
+        self._drain = False
+
+        self._notifications = 0
+        self._deliveries = 0
+        self._last_delivery = 0.0
+
+        self._thread = threading.Thread(target=self._deliver, name="bambuprinter-subscription", daemon=True)
+        self._thread.start()
+
+    def notify(self):
+        """
+        Flags that the printer's state has changed.  This never blocks on the callback.
+        """
+        with self._condition:
+            self._notifications += 1
+            self._pending = True
+            self._condition.notify()
+
+    def close(self, drain: Optional[bool] = False):
+        """
+        Stops delivering updates.  A delivery already in progress is allowed to complete and, with
+        `drain`, a pending update is delivered (without waiting out `max_frequency`) first.
+        """
+        with self._condition:
+            self._closed = True
+            self._drain = drain
+            self._condition.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _deliver(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed and not (self._drain and self._pending): return
+
+            if self._max_frequency > 0 and not self._closed:
+                delay = self._last_delivery + (1.0 / self._max_frequency) - time.monotonic()
+                if delay > 0:
+                    with self._condition:
+                        self._condition.wait_for(lambda: self._closed, timeout=delay)
+                        if self._closed and not self._drain: return
+
+            with self._condition:
+                self._pending = False
+
+            self._last_delivery = time.monotonic()
+            try:
+                self._callback(self._printer)
+            except Exception:
+                logger.exception("subscription callback raised an exception")
+            self._deliveries += 1
+
+    @property
+    def max_frequency(self) -> float:
+        return self._max_frequency
+    @max_frequency.setter
+    def max_frequency(self, value: float):
+        self._max_frequency = float(value) if value else 0.0
+
+    @property
+    def notifications(self) -> int:
+        return self._notifications
+
+    @property
+    def deliveries(self) -> int:
+        return self._deliveries
+
+    @property
+    def collapsed(self) -> int:
+        return max(self._notifications - self._deliveries, 0)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
@@ -0,0 +1,256 @@
+"""
+`bambusync` contains `BambuSync` which incrementally mirrors SDCard directories (timelapses,
+logs, etc) from one or more printers to local storage.
+"""
+import fnmatch
+import json
+import os
+import threading
+import time
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .bambureconnect import connectFTPS
+from .ftpsclient.ftpsclient import IoTFTPSClient
+
+logger = logging.getLogger("bambuprinter")
+
+MANIFEST = ".bambusync.json"
+PARTIAL = ".part"
+# the (size, stamp) of the remote file a `.part` file was downloaded from
+PARTIAL_SOURCE = ".part.json"
+
+
+class BambuSync:
+    """
+    `BambuSync` mirrors selected SDCard directories of any number of printers into
+    `local_root/<serial #>/<remote path>`.
+
+    Each printer is synced over a single FTPS connection that is reused for listing and for every
+    download, and at most `concurrency` printers are synced at once.  Remote files are compared
+    against a manifest (`.bambusync.json` in `local_root`) by size and modification time (`MDTM`, or
+    the day of the listing timestamp on servers without it, as listings switch from showing the time
+    to showing the year once a file is six months old) so only new or changed files are downloaded.
+    Downloads are written to a `.part` file and resumed from where they left off after an
+    interruption (unless the remote file changed since), then renamed into place once their size
+    has been verified.  With `delete_remote` enabled, verified files are removed from the SDCard to
+    free up space, a file that can't be removed is reported as `failed`.
+
+    Example
+    -------
+    ```py
+    sync = BambuSync("/srv/printers", directories=("/timelapse",), patterns=("*.mp4", "*.avi"))
+    results = sync.sync([printer1, printer2, printer3])
+    ```
+    """
+    def __init__(self,
+                 local_root: str,
+                 directories: Optional[tuple] = ("/timelapse",),
+                 patterns: Optional[tuple] = None,
+                 delete_remote: Optional[bool] = False,
+                 concurrency: Optional[int] = 4):
+        """
+        Sets up all internal storage attributes for `BambuSync`.
+
+        Parameters
+        ----------
+        * local_root : str - local directory files are mirrored into
+        * directories : Optional[tuple] = ("/timelapse",) - SDCard directories to mirror (recursively)
+        * patterns : Optional[tuple] = None - `fnmatch` filename patterns to include (everything when `None`)
+        * delete_remote : Optional[bool] = False - delete remote files once they are verified locally
+        * concurrency : Optional[int] = 4 - maximum number of printers synced at the same time
+
+        Attributes
+        ----------
+        * _manifest : `PRIVATE` dict of synced files `{serial: {remote path: {size, stamp}}}`.
+        * _stats : `READ ONLY` Totals of files downloaded, resumed, skipped, deleted, and failed along with bytes and seconds.
+        """
+        self._local_root = os.path.expanduser(local_root)
+        self._directories = tuple(directories)
+        self._patterns = tuple(patterns) if patterns else None
+        self._delete_remote = delete_remote
+        self._concurrency = max(int(concurrency), 1)
+
+        os.makedirs(self._local_root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._manifest = self._load_manifest()
+        self._stats = {"downloaded": 0, "resumed": 0, "skipped": 0, "deleted": 0, "failed": 0, "bytes": 0, "seconds": 0.0}
+
+    def sync(self, printers) -> dict:
+        """
+        Syncs every printer (at most `concurrency` at a time) and returns a `dict` of per printer
+        results keyed by serial # (see `sync_printer`).  A printer that cannot be reached is reported
+        with an `error` instead of failing the whole sync.
+        """
+        printers = list(printers)
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self._concurrency, max(len(printers), 1)), thread_name_prefix="bambuprinter-sync") as pool:
+            futures = {printer.config.serial_number: pool.submit(self.sync_printer, printer) for printer in printers}
+            for serial, future in futures.items():
+                try:
+                    results[serial] = future.result()
+                except Exception as e:
+                    logger.warning(f"unable to sync [{serial}]: [{e}]")
+                    results[serial] = {"error": str(e)}
+        return results
+
+    def sync_printer(self, printer) -> dict:
+        """
+        Syncs a single printer and returns a `dict` with the remote paths that were `downloaded`,
+        `skipped` (already up to date), `deleted`, and `failed`.
+        """
+        config = printer.config
+        serial = config.serial_number
+        result = {"downloaded": [], "skipped": [], "deleted": [], "failed": []}
+
+        ftps = connectFTPS(config)
+        mdtm = True
+        try:
+            for directory in self._directories:
+                for path, size, listed in self._walk(ftps, directory):
+                    stamp = ftps.get_modified_time(path) if mdtm else None
+                    if stamp is None:
+                        mdtm = False
+                        stamp = " ".join(listed.split()[:2])
+                    with self._lock:
+                        known = self._manifest.get(serial, {}).get(path)
+                    local = self._local_path(serial, path)
+
+                    if known and known["size"] == size and known["stamp"] == stamp and os.path.exists(local):
+                        result["skipped"].append(path)
+                        self._count("skipped")
+                    elif os.path.exists(local) and os.path.getsize(local) == size and not known:
+                        # already mirrored by an earlier run that lost its manifest
+                        self._remember(serial, path, size, stamp)
+                        result["skipped"].append(path)
+                        self._count("skipped")
+                    else:
+                        if not self._download(ftps, path, size, stamp, local):
+                            result["failed"].append(path)
+                            self._count("failed")
+                            continue
+                        self._remember(serial, path, size, stamp)
+                        result["downloaded"].append(path)
+
+                    if self._delete_remote:
+                        try:
+                            ftps.delete_file(path)
+                        except Exception as e:
+                            logger.warning(f"unable to delete [{path}] from [{serial}]: [{e}]")
+                            result["failed"].append(path)
+                            self._count("failed")
+                            continue
+                        self._forget(serial, path)
+                        result["deleted"].append(path)
+                        self._count("deleted")
+        finally:
+            self._save_manifest()
+            try:
+                ftps.disconnect()
+            except Exception:
+                pass
+
+        logger.debug(f"synced [{serial}]", extra={key: len(value) for key, value in result.items()})
+        return result
+
+    def _walk(self, ftps: IoTFTPSClient, directory: str):
+        for name, size, stamp, is_directory in ftps.list_files_detailed(directory):
+            path = directory.rstrip("/") + "/" + name
+            if is_directory:
+                yield from self._walk(ftps, path)
+            elif self._patterns is None or any(fnmatch.fnmatch(name, pattern) for pattern in self._patterns):
+                yield path, size, stamp
+
+    def _download(self, ftps: IoTFTPSClient, path: str, size: int, stamp: str, local: str) -> bool:
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        partial = local + PARTIAL
+        source = local + PARTIAL_SOURCE
+        offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+        if offset and (offset > size or _readSource(source) != {"size": size, "stamp": stamp}):
+            # the partial belongs to an earlier version of the remote file
+            offset = 0
+        if offset:
+            self._count("resumed")
+        else:
+            with open(source, "w") as f:
+                json.dump({"size": size, "stamp": stamp}, f)
+
+        started = time.monotonic()
+        try:
+            ftps.download_file(path, partial, offset)
+        except Exception as e:
+            logger.warning(f"download of [{path}] interrupted at [{os.path.getsize(partial) if os.path.exists(partial) else 0}] bytes: [{e}]")
+            return False
+        elapsed = time.monotonic() - started
+
+        received = os.path.getsize(partial)
+        if received != size:
+            logger.warning(f"downloaded [{path}] is [{received}] bytes, expected [{size}]")
+            if received > size: os.remove(partial)
+            return False
+
+        os.replace(partial, local)
+        os.remove(source)
+        with self._lock:
+            self._stats["downloaded"] += 1
+            self._stats["bytes"] += size - offset
+            self._stats["seconds"] += elapsed
+        return True
+
+    def _local_path(self, serial: str, path: str) -> str:
+        parts = [part for part in path.split("/") if part not in ("", ".", "..")]
+        return os.path.join(self._local_root, serial, *parts)
+
+    def _remember(self, serial: str, path: str, size: int, stamp: str):
+        with self._lock:
+            self._manifest.setdefault(serial, {})[path] = {"size": size, "stamp": stamp}
+
+    def _forget(self, serial: str, path: str):
+        with self._lock:
+            self._manifest.get(serial, {}).pop(path, None)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(os.path.join(self._local_root, MANIFEST), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.warning("ignoring unreadable sync manifest")
+            return {}
+
+    def _save_manifest(self):
+        file = os.path.join(self._local_root, MANIFEST)
+        with self._lock:
+            temp = f"{file}.{threading.get_ident()}.tmp"
+            with open(temp, "w") as f:
+                json.dump(self._manifest, f)
+            os.replace(temp, file)
+
+    @property
+    def local_root(self) -> str:
+        return self._local_root
+
+    @property
+    def manifest(self) -> dict:
+        with self._lock:
+            return {serial: dict(files) for serial, files in self._manifest.items()}
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+
+def _readSource(file: str) -> Optional[dict]:
+    try:
+        with open(file, "r") as f:
+            return json.load(f)
+    except Exception:
+        return None
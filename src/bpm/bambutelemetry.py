@@ -0,0 +1,310 @@
+"""
+`bambutelemetry` contains `BambuTelemetryTable`, a fixed layout shared memory table of the live
+telemetry of every printer that any number of local processes can read without a connection.
+"""
+import struct
+import threading
+import time
+import logging
+
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+from .bambustate import BambuState
+from .bambutools import PrinterState
+
+logger = logging.getLogger("bambuprinter")
+
+MAGIC = b"BPMT"
+LAYOUT_VERSION = 1
+
+# magic, layout version, row size, capacity
+HEADER = struct.Struct("<4sHHI")
+HEADER_SIZE = 64
+
+# sequence, serial #, updated, bed / tool / chamber temperature + target, fan speed, fan speed target,
+# heatbreak fan speed, fan gear, percent complete, gcode state, session state, active spool,
+# current stage, target spool, speed level, current layer, layer count, time remaining, hms count
+ROW = struct.Struct("<Q16sd6f3HI4BhBB3IH")
+ROW_SIZE = (ROW.size + 63) // 64 * 64
+SEQUENCE = struct.Struct("<Q")
+SESSION_OFFSET = struct.calcsize("<Q16sd6f3HI2B")
+
+# `gcode_state` values are stored as their index in this tuple (255 if not listed)
+GCODE_STATES = ("", "IDLE", "PREPARE", "RUNNING", "PAUSE", "FINISH", "FAILED", "SLICING", "INIT", "OFFLINE")
+UNKNOWN = 255
+
+_PRINTER_STATES = tuple(PrinterState)
+
+
+class BambuTelemetryRow(NamedTuple):
+    """
+    A consistent copy of one printer's row of a `BambuTelemetryTable`.  `sequence` increases by 2
+    with every write, so comparing it with a previously read row tells whether anything changed.
+    """
+    sequence: int
+    serial_number: str
+    updated: float
+    bed_temp: float
+    bed_temp_target: float
+    tool_temp: float
+    tool_temp_target: float
+    chamber_temp: float
+    chamber_temp_target: float
+    fan_speed: int
+    fan_speed_target: int
+    heatbreak_fan_speed: int
+    fan_gear: int
+    percent_complete: int
+    gcode_state: str
+    session_state: Optional[PrinterState]
+    active_spool: int
+    current_stage: int
+    target_spool: int
+    speed_level: int
+    current_layer: int
+    layer_count: int
+    time_remaining: int
+    hms_count: int
+
+
+class BambuTelemetryTable:
+    """
+    `BambuTelemetryTable` is a table of fixed size rows (one per printer) in a named
+    `multiprocessing.shared_memory` segment.  The process that owns the `BambuPrinter` sessions
+    creates the table and writes to it, while web workers, alerting daemons, exporters, ... open it
+    by name and read rows straight out of shared memory instead of each holding their own printer
+    connections or polling `toJson()`.
+
+    Rows are guarded seqlock style: the writer makes a row's sequence odd, updates the row, and
+    makes the sequence even again, and a reader retries whenever the sequence was odd or changed
+    while it copied the row, so readers never see a torn row and never block the writer.  A table
+    has a single writing process.
+
+    The owner either `attach`es printers (rows are then written from a subscription, off of the
+    `mqtt` thread, at most `max_frequency` times a second) or writes snapshots itself with `write` -
+    for example `worker_fleet.on_update = table.write` for a `bambuworkers.BambuWorkerFleet`.
+
+    Example
+    -------
+    ```py
+    # owner
+    table = BambuTelemetryTable("bpm-telemetry", capacity=256, create=True)
+    for printer in printers: table.attach(printer, max_frequency=4)
+
+    # any other local process
+    table = BambuTelemetryTable("bpm-telemetry")
+    hot = [row.serial_number for row in table.rows() if row.tool_temp > 250]
+    ```
+    """
+    def __init__(self, name: Optional[str] = "bpm-telemetry", capacity: Optional[int] = 256, create: Optional[bool] = False):
+        """
+        Creates (`create=True`) or opens the shared memory table `name`.
+
+        Parameters
+        ----------
+        * name : Optional[str] = "bpm-telemetry" - name of the shared memory segment
+        * capacity : Optional[int] = 256 - maximum number of printers (ignored when opening)
+        * create : Optional[bool] = False - create the table (as its writer) instead of opening it
+
+        Attributes
+        ----------
+        * _memory : `PRIVATE` the `SharedMemory` segment.
+        * _slots : `PRIVATE` row index of each printer keyed by serial # (writer), or a cache of it (readers).
+        * _subscriptions : `PRIVATE` the `BambuSubscription` of each attached printer keyed by serial #.
+        """
+        self._name = name
+        self._writer = bool(create)
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._subscriptions = {}
+
+        if create:
+            self._capacity = max(int(capacity), 1)
+            self._memory = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + self._capacity * ROW_SIZE)
+            self._buffer = self._memory.buf
+            self._buffer[:HEADER_SIZE + self._capacity * ROW_SIZE] = bytes(HEADER_SIZE + self._capacity * ROW_SIZE)
+            HEADER.pack_into(self._buffer, 0, MAGIC, LAYOUT_VERSION, ROW_SIZE, self._capacity)
+        else:
+            self._memory = _open(name)
+            self._buffer = self._memory.buf
+            magic, version, row_size, self._capacity = HEADER.unpack_from(self._buffer, 0)
+            if magic != MAGIC or version != LAYOUT_VERSION or row_size != ROW_SIZE:
+                self._memory.close()
+                raise Exception(f"shared memory [{name}] is not a compatible telemetry table")
+
+    def attach(self, printer, max_frequency: Optional[float] = 0):
+        """
+        Allocates a row for `printer` and keeps it up to date from a subscription.
+        """
+        self._require_writer()
+        serial = printer.config.serial_number
+        self.write(serial, printer.snapshot, printer.state)
+        self._subscriptions[serial] = printer.subscribe(self.update, max_frequency)
+
+    def detach(self, printer):
+        """
+        Stops updating, and frees, the row of `printer`.
+        """
+        serial = printer.config.serial_number
+        subscription = self._subscriptions.pop(serial, None)
+        if subscription: printer.unsubscribe(subscription)
+        self.remove(serial)
+
+    def update(self, printer):
+        """
+        Writes the current snapshot and session state of `printer` to its row.
+        """
+        self.write(printer.config.serial_number, printer.snapshot, printer.state)
+
+    def write(self, serial_number: str, snapshot: BambuState, state: Optional[PrinterState] = None):
+        """
+        Writes `snapshot` (and `state`, if given) to the row of `serial_number`, allocating a row
+        the first time a printer is written.
+        """
+        self._require_writer()
+        with self._lock:
+            slot = self._slots.get(serial_number)
+            if slot is None: slot = self._allocate(serial_number)
+            offset = HEADER_SIZE + slot * ROW_SIZE
+            sequence = SEQUENCE.unpack_from(self._buffer, offset)[0]
+            session = self._buffer[offset + SESSION_OFFSET] if state is None else _PRINTER_STATES.index(state)
+
+            SEQUENCE.pack_into(self._buffer, offset, sequence + 1)
+            ROW.pack_into(self._buffer, offset, sequence + 1, serial_number.encode()[:16], time.time(),
+                          snapshot.bed_temp, snapshot.bed_temp_target, snapshot.tool_temp, snapshot.tool_temp_target,
+                          snapshot.chamber_temp, snapshot.chamber_temp_target,
+                          _clamp(snapshot.fan_speed, 0xFFFF), _clamp(snapshot.fan_speed_target, 0xFFFF),
+                          _clamp(snapshot.heatbreak_fan_speed, 0xFFFF), _clamp(snapshot.fan_gear, 0xFFFFFFFF),
+                          _clamp(snapshot.percent_complete, 0xFF), _gcodeStateCode(snapshot.gcode_state), session,
+                          _clamp(snapshot.active_spool, 0xFF), max(min(int(snapshot.current_stage), 0x7FFF), -0x8000),
+                          _clamp(snapshot.target_spool, 0xFF), _clamp(snapshot.speed_level, 0xFF),
+                          _clamp(snapshot.current_layer, 0xFFFFFFFF), _clamp(snapshot.layer_count, 0xFFFFFFFF),
+                          _clamp(snapshot.time_remaining, 0xFFFFFFFF), _clamp(len(snapshot.hms_data or ()), 0xFFFF))
+            SEQUENCE.pack_into(self._buffer, offset, sequence + 2)
+
+    def remove(self, serial_number: str):
+        """
+        Frees the row of `serial_number`.
+        """
+        self._require_writer()
+        with self._lock:
+            slot = self._slots.pop(serial_number, None)
+            if slot is None: return
+            offset = HEADER_SIZE + slot * ROW_SIZE
+            sequence = SEQUENCE.unpack_from(self._buffer, offset)[0]
+            SEQUENCE.pack_into(self._buffer, offset, sequence + 1)
+            self._buffer[offset + SEQUENCE.size:offset + ROW_SIZE] = bytes(ROW_SIZE - SEQUENCE.size)
+            SEQUENCE.pack_into(self._buffer, offset, sequence + 2)
+
+    def read(self, serial_number: str) -> Optional[BambuTelemetryRow]:
+        """
+        Returns a consistent copy of the row of `serial_number`, or `None` if it has no row.
+        """
+        slot = self._slots.get(serial_number)
+        if slot is not None:
+            row = self._read_slot(slot)
+            if row is not None and row.serial_number == serial_number: return row
+        # rows are never moved while in use, so the slot is cached once found
+        for slot in range(self._capacity):
+            row = self._read_slot(slot)
+            if row is not None and row.serial_number == serial_number:
+                if not self._writer: self._slots[serial_number] = slot
+                return row
+        return None
+
+    def rows(self) -> list:
+        """
+        Returns a consistent copy of every row in use.
+        """
+        rows = []
+        for slot in range(self._capacity):
+            row = self._read_slot(slot)
+            if row is not None: rows.append(row)
+        return rows
+
+    def close(self, unlink: Optional[bool] = None):
+        """
+        Detaches from the shared memory segment.  The writer also removes the segment unless
+        `unlink` is `False`.
+        """
+        for serial, subscription in list(self._subscriptions.items()):
+            subscription.close()
+        self._subscriptions = {}
+        self._buffer = None
+        self._memory.close()
+        if unlink if unlink is not None else self._writer: self._memory.unlink()
+
+    def _read_slot(self, slot: int, spins: Optional[int] = 10000) -> Optional[BambuTelemetryRow]:
+        offset = HEADER_SIZE + slot * ROW_SIZE
+        for spin in range(spins):
+            before = SEQUENCE.unpack_from(self._buffer, offset)[0]
+            if before & 1:
+                # the writer is in the middle of this row
+                if spin & 63 == 63: time.sleep(0)
+                continue
+            values = ROW.unpack_from(self._buffer, offset)
+            if SEQUENCE.unpack_from(self._buffer, offset)[0] != before or values[0] != before: continue
+            if not values[1][0]: return None
+            return _toRow(values)
+        raise Exception(f"unable to read a consistent copy of telemetry row [{slot}]")
+
+    def _allocate(self, serial_number: str) -> int:
+        used = set(self._slots.values())
+        for slot in range(self._capacity):
+            if slot not in used:
+                self._slots[serial_number] = slot
+                return slot
+        raise Exception(f"telemetry table [{self._name}] is full ([{self._capacity}] printers)")
+
+    def _require_writer(self):
+        if not self._writer: raise Exception(f"telemetry table [{self._name}] was opened read only")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def writer(self) -> bool:
+        return self._writer
+
+    def __len__(self):
+        return len(self.rows())
+
+
+def _toRow(values: tuple) -> BambuTelemetryRow:
+    values = list(values)
+    values[1] = values[1].rstrip(b"\x00").decode()
+    values[14] = GCODE_STATES[values[14]] if values[14] < len(GCODE_STATES) else "UNKNOWN"
+    values[15] = _PRINTER_STATES[values[15]] if values[15] < len(_PRINTER_STATES) else None
+    return BambuTelemetryRow(*values)
+
+
+def _gcodeStateCode(gcode_state: str) -> int:
+    try:
+        return GCODE_STATES.index(gcode_state)
+    except ValueError:
+        return UNKNOWN
+
+
+def _clamp(value, maximum: int) -> int:
+    return max(min(int(value or 0), maximum), 0)
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    # readers must not remove the segment when they exit, which the resource tracker would do
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(memory._name, "shared_memory")
+    except Exception:
+        pass
+    return memory
@@ -2,8 +2,12 @@
 `bambutools' hosts various classes and methods used internally and externally
 by `bambu-printer-manager`.
 """
+import itertools
+
 from enum import Enum
 
+_sequence_ids = itertools.count(1)
+
 def parseStage(stage: int) -> str:
     """
     Mainly an internal method used for parsing stage data from the printer.
@@ -66,6 +70,16 @@ def parseFan(fan: int) -> str:
         elif fan == 15: return 100
     return 0
 
+def parseSubtaskName(name: str) -> str:
+    """
+    Returns the subtask name the printer reports for a 3mf file (the filename without its path
+    and `.gcode.3mf` / `.3mf` extension).
+    """
+    subtask = name[name.rindex("/") + 1::] if "/" in name else name
+    subtask = subtask[::-1].replace(".3mf"[::-1], "", 1)[::-1] if subtask.endswith(".3mf") else subtask 
+    subtask = subtask[::-1].replace(".gcode"[::-1], "", 1)[::-1] if subtask.endswith(".gcode") else subtask 
+    return subtask
+
 def parseAMSStatus(status: int) -> str:
     """
     Can be used to parse `ams_status`
@@ -110,6 +124,18 @@ def parseRFIDStatus(status):
     else:
         return "Unknown"
 
+def nextSequenceId() -> str:
+    """
+    Returns a process wide unique `sequence_id` for requests whose acknowledgement is tracked.
+    """
+    return str(next(_sequence_ids))
+
+def enumToJson(value: Enum) -> dict:
+    """
+    Mainly an internal method used for serializing enums within `toJson()` documents.
+    """
+    return {"_name_": value.name, "_value_": list(value.value) if isinstance(value.value, tuple) else value.value}
+
 class PrinterState(Enum):
     """
     This enum is used by `bambu-printer-manager` to track the underlying state 
@@ -197,4 +223,36 @@ def getModelBySerial(serial : str) -> PrinterModel:
     elif serial.startswith("039"):
         return PrinterModel.A1
     else:
-        return PrinterModel.UNKNOWN
\ No newline at end of file
+        return PrinterModel.UNKNOWN
+
+class JobStatus(Enum):
+    """
+    Used by `bambuscheduler.BambuScheduler` to track the lifecycle of a `bambujob.BambuJob`.
+
+    States
+    ------
+    * `QUEUED` - Waiting for a compatible idle printer.
+    * `DISPATCHED` - Sent to a printer, waiting for the printer to report the job has started.
+    * `RUNNING` - The printer reported the job as active.
+    * `COMPLETED` - The printer reported `FINISH` for the job.
+    * `FAILED` - The printer reported `FAILED` (or never started the job).
+    * `CANCELLED` - Removed from the queue before it was dispatched.
+    * `STAGING` - Reserved for a printer while its file is uploaded to the printer's SDCard.
+    """
+    QUEUED = 0,
+    DISPATCHED = 1,
+    RUNNING = 2,
+    COMPLETED = 3,
+    FAILED = 4,
+    CANCELLED = 5,
+    STAGING = 6
+
+class HMSSeverity(Enum):
+    """
+    The severity of an HMS code (the high 16 bits of the reported `code`), see `bambuhms.hmsSeverity`.
+    """
+    UNKNOWN = 0,
+    FATAL = 1,
+    SERIOUS = 2,
+    COMMON = 3,
+    INFO = 4
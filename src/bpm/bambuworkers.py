@@ -0,0 +1,561 @@
+"""
+`bambuworkers` contains `BambuWorkerFleet`, which runs the sessions of a large fleet of printers in
+a pool of worker processes and exposes them through a single API in the parent process.
+"""
+import itertools
+import math
+import multiprocessing
+import os
+import threading
+import time
+import logging
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from .bambucodec import decodeState, encodeDelta
+from .bambuconfig import BambuConfig
+from .bambureconnect import BambuReconnectPolicy
+from .bambustate import BambuState
+from .bambutools import PrinterState
+
+logger = logging.getLogger("bambuprinter")
+
+# `BambuConfig` constructor arguments shipped to the worker processes
+CONFIG_ARGUMENTS = ("hostname", "access_code", "serial_number", "mqtt_port", "mqtt_client_id", "mqtt_username",
+                    "watchdog_timeout", "external_chamber", "verbose", "state_file", "checkpoint_interval",
+                    "refresh_stagger", "publish_qos", "max_inflight", "publish_timeout", "connect_timeout")
+POLICY_ARGUMENTS = ("min_delay", "max_delay", "multiplier", "jitter", "max_concurrent")
+
+
+class BambuWorkerFleet:
+    """
+    `BambuWorkerFleet` shards printers across `workers` processes, each of which runs ordinary
+    `BambuPrinter` sessions, so report parsing and the callbacks consuming the reports are spread
+    over several interpreters (and CPU cores) instead of sharing one GIL.
+
+    The parent talks to each worker over a `multiprocessing` pipe:
+
+    * commands - `call` invokes any `BambuPrinter` method in the worker that owns the printer and
+      returns its result (`get` / `set` read and write attributes such as `bed_temp_target`).
+    * state - every `interval` seconds each worker sends one message holding the changes to the
+      `BambuState` snapshots (delta encoded with `bambucodec`) and session states of the printers
+      that changed since the last one, so `snapshot`, `snapshots`, and `states` are answered from
+      the parent's cache without a round trip, and a burst of reports costs at most one message
+      per interval.
+
+    Work that has to run next to a printer (subscriptions, job tracking, ...) is set up with
+    `initializer`, a picklable (module level) function called as `initializer(printer)` in the
+    worker for every printer it starts.
+
+    When a worker dies its printers are restarted in a new worker after a delay from
+    `restart_policy` (a `bambureconnect.BambuReconnectPolicy`).  A worker that dies more than
+    `max_restarts` times within `restart_window` seconds is retired and its printers are spread over
+    the remaining workers.  A printer that can't be started in its worker (an invalid config, or
+    `initializer` raising) never takes the worker down: it is reported with a `QUIT` state and its
+    error is kept in `failures` until it is added again.  `add` always places a printer on the least loaded worker and `rebalance`
+    evens out the shards after printers were removed.
+
+    Each worker rebuilds its printers' `BambuConfig`s, so a `reconnect_policy` shared by several
+    configs is shared (and its `max_concurrent` applied) per worker process.
+
+    Example
+    -------
+    ```py
+    fleet = BambuWorkerFleet(configs, workers=4, initializer=attach_job_tracker)
+    fleet.start()
+    fleet.call("01S00C123456789", "pause_printing")
+    running = [serial for serial, state in fleet.snapshots().items() if state.gcode_state == "RUNNING"]
+    ```
+    """
+    def __init__(self,
+                 configs=(),
+                 workers: Optional[int] = None,
+                 interval: Optional[float] = 0.25,
+                 initializer=None,
+                 call_timeout: Optional[float] = 30,
+                 max_restarts: Optional[int] = 5,
+                 restart_window: Optional[float] = 300,
+                 restart_policy: Optional[BambuReconnectPolicy] = None):
+        """
+        Sets up all internal storage attributes for `BambuWorkerFleet`.
+
+        Parameters
+        ----------
+        * configs : iterable = () - the `BambuConfig` of each printer
+        * workers : Optional[int] = None - number of worker processes (`os.cpu_count()` if `None`)
+        * interval : Optional[float] = 0.25 - seconds between state messages from each worker
+        * initializer : Optional[callable] = None - picklable function called with each printer in its worker
+        * call_timeout : Optional[float] = 30 - default seconds to wait for the result of a `call`
+        * max_restarts : Optional[int] = 5 - restarts of a worker within `restart_window` before it is retired
+        * restart_window : Optional[float] = 300 - seconds over which restarts are counted
+        * restart_policy : Optional[BambuReconnectPolicy] = None - delays between restarts of a worker
+
+        Attributes
+        ----------
+        * _shards : `PRIVATE` list of `_Shard` (one per worker process).
+        * _snapshots / _states : `READ ONLY` the latest `BambuState` and `PrinterState` of each printer, keyed by serial #.
+        * _failures : `READ ONLY` the error of each printer its worker was unable to start, keyed by serial #.
+        * _stats : `READ ONLY` counts of calls, state messages, restarts, retired workers, and moved printers.
+        """
+        self._workers = max(int(workers or os.cpu_count() or 1), 1)
+        self._interval = max(float(interval), 0.01)
+        self._initializer = initializer
+        self._call_timeout = call_timeout
+        self._max_restarts = max_restarts
+        self._restart_window = restart_window
+        self._restart_policy = restart_policy or BambuReconnectPolicy(min_delay=0.5, max_delay=30)
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.RLock()
+        self._request_ids = itertools.count(1)
+        self._configs = {}
+        self._placement = {}
+        self._shards = []
+        self._snapshots = {}
+        self._states = {}
+        self._failures = {}
+        self._running = False
+        self._on_update = None
+        self._stats = {"calls": 0, "state_messages": 0, "restarts": 0, "retired": 0, "moved": 0, "failed": 0}
+        for config in configs:
+            self._configs[config.serial_number] = _configArguments(config)
+
+    def start(self):
+        """
+        Starts the worker processes and the sessions of every printer.
+        """
+        with self._lock:
+            if self._running: return
+            self._running = True
+            self._shards = [_Shard(index) for index in range(min(self._workers, max(len(self._configs), 1)))]
+            for position, serial in enumerate(self._configs):
+                self._placement[serial] = self._shards[position % len(self._shards)]
+            for shard in self._shards:
+                self._spawn(shard)
+        logger.debug(f"started [{len(self._shards)}] workers for [{len(self._configs)}] printers")
+
+    def stop(self, timeout: Optional[float] = 10):
+        """
+        Quits every printer session and stops the worker processes.
+        """
+        with self._lock:
+            self._running = False
+            shards = list(self._shards)
+        for shard in shards:
+            try:
+                shard.send(("stop",))
+            except Exception:
+                pass
+        for shard in shards:
+            if shard.process is None: continue
+            shard.process.join(timeout)
+            if shard.process.is_alive(): shard.process.kill()
+            shard.fail_pending("worker stopped")
+
+    def add(self, config: BambuConfig):
+        """
+        Adds a printer and starts its session on the least loaded worker.
+        """
+        arguments = _configArguments(config)
+        serial = config.serial_number
+        with self._lock:
+            self._configs[serial] = arguments
+            self._failures.pop(serial, None)
+            if not self._running: return
+            if serial in self._placement: self._placement[serial].send(("remove", serial))
+            if len(self._shards) < self._workers and all(self._load(shard) for shard in self._live()):
+                shard = _Shard(len(self._shards))
+                self._shards.append(shard)
+                self._placement[serial] = shard
+                self._spawn(shard)
+                return
+            shard = min(self._live(), key=self._load)
+            self._placement[serial] = shard
+            shard.send(("add", arguments))
+
+    def remove(self, serial_number: str):
+        """
+        Quits the session of a printer and removes it from the fleet.
+        """
+        with self._lock:
+            self._configs.pop(serial_number, None)
+            shard = self._placement.pop(serial_number, None)
+            self._snapshots.pop(serial_number, None)
+            self._states.pop(serial_number, None)
+            self._failures.pop(serial_number, None)
+        if shard and shard.alive: shard.send(("remove", serial_number))
+
+    def rebalance(self) -> int:
+        """
+        Moves printers from the most to the least loaded workers until no worker runs more than one
+        printer above the average.  Moved printers briefly lose their session.  Returns the number
+        of printers moved.
+        """
+        moved = 0
+        with self._lock:
+            live = self._live()
+            if len(live) < 2: return 0
+            ceiling = math.ceil(len(self._placement) / len(live))
+            for serial, shard in list(self._placement.items()):
+                if self._load(shard) <= ceiling: continue
+                target = min(live, key=self._load)
+                if self._load(target) >= ceiling: break
+                shard.send(("remove", serial))
+                self._placement[serial] = target
+                target.send(("add", self._configs[serial]))
+                moved += 1
+            self._stats["moved"] += moved
+        if moved: logger.debug(f"rebalanced [{moved}] printers across [{len(live)}] workers")
+        return moved
+
+    def call(self, serial_number: str, method: str, *args, timeout: Optional[float] = None, **kwargs):
+        """
+        Invokes `method` of the printer's `BambuPrinter` (in its worker) and returns the result.
+        Exceptions raised by the method are raised again here (as `Exception`).
+        """
+        return self._request(serial_number, ("call", method, args, kwargs)).result(timeout or self._call_timeout)
+
+    def call_all(self, method: str, *args, timeout: Optional[float] = None, **kwargs) -> dict:
+        """
+        Invokes `method` on every printer concurrently and returns a `dict` of results (or the
+        raised exception) keyed by serial #.
+        """
+        with self._lock:
+            serials = list(self._placement)
+        futures = {}
+        for serial in serials:
+            try:
+                futures[serial] = self._request(serial, ("call", method, args, kwargs))
+            except Exception as e:
+                futures[serial] = _failed(e)
+        deadline = time.monotonic() + (timeout or self._call_timeout)
+        results = {}
+        for serial, future in futures.items():
+            try:
+                results[serial] = future.result(max(deadline - time.monotonic(), 0))
+            except Exception as e:
+                results[serial] = e
+        return results
+
+    def get(self, serial_number: str, name: str, timeout: Optional[float] = None):
+        """
+        Returns the value of attribute `name` of the printer's `BambuPrinter`.
+        """
+        return self._request(serial_number, ("get", name)).result(timeout or self._call_timeout)
+
+    def set(self, serial_number: str, name: str, value, timeout: Optional[float] = None):
+        """
+        Assigns `value` to attribute `name` of the printer's `BambuPrinter` (`bed_temp_target`, ...).
+        """
+        return self._request(serial_number, ("set", name, value)).result(timeout or self._call_timeout)
+
+    def snapshot(self, serial_number: str) -> Optional[BambuState]:
+        """
+        Returns the latest `BambuState` received for a printer (`None` until its worker reports it).
+        """
+        return self._snapshots.get(serial_number)
+
+    def snapshots(self) -> dict:
+        """
+        Returns the latest `BambuState` of every printer keyed by serial #.
+        """
+        with self._lock:
+            return dict(self._snapshots)
+
+    def states(self) -> dict:
+        """
+        Returns the session `PrinterState` of every printer keyed by serial #.
+        """
+        with self._lock:
+            return {serial: self._states.get(serial, PrinterState.NO_STATE) for serial in self._placement}
+
+    def _request(self, serial: str, operation: tuple) -> Future:
+        with self._lock:
+            shard = self._placement.get(serial)
+            if shard is None: raise Exception(f"printer [{serial}] is not part of this fleet")
+            if serial in self._failures: raise Exception(f"printer [{serial}] failed to start: {self._failures[serial]}")
+            if not shard.alive: raise Exception(f"the worker running printer [{serial}] is restarting")
+            request = next(self._request_ids)
+            future = Future()
+            shard.pending[request] = future
+            self._stats["calls"] += 1
+        try:
+            shard.send(("request", request, serial) + operation)
+        except Exception as e:
+            shard.pending.pop(request, None)
+            raise Exception(f"unable to reach the worker running printer [{serial}]: [{e}]")
+        return future
+
+    def _spawn(self, shard: "_Shard"):
+        parent, child = self._context.Pipe()
+        configs = [self._configs[serial] for serial, owner in self._placement.items() if owner is shard]
+        process = self._context.Process(target=_worker, args=(child, configs, self._interval, self._initializer),
+                                        name=f"bambuprinter-worker-{shard.index}", daemon=True)
+        process.start()
+        child.close()
+        shard.attach(process, parent)
+        threading.Thread(target=self._receive, args=(shard, parent), name=f"bambuprinter-worker-{shard.index}", daemon=True).start()
+
+    def _receive(self, shard: "_Shard", connection):
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == "result":
+                future = shard.pending.pop(message[1], None)
+                if future is None: continue
+                if message[2]: future.set_result(message[3])
+                else: future.set_exception(Exception(message[3]))
+            elif message[0] == "states":
+                self._apply_states(shard, message[1], message[2])
+            elif message[0] == "failed":
+                with self._lock:
+                    if self._placement.get(message[1]) is not shard: continue
+                    self._failures[message[1]] = message[2]
+                    self._states[message[1]] = PrinterState.QUIT
+                    self._stats["failed"] += 1
+                logger.warning(f"worker [{shard.index}] was unable to start printer [{message[1]}]: {message[2]}")
+
+        shard.detach(connection)
+        shard.fail_pending("worker exited")
+        if self._running and shard.process is not None:
+            shard.process.join(1)
+            logger.warning(f"worker [{shard.index}] exited with code [{shard.process.exitcode}]")
+            threading.Thread(target=self._recover, args=(shard,), name="bambuprinter-worker-restart", daemon=True).start()
+
+    def _apply_states(self, shard: "_Shard", encoded: dict, states: dict):
+        snapshots = {}
+        with self._lock:
+            self._stats["state_messages"] += 1
+            for serial, data in encoded.items():
+                if self._placement.get(serial) is not shard: continue
+                try:
+                    snapshots[serial] = self._snapshots[serial] = decodeState(data, self._snapshots.get(serial))
+                except Exception as e:
+                    logger.warning(f"ignoring undecodable state of [{serial}] from worker [{shard.index}]: [{e}]")
+            for serial, state in states.items():
+                if self._placement.get(serial) is shard: self._states[serial] = state
+        callback = self._on_update
+        if callback:
+            for serial, snapshot in snapshots.items():
+                try:
+                    callback(serial, snapshot)
+                except Exception:
+                    logger.exception("worker fleet update callback failed")
+
+    def _recover(self, shard: "_Shard"):
+        now = time.monotonic()
+        shard.restarts = [restart for restart in shard.restarts if now - restart < self._restart_window] + [now]
+        with self._lock:
+            for serial, owner in self._placement.items():
+                if owner is shard: self._states[serial] = PrinterState.NO_STATE
+
+        if len(shard.restarts) > self._max_restarts and len(self._live()) > 1:
+            with self._lock:
+                shard.retired = True
+                self._stats["retired"] += 1
+                orphans = [serial for serial, owner in self._placement.items() if owner is shard]
+                for serial in orphans:
+                    target = min(self._live(), key=self._load)
+                    self._placement[serial] = target
+                    target.send(("add", self._configs[serial]))
+                self._stats["moved"] += len(orphans)
+            logger.warning(f"retired worker [{shard.index}] after [{len(shard.restarts)}] restarts, moved [{len(orphans)}] printers")
+            return
+
+        time.sleep(self._restart_policy.delay(len(shard.restarts) - 1))
+        with self._lock:
+            if not self._running: return
+            self._stats["restarts"] += 1
+            self._spawn(shard)
+        logger.debug(f"restarted worker [{shard.index}]")
+
+    def _live(self) -> list:
+        return [shard for shard in self._shards if not shard.retired]
+
+    def _load(self, shard: "_Shard") -> int:
+        return sum(1 for owner in self._placement.values() if owner is shard)
+
+    @property
+    def on_update(self):
+        """
+        Callback invoked (on a receiving thread of the parent) as `on_update(serial_number, snapshot)`
+        for every changed snapshot a worker sends.
+        """
+        return self._on_update
+    @on_update.setter
+    def on_update(self, value):
+        self._on_update = value
+
+    @property
+    def failures(self) -> dict:
+        """
+        The error of each printer its worker was unable to start, keyed by serial #.
+        """
+        with self._lock:
+            return dict(self._failures)
+
+    @property
+    def placement(self) -> dict:
+        """
+        The index of the worker running each printer, keyed by serial #.
+        """
+        with self._lock:
+            return {serial: shard.index for serial, shard in self._placement.items()}
+
+    @property
+    def workers(self) -> list:
+        """
+        The process id, liveness, and load of each worker.
+        """
+        with self._lock:
+            return [{"index": shard.index, "pid": shard.process.pid if shard.process else None, "alive": shard.alive,
+                     "retired": shard.retired, "printers": self._load(shard)} for shard in self._shards]
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    @property
+    def serials(self) -> list:
+        with self._lock:
+            return list(self._configs)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._configs)
+
+
+class _Shard:
+    __slots__ = ("index", "process", "connection", "send_lock", "pending", "restarts", "retired")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.connection = None
+        self.send_lock = threading.Lock()
+        self.pending = {}
+        self.restarts = []
+        self.retired = False
+
+    def attach(self, process, connection):
+        self.process = process
+        self.connection = connection
+
+    def detach(self, connection):
+        with self.send_lock:
+            if self.connection is connection: self.connection = None
+        connection.close()
+
+    def send(self, message: tuple):
+        with self.send_lock:
+            # messages for a worker that is being restarted are dropped, it starts with its current shard
+            if self.connection is None: return
+            self.connection.send(message)
+
+    def fail_pending(self, reason: str):
+        pending, self.pending = self.pending, {}
+        for future in pending.values():
+            if not future.done(): future.set_exception(Exception(reason))
+
+    @property
+    def alive(self) -> bool:
+        return self.connection is not None and not self.retired
+
+
+def _configArguments(config: BambuConfig) -> dict:
+    arguments = {name: getattr(config, name) for name in CONFIG_ARGUMENTS}
+    arguments["reconnect_policy"] = {name: getattr(config.reconnect_policy, name) for name in POLICY_ARGUMENTS}
+    return arguments
+
+
+def _failed(exception: Exception) -> Future:
+    future = Future()
+    future.set_exception(exception)
+    return future
+
+
+def _worker(connection, configs: list, interval: float, initializer):
+    # runs in the worker process
+    from .bambuprinter import BambuPrinter
+
+    printers = {}
+    policies = {}
+    sent = {}
+    send_lock = threading.Lock()
+    calls = ThreadPoolExecutor(max_workers=16, thread_name_prefix="bambuprinter-worker-call")
+
+    def send(message: tuple):
+        with send_lock:
+            connection.send(message)
+
+    def start(arguments: dict):
+        # a printer that can't be started is reported instead of taking down the worker (and, once
+        # the worker is retired, every worker its printers are moved to)
+        try:
+            arguments = dict(arguments)
+            policy = arguments.pop("reconnect_policy")
+            key = tuple(sorted(policy.items()))
+            if key not in policies: policies[key] = BambuReconnectPolicy(**policy)
+            printer = BambuPrinter(BambuConfig(reconnect_policy=policies[key], **arguments))
+            if initializer: initializer(printer)
+            printer.start_session(wait=False)
+            printers[printer.config.serial_number] = printer
+        except Exception as e:
+            logger.exception(f"unable to start printer [{arguments.get('serial_number')}]")
+            send(("failed", arguments.get("serial_number"), f"{type(e).__name__}: {e}"))
+
+    def stop(serial: str):
+        printer = printers.pop(serial, None)
+        sent.pop(serial, None)
+        if printer: calls.submit(printer.quit)
+
+    def execute(request: int, serial: str, operation: tuple):
+        try:
+            printer = printers[serial]
+            if operation[0] == "call":
+                _, method, args, kwargs = operation
+                result = getattr(printer, method)(*args, **kwargs)
+            elif operation[0] == "get":
+                result = getattr(printer, operation[1])
+            else:
+                setattr(printer, operation[1], operation[2])
+                result = None
+            send(("result", request, True, result))
+        except Exception as e:
+            send(("result", request, False, f"[{serial}] {type(e).__name__}: {e}"))
+
+    for arguments in configs:
+        start(arguments)
+
+    next_report = time.monotonic()
+    while True:
+        try:
+            ready = connection.poll(max(next_report - time.monotonic(), 0))
+            if ready:
+                message = connection.recv()
+                if message[0] == "request": calls.submit(execute, message[1], message[2], message[3:])
+                elif message[0] == "add": start(message[1])
+                elif message[0] == "remove": stop(message[1])
+                elif message[0] == "stop": break
+
+            if time.monotonic() >= next_report:
+                next_report = time.monotonic() + interval
+                snapshots = {}
+                states = {}
+                for serial, printer in list(printers.items()):
+                    # every change swaps the snapshot reference, so identity tells what changed
+                    snapshot = printer.snapshot
+                    previous = sent.get(serial)
+                    if previous is None or previous[0] is not snapshot: snapshots[serial] = encodeDelta(previous and previous[0], snapshot)
+                    if previous is None or previous[1] != printer.state: states[serial] = printer.state
+                    sent[serial] = (snapshot, printer.state)
+                if snapshots or states: send(("states", snapshots, states))
+        except (EOFError, OSError, BrokenPipeError):
+            break
+
+    for serial in list(printers):
+        stop(serial)
+    calls.shutdown(wait=True)
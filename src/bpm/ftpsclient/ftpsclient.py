@@ -34,6 +34,9 @@ from contextlib import redirect_stdout
 import io
 import re
 
+# unix style LIST row: permissions, links, owner, group, size, month day time|year, name
+LIST_ENTRY = re.compile(r"^([\-dl])\S*\s+\d+\s+\S+\s+\S+\s+(\d+)\s+(\w{3}\s+\d{1,2}\s+(?:\d{1,2}:\d{2}|\d{4}))\s(.*)$")
+
 class ImplicitTLS(ftplib.FTP_TLS):
     """ftplib.FTP_TLS sub-class to support implicit SSL FTPS"""
 
@@ -120,10 +123,10 @@ class IoTFTPSClient:
         """disconnect the current session from the ftps server"""
         self.ftps_session.close()
 
-    def download_file(self, source: str, dest: str):
-        """download a file to a path on the local filesystem"""
-        with open(dest, "wb") as file:
-            self.ftps_session.retrbinary(f"RETR {source}", file.write)
+    def download_file(self, source: str, dest: str, offset: int = 0):
+        """download a file to a path on the local filesystem (appending from `offset` when resuming)"""
+        with open(dest, "ab" if offset else "wb") as file:
+            self.ftps_session.retrbinary(f"RETR {source}", file.write, rest=offset or None)
 
     def upload_file(self, source: str, dest: str, callback=None):
         """upload a file to a path inside the FTPS server"""
@@ -167,6 +170,21 @@ class IoTFTPSClient:
             # self.ftps_session.storbinary(
             #    f"STOR {dest}", file, blocksize=block_size, callback=callback)
 
+    def get_file_size(self, path: str) -> Optional[int]:
+        """return the size of a file inside the FTPS server (None if it does not exist)"""
+        try:
+            self.ftps_session.voidcmd('TYPE I')
+            return self.ftps_session.size(path)
+        except ftplib.error_perm:
+            return None
+
+    def get_modified_time(self, path: str) -> Optional[str]:
+        """return the MDTM timestamp (YYYYMMDDHHMMSS) of a file inside the FTPS server (None if not supported)"""
+        try:
+            return self.ftps_session.voidcmd(f"MDTM {path}")[4:].strip()
+        except ftplib.error_perm:
+            return None
+
     def delete_file(self, path: str):
         """delete a file from under a path inside the FTPS server"""
         self.ftps_session.delete(path)
@@ -184,6 +202,19 @@ class IoTFTPSClient:
         """list files under a path inside the FTPS server"""
         return self.ftps_session.dir(path, print)
 
+    def list_files_detailed(self, path: str) -> list[tuple[str, int, str, bool]]:
+        """list (name, size, timestamp, is_directory) of the entries under a path inside the FTPS server"""
+        rows = []
+        self.ftps_session.retrlines(f"LIST {path}", rows.append)
+        entries = []
+        for row in rows:
+            match = LIST_ENTRY.match(row)
+            if not match: continue
+            kind, size, stamp, name = match.groups()
+            if name in (".", ".."): continue
+            entries.append((name, int(size), " ".join(stamp.split()), kind == "d"))
+        return entries
+
     def list_files_ex(self, path: str) -> Union[list[str], None]:
         """list files under a path inside the FTPS server"""
         try: